@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""
+意大利语学习内容构建工具
+
+把声明式批次（italiano_content/sources）应用到 assets/data 下的资源文件：
+
+    python -m italiano_content build
+"""
+
+from .assets import ASSETS, DATA_DIR
+from .build import build
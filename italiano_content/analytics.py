@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+语料覆盖与难度分析
+
+把所有语境（阅读文章、对话消息、词汇例句、常用语及其例句）逐词对应到
+词汇（见 lemmas.py，含屈折形式），得到词汇 × 语境的词项-文档矩阵，
+以坐标形式（行号数组、列号数组）保存在 NumPy 数组中，统计都是对整个
+矩阵的向量运算：
+  覆盖率      各等级词汇中至少在一个语境里出现过的比例，按语境类型分别统计
+  词汇密度    各等级语境中能对应到词汇表的词占全部词的比例
+  未使用词汇  没有出现在任何语境中的词汇（词汇自己的例句不算）
+  超纲语境    用到了高于自身等级词汇的语境；一个形式对应多个词汇（重复词条、
+              同形异义）时按其中最低的等级算
+
+语境的等级：文章、对话、常用语取自身的 level，例句取所属词汇的 level。
+需要安装 numpy（pip install numpy）。
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .assets import ASSETS, DATA_DIR, LEVELS
+from .dedup import level_rank
+from .inflection import inflection_forms
+from .lemmas import LemmaTable, word_tokens
+from .links import example_text, message_tokens
+from .manifest import CACHE_DIR
+
+KINDS = ("passages", "conversations", "examples", "phrases")
+KIND_NAMES = {"passages": "阅读文章", "conversations": "对话消息", "examples": "词汇例句", "phrases": "常用语"}
+
+
+def phrase_texts(phrase):
+    """常用语本身和例句的意大利语部分"""
+    yield phrase.get('italian')
+    for example in phrase.get('examples') or ():
+        yield example_text(example)
+
+
+def iter_contexts(words, passages, conversations, phrases):
+    """生成 (类型, 语境ID, 等级, 词列表, 所属词汇ID)"""
+    for passage in passages:
+        yield "passages", passage['id'], passage.get('level'), word_tokens(passage.get('content')), None
+    for conversation in conversations:
+        for m, message in enumerate(conversation.get('messages') or ()):
+            yield ("conversations", f"{conversation['id']}#{m}", conversation.get('level'),
+                   message_tokens(message), None)
+    for word in words:
+        for k, example in enumerate(word.get('examples') or ()):
+            yield "examples", f"{word['id']}#{k}", word.get('level'), word_tokens(example_text(example)), word['id']
+    for phrase in phrases:
+        tokens = []
+        for text in phrase_texts(phrase):
+            tokens.extend(word_tokens(text))
+        yield "phrases", phrase['id'], phrase.get('level'), tokens, None
+
+
+class TermMatrix:
+    """词汇 × 语境的出现矩阵（坐标形式）及每个语境的词数
+
+    ranks 与 rows、cols 一一对应，是该词在该语境中出现的形式的等级
+    """
+
+    def __init__(self, words, rows, cols, ranks, contexts, tokens, matched):
+        self.words = words
+        self.contexts = contexts
+        self.rows = np.asarray(rows, dtype=np.int32)
+        self.cols = np.asarray(cols, dtype=np.int32)
+        self.ranks = np.asarray(ranks, dtype=np.int8)
+        self.tokens = np.asarray(tokens, dtype=np.int32)
+        self.matched = np.asarray(matched, dtype=np.int32)
+        self.word_level = np.array([level_rank(word['level']) for word in words], dtype=np.int8)
+        self.context_level = np.array([level_rank(level) for _, _, level in contexts], dtype=np.int8)
+        self.context_kind = np.array([KINDS.index(kind) for kind, _, _ in contexts], dtype=np.int8)
+
+    @classmethod
+    def build(cls, words, passages, conversations, phrases, table=None, cache_dir=CACHE_DIR):
+        if np is None:
+            raise ValueError("语料分析需要安装 numpy: pip install numpy")
+        table = table or LemmaTable.from_words(words, inflection_forms(words, cache_dir))
+        position = {word['id']: i for i, word in enumerate(words)}
+        word_ranks = {word['id']: level_rank(word['level']) for word in words}
+        rows, cols, ranks, contexts, tokens, matched = [], [], [], [], [], []
+        for kind, context_id, level, context_tokens, owner in iter_contexts(words, passages, conversations, phrases):
+            col = len(contexts)
+            contexts.append((kind, context_id, level))
+            found = {}
+            covered = set()
+            for start, end, ids in table.match(context_tokens):
+                covered.update(range(start, end))
+                rank = min(word_ranks[word_id] for word_id in ids)
+                for word_id in ids:
+                    found[word_id] = min(found.get(word_id, rank), rank)
+            found.pop(owner, None)
+            for word_id, rank in found.items():
+                rows.append(position[word_id])
+                cols.append(col)
+                ranks.append(rank)
+            tokens.append(len(context_tokens))
+            matched.append(len(covered))
+        return cls(words, rows, cols, ranks, contexts, tokens, matched)
+
+    def usage(self):
+        """每个词汇出现在多少个语境中"""
+        return np.bincount(self.rows, minlength=len(self.words))
+
+    def coverage(self):
+        """{类型或 all: [各等级被用到的词汇比例]}"""
+        levels = len(LEVELS) + 1
+        totals = np.bincount(self.word_level, minlength=levels)
+        result = {}
+        for kind in ("all",) + KINDS:
+            rows = self.rows if kind == "all" else self.rows[self.context_kind[self.cols] == KINDS.index(kind)]
+            used = np.unique(rows)
+            counts = np.bincount(self.word_level[used], minlength=levels)
+            result[kind] = np.divide(counts, totals, out=np.zeros(levels), where=totals > 0)[:len(LEVELS)]
+        return result
+
+    def density(self):
+        """[(等级, 语境数, 对应到词汇表的词占比)]，只列出有语境的等级"""
+        levels = len(LEVELS) + 1
+        contexts = np.bincount(self.context_level, minlength=levels)
+        tokens = np.bincount(self.context_level, weights=self.tokens, minlength=levels)
+        matched = np.bincount(self.context_level, weights=self.matched, minlength=levels)
+        return [(LEVELS[rank], int(contexts[rank]), matched[rank] / tokens[rank])
+                for rank in range(len(LEVELS)) if tokens[rank]]
+
+    def unused(self):
+        """没有出现在任何语境中的词汇ID"""
+        return [self.words[i]['id'] for i in np.flatnonzero(self.usage() == 0)]
+
+    def above_level(self):
+        """[(类型, 语境ID, 等级, [超纲词汇ID])]，按超纲词数从多到少"""
+        mask = self.ranks > self.context_level[self.cols]
+        rows = self.rows[mask]
+        cols = self.cols[mask]
+        order = np.lexsort((rows, cols))
+        rows, cols = rows[order], cols[order]
+        # 排序后每段相同列号即一个语境
+        starts = np.flatnonzero(np.r_[True, cols[1:] != cols[:-1]])
+        ends = np.append(starts[1:], len(cols))
+        found = []
+        for start, end in zip(starts, ends):
+            kind, context_id, level = self.contexts[cols[start]]
+            found.append((kind, context_id, level, [self.words[i]['id'] for i in rows[start:end]]))
+        found.sort(key=lambda item: -len(item[3]))
+        return found
+
+
+def analyze(data_dir=DATA_DIR, cache_dir=CACHE_DIR):
+    """读取资源文件并建立矩阵"""
+    docs = {name: ASSETS[name].records(ASSETS[name].load(data_dir))
+            for name in ("words", "passages", "conversations", "phrases")}
+    return TermMatrix.build(docs['words'], docs['passages'], docs['conversations'], docs['phrases'],
+                            cache_dir=cache_dir)
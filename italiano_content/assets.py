@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+五个内容资源文件的注册表与读写
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "assets" / "data"
+# 应用打包的资源目录（pubspec.yaml 中登记），由 build --release 生成，不提交
+BUNDLE_DIR = ROOT / "assets" / "bundle"
+BUNDLE_PREFIX = "assets/bundle/"
+# 派生阶段的输出（索引、内容库等），生成的文件不提交；打包的部分由 build --release 输出到 BUNDLE_DIR
+DERIVED_DIR = ROOT / "build" / "content"
+
+LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+
+# create_word_data 的字段顺序，新建词汇记录按此顺序输出
+WORD_FIELDS = (
+    "id", "italian", "chinese", "english", "pronunciation", "category",
+    "level", "createdAt", "examples", "audioUrl", "imageUrl",
+)
+
+
+class Asset:
+    """一个资源文件：记录列表可以是顶层数组，也可以挂在某个键下"""
+
+    def __init__(self, name, filename, records_key=None, fields=None,
+                 count_key=None, updated_key=None):
+        self.name = name
+        self.filename = filename
+        self.records_key = records_key
+        self.fields = fields
+        self.count_key = count_key
+        self.updated_key = updated_key
+
+    @property
+    def has_summary(self):
+        """文档中是否有随记录变化的汇总字段"""
+        return bool(self.count_key or self.updated_key)
+
+    def path(self, data_dir=DATA_DIR):
+        return Path(data_dir) / self.filename
+
+    def load(self, data_dir=DATA_DIR):
+        """读取整个文档"""
+        with open(self.path(data_dir), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def records(self, doc):
+        """取出文档中的记录列表（原地可修改）"""
+        if self.records_key is None:
+            return doc
+        return doc[self.records_key]
+
+    def touch(self, doc, moment=None):
+        """记录列表变化后同步文档里的汇总字段，moment 为更新时间（默认当前时间）"""
+        if self.count_key:
+            doc[self.count_key] = len(self.records(doc))
+        if self.updated_key:
+            doc[self.updated_key] = (moment or datetime.now()).isoformat()
+
+    def read_text(self, data_dir=DATA_DIR):
+        with open(self.path(data_dir), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def write_text(self, text, data_dir=DATA_DIR):
+        with open(self.path(data_dir), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+
+ASSETS = {
+    asset.name: asset for asset in [
+        Asset("words", "sample_words.json", fields=WORD_FIELDS),
+        Asset("passages", "reading_passages.json"),
+        Asset("conversations", "daily_conversations.json", records_key="conversations"),
+        Asset("phrases", "italian_phrases.json", records_key="phrases",
+              count_key="total_count", updated_key="updated_at"),
+        Asset("grammar", "sample_grammar.json"),
+    ]
+}
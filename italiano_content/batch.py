@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+声明式批次：把 sources 模块里的元组/字典展开为完整记录
+
+一个批次模块可以定义：
+  ASSET       目标资源名（words / passages / conversations / phrases / grammar）
+  COLUMNS     元组行对应的字段名；行本身是字典时省略
+  ROWS        记录行列表；或者用 GROUPS = [(组名, 固定字段, 行列表), ...]
+  DEFAULTS    每条记录的默认字段，字符串中的 {id} 会替换为记录ID
+  FIRST_ID    行里没有ID时，从该数字开始顺序编号；省略时取 ID 台账中
+              为该批次预留的区间起点（见 italiano_content.ids）
+  CREATED_AT  新记录的固定 createdAt；省略时使用构建的源时间（见
+              build.source_date），没有源时间时使用当前时间
+"""
+
+from datetime import datetime
+
+
+class Batch:
+    """一个内容批次"""
+
+    def __init__(self, name, asset, groups, columns=None, defaults=None,
+                 first_id=None, created_at=None):
+        self.name = name
+        self.asset = asset
+        self.groups = groups
+        self.columns = columns
+        self.defaults = defaults or {}
+        self.first_id = first_id
+        self.created_at = created_at
+        self.id_format = str
+        # 确定性构建的源时间（datetime），由 build 设置
+        self.source_date = None
+
+    @classmethod
+    def from_module(cls, name, module):
+        """从 sources 下的模块构造批次"""
+        groups = getattr(module, 'GROUPS', None)
+        if groups is None:
+            groups = [(name, {}, module.ROWS)]
+        return cls(
+            name=name,
+            asset=module.ASSET,
+            groups=groups,
+            columns=getattr(module, 'COLUMNS', None),
+            defaults=getattr(module, 'DEFAULTS', None),
+            first_id=getattr(module, 'FIRST_ID', None),
+            created_at=getattr(module, 'CREATED_AT', None),
+        )
+
+    def __len__(self):
+        return sum(len(rows) for _, _, rows in self.groups)
+
+    def records(self, exclude=()):
+        """按顺序生成记录（不含 createdAt，由构建步骤在新增时补上），跳过 exclude 中的ID"""
+        next_id = self.first_id
+        for _, fixed, rows in self.groups:
+            for row in rows:
+                if isinstance(row, dict):
+                    record = dict(row)
+                else:
+                    record = dict(zip(self.columns, row))
+                record.update(fixed)
+                if 'id' not in record:
+                    if next_id is None:
+                        raise ValueError(f"批次 {self.name} 的记录缺少ID且未设置 FIRST_ID")
+                    record['id'] = self.id_format(next_id)
+                    next_id += 1
+                if record['id'] in exclude:
+                    continue
+                for key, value in self.defaults.items():
+                    if isinstance(value, str):
+                        value = value.replace('{id}', record['id'])
+                    record.setdefault(key, value)
+                yield record
+
+    def new_created_at(self):
+        """新记录的创建时间"""
+        if self.created_at is not None:
+            return self.created_at
+        return created_at_text(self.source_date)
+
+
+def created_at_text(moment=None):
+    """createdAt 的文本：给定源时间时精确到秒，否则为当前时间"""
+    if moment is not None:
+        return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    return datetime.now().isoformat() + "Z"
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+内容构建：一次性把所有批次幂等地应用到资源文件
+
+每个资源文件最多读一次、写一次；批次中已存在的记录（按ID）只在内容
+变化时更新并保留原 createdAt，重复运行不会产生重复记录。
+
+构建是增量的：构建清单记录了每条批次记录的源哈希和资源文件中每条
+记录的位置。可以由记录内容算出的字段（文章的词数和阅读时间，见
+metrics.py；缺失的词汇注音，见 phonetics.py；结构化例句，见
+examples.py）在应用批次时计算，批次中不必手填，这些代码变化也算批次
+变化。批次没有变化的资源直接跳过（不读文件）；有变化时只解析并重新
+序列化变化的记录，拼接回原文本。资源文件被外部修改过、或者文档带有汇总字段时退回完整构建。
+写入前按 validate.py 中的结构校验新增和变化的记录，有错误时抛出
+ValueError，不写文件。资源文件处理完后运行派生输出阶段（见 stages.py）。
+
+确定性构建（build --deterministic，或设置了 SOURCE_DATE_EPOCH 环境变量）：
+新记录的 createdAt 和汇总字段 updated_at 取源时间，而不是当前时间。源时间
+为 SOURCE_DATE_EPOCH，未设置时取 sources 目录最后一次提交的时间。其余
+输出本来就只取决于输入：记录按资源文件原有顺序、新记录按 SOURCES 和
+批次内的顺序追加，词汇字段按规范顺序排列，派生输出不依赖集合的迭代
+顺序。python -m italiano_content repro 可以验证同样的输入两次生成的
+文件逐字节一致。
+"""
+
+import json
+import os
+import subprocess
+import time
+from datetime import datetime, timezone
+
+from .assets import ASSETS, DATA_DIR, DERIVED_DIR, ROOT
+from .categories import category_fields
+from .dedup import load_aliases
+from .examples import example_fields, phrase_example_fields
+from .ids import Ledger
+from .manifest import CACHE_DIR, Manifest, code_version, content_hash
+from .metrics import reading_fields
+from .phonetics import pronunciation_fields
+from .render import INDENT, record_depth, render_document, render_value
+from .sources import load_batches
+from .stages import map_jobs, run_stages
+from .validate import format_errors, shape_errors, validate_document, validate_records
+
+# 资源名 → 由记录内容计算字段的函数（按顺序应用）
+DERIVED_FIELDS = {
+    'words': (category_fields, pronunciation_fields, example_fields),
+    'phrases': (phrase_example_fields,),
+    'passages': (reading_fields,),
+}
+
+
+SOURCES_DIR = ROOT / "italiano_content" / "sources"
+
+
+def source_date(deterministic=False):
+    """确定性构建使用的源时间（UTC，不带时区），非确定性构建返回 None"""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch is None and deterministic:
+        try:
+            epoch = subprocess.run(
+                ['git', 'log', '-1', '--format=%ct', '--', str(SOURCES_DIR)],
+                cwd=ROOT, capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            epoch = ''
+        if not epoch:
+            raise ValueError("无法从 git 取得 sources 的提交时间，请设置 SOURCE_DATE_EPOCH")
+    if epoch is None:
+        return None
+    try:
+        return datetime.fromtimestamp(int(epoch), timezone.utc).replace(tzinfo=None)
+    except ValueError:
+        raise ValueError(f"SOURCE_DATE_EPOCH 不是有效的时间戳: {epoch!r}")
+
+
+def order_fields(record, fields):
+    """按资源的规范字段顺序排列记录，未知字段保持原顺序放在最后"""
+    if not fields:
+        return record
+    ordered = {key: record[key] for key in fields if key in record}
+    ordered.update((key, value) for key, value in record.items() if key not in ordered)
+    return ordered
+
+
+def merge_record(existing, record):
+    """把批次记录合并到已有记录上（保留原 createdAt），无变化时返回 None"""
+    merged = dict(existing)
+    merged.update((key, value) for key, value in record.items() if key != 'createdAt')
+    return None if merged == existing else merged
+
+
+def new_record(batch, record, fields):
+    record['createdAt'] = batch.new_created_at()
+    return order_fields(record, fields)
+
+
+def batch_records(asset, batch, exclude=()):
+    """批次记录，补上计算字段"""
+    for record in batch.records(exclude):
+        for derive in DERIVED_FIELDS.get(asset.name, ()):
+            record.update(derive(record))
+        yield record
+
+
+def apply_batch(asset, batch, records, index, exclude=()):
+    """把一个批次应用到记录列表，返回 (新增数, 更新数)"""
+    added = updated = 0
+    for record in batch_records(asset, batch, exclude):
+        position = index.get(record['id'])
+        if position is None:
+            index[record['id']] = len(records)
+            records.append(new_record(batch, record, asset.fields))
+            added += 1
+            continue
+        merged = merge_record(records[position], record)
+        if merged is not None:
+            records[position] = merged
+            updated += 1
+    return added, updated
+
+
+def batch_hashes(batch, exclude=()):
+    """批次记录的哈希，包含计算字段代码的版本：规则变化时所有记录重新应用"""
+    derive = DERIVED_FIELDS.get(batch.asset, ())
+    version = code_version(*derive) if derive else None
+    return {record['id']: content_hash([version, record]) for record in batch.records(exclude)}
+
+
+def check_overlap(hashes):
+    """同一资源的两个批次不能产生相同ID，否则后一个会覆盖前一个"""
+    owners = {}
+    for batch_name, ids in hashes.items():
+        for record_id in ids:
+            if record_id in owners:
+                raise ValueError(f"ID {record_id} 同时出现在批次 {owners[record_id]} 和 {batch_name} 中")
+            owners[record_id] = batch_name
+
+
+def build_full(asset, batches, data_dir, stats, dry_run, exclude=(), moment=None):
+    """完整构建：解析整个文档、应用批次、整体序列化"""
+    original = asset.read_text(data_dir)
+    doc = json.loads(original)
+    errors = shape_errors(asset, doc)
+    if errors:
+        raise ValueError(format_errors(asset.filename, errors))
+    records = asset.records(doc)
+    index = {record['id']: i for i, record in enumerate(records)}
+    for batch in batches:
+        added, updated = apply_batch(asset, batch, records, index, exclude)
+        stats['batches'][batch.name] = (len(batch), added, updated)
+        stats['added'] += added
+        stats['updated'] += updated
+    if stats['added'] or stats['updated']:
+        asset.touch(doc, moment)
+    errors = validate_document(asset, doc)
+    if errors:
+        raise ValueError(format_errors(asset.filename, errors))
+    text, spans = render_document(asset, doc)
+    stats['total'] = len(records)
+    stats['emitted'] = len(records)
+    stats['written'] = text != original and not dry_run
+    if stats['written']:
+        asset.write_text(text, data_dir)
+    return text, [record['id'] for record in records], spans
+
+
+def build_incremental(asset, batches, entry, changed, data_dir, stats, dry_run, exclude=()):
+    """增量构建：只解析、合并并重新序列化变化的记录"""
+    text = asset.read_text(data_dir)
+    positions = entry['records']
+    modified = {}
+    appended = []
+    for batch in batches:
+        added = updated = 0
+        for record in batch_records(asset, batch, exclude):
+            record_id = record['id']
+            if record_id not in changed.get(batch.name, ()):
+                continue
+            if record_id in modified:
+                existing = modified[record_id]
+            elif record_id in positions:
+                _, start, end = positions[record_id]
+                existing = json.loads(text[start:end])
+            else:
+                modified[record_id] = new_record(batch, record, asset.fields)
+                appended.append(record_id)
+                added += 1
+                continue
+            merged = merge_record(existing, record)
+            if merged is not None:
+                modified[record_id] = merged
+                updated += 1
+        stats['batches'][batch.name] = (len(batch), added, updated)
+        stats['added'] += added
+        stats['updated'] += updated
+
+    # 按位置从前到后替换变化的记录，新记录接在最后一条记录之后
+    depth = record_depth(asset)
+    ids = list(positions)
+    order = {record_id: i for i, record_id in enumerate(ids + appended)}
+    errors = validate_records(asset, list(modified.values()), [order[record_id] for record_id in modified])
+    if errors:
+        raise ValueError(format_errors(asset.filename, errors))
+    tail = positions[ids[-1]][2]
+    edits = sorted(
+        (positions[record_id][1], positions[record_id][2], record_id)
+        for record_id in modified if record_id in positions
+    )
+    pad = ' ' * (INDENT * depth)
+    insert = ''.join(',\n' + pad + render_value(modified[record_id], depth) for record_id in appended)
+
+    parts = []
+    spans = []
+    cursor = shift = 0
+    edit_iter = iter(edits)
+    edit = next(edit_iter, None)
+    for record_id in ids:
+        _, start, end = positions[record_id]
+        if edit and edit[2] == record_id:
+            rendered = render_value(modified[record_id], depth)
+            parts.append(text[cursor:start])
+            parts.append(rendered)
+            cursor = end
+            spans.append((start + shift, start + shift + len(rendered)))
+            shift += len(rendered) - (end - start)
+            edit = next(edit_iter, None)
+        else:
+            spans.append((start + shift, end + shift))
+    parts.append(text[cursor:tail])
+    offset = tail + shift
+    for record_id in appended:
+        rendered = render_value(modified[record_id], depth)
+        offset += 2 + len(pad)
+        spans.append((offset, offset + len(rendered)))
+        offset += len(rendered)
+    parts.append(insert)
+    parts.append(text[tail:])
+
+    stats['total'] = len(ids) + len(appended)
+    stats['emitted'] = len(modified)
+    stats['written'] = bool(modified) and not dry_run
+    if stats['written']:
+        text = ''.join(parts)
+        asset.write_text(text, data_dir)
+    return text, ids + appended, spans
+
+
+def build_asset(name, batches, entry, changed, data_dir, dry_run=False, exclude=(), moment=None):
+    """构建一个资源文件，返回 (统计, (文本, ID列表, 记录位置) 或 None)
+
+    各资源互不依赖，可以在子进程中运行；清单只在主进程中更新。
+    """
+    started = time.perf_counter()
+    asset = ASSETS[name]
+    stats = {'batches': {}, 'added': 0, 'updated': 0, 'mode': 'full'}
+    result = None
+    if entry and not any(changed.values()):
+        stats['mode'] = 'skip'
+        stats['batches'] = {batch.name: (len(batch), 0, 0) for batch in batches}
+        stats['total'] = len(entry['records'])
+        stats['emitted'] = 0
+        stats['written'] = False
+    elif entry and entry['records'] and not asset.has_summary:
+        stats['mode'] = 'incremental'
+        result = build_incremental(asset, batches, entry, changed, data_dir, stats, dry_run, exclude)
+    else:
+        result = build_full(asset, batches, data_dir, stats, dry_run, exclude, moment)
+    stats['seconds'] = time.perf_counter() - started
+    return stats, result
+
+
+def build(data_dir=DATA_DIR, only=None, dry_run=False, full=False, cache_dir=CACHE_DIR, jobs=1,
+          deterministic=False, derived_dir=DERIVED_DIR):
+    """应用批次并写回有变化的资源文件，再运行派生阶段
+
+    deterministic 为真时新记录的时间取源时间（见 source_date）。
+    派生阶段的输出写到 derived_dir（见 stages.py）。
+    jobs > 1 时各资源文件、各派生阶段在进程池中并行处理，按固定顺序
+    汇总结果和更新清单，输出与串行构建相同。
+    返回 (每个资源的统计, 每个阶段的统计)
+    """
+    ledger = Ledger.load()
+    moment = source_date(deterministic)
+    by_asset = {}
+    for batch in load_batches(only):
+        ledger.bind(batch)
+        batch.source_date = moment
+        by_asset.setdefault(batch.asset, []).append(batch)
+
+    manifest = Manifest.load(cache_dir)
+    plans = []
+    for name, batches in by_asset.items():
+        asset = ASSETS[name]
+        # 去重合并掉的词汇ID不再被批次加回
+        exclude = set()
+        if name == 'words':
+            exclude = set(load_aliases())
+        hashes = {batch.name: batch_hashes(batch, exclude) for batch in batches}
+        check_overlap(hashes)
+        for batch in batches:
+            ledger.check(batch, hashes[batch.name])
+        changed = {
+            batch.name: {
+                record_id for record_id, digest in hashes[batch.name].items()
+                if manifest.batches.get(batch.name, {}).get(record_id) != digest
+            }
+            for batch in batches
+        }
+        entry = None if full else manifest.asset_entry(asset, data_dir)
+        plans.append((name, hashes, (name, batches, entry, changed, data_dir, dry_run, exclude, moment)))
+
+    results = map_jobs(build_asset, [call for _, _, call in plans], jobs)
+    report = {}
+    for (name, hashes, _), (stats, result) in zip(plans, results):
+        if result is not None and not dry_run:
+            text, ids, spans = result
+            manifest.record_asset(ASSETS[name], data_dir, text, ids, spans)
+            manifest.batches.update(hashes)
+        report[name] = stats
+
+    stage_report = run_stages(data_dir, manifest, force=full, dry_run=dry_run, jobs=jobs,
+                              derived_dir=derived_dir, cache_dir=cache_dir)
+    if not dry_run:
+        manifest.save()
+    return report, stage_report
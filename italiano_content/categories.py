@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+词汇类别分类表
+
+sample_words.json 的类别原本是各个批次随手写的中文名，同一主题有好几种
+写法（方位 / 方位词，交通 / 旅游交通，健康 / 健康医疗），还有很多只有
+一两个词的类别。TAXONOMY 是规范的类别表：
+
+  code     小整数编码，只追加、不改、不复用（应用和内容库按编码索引）
+  id       稳定的英文标识（内容库 categories 表中的 id）
+  name     规范的中文类别名，资源文件中只出现这些名字
+  aliases  归并到该类别的其他写法
+
+构建时 category_fields 把批次中的别名换成规范名（批次源文件不用改），
+校验时类别必须是规范名。派生输出 words/taxonomy.json（紧凑 JSON，只给
+程序读）把等级、类别编成整数编码，并给出每个等级、类别的成员列表
+（词汇在 sample_words.json 中的下标），应用按类别筛选直接查成员列表：
+
+  levels      [{code, name, count, members}]，code 为 LEVELS 中的下标
+  categories  [{code, id, name, count, members}]，按 code 排列
+  words       {ids, level, category}：与 sample_words.json 同序的ID和编码
+"""
+
+import json
+
+from .assets import LEVELS
+
+TAXONOMY_FILE = "words/taxonomy.json"
+
+
+class Category:
+    def __init__(self, code, id, name, aliases=()):
+        self.code = code
+        self.id = id
+        self.name = name
+        self.aliases = aliases
+
+
+TAXONOMY = (
+    Category(1, "daily", "日常用语", ("疑问词",)),
+    Category(2, "adjectives", "形容词"),
+    Category(3, "verbs", "动词"),
+    Category(4, "home", "家庭生活", ("居住", "房屋", "户外")),
+    Category(5, "rooms", "房间"),
+    Category(6, "furniture", "家具"),
+    Category(7, "food", "食物餐饮", ("餐饮",)),
+    Category(8, "shopping", "购物"),
+    Category(9, "travel", "旅游出行", ("出行", "住宿")),
+    Category(10, "transport", "交通", ("旅游交通",)),
+    Category(11, "city", "城市设施"),
+    Category(12, "work_study", "工作学习", ("工作", "学习", "身份")),
+    Category(13, "jobs", "职业"),
+    Category(14, "business", "商务交流"),
+    Category(15, "tech", "通讯科技"),
+    Category(16, "leisure", "娱乐运动", ("娱乐", "运动", "休闲")),
+    Category(17, "culture", "文化艺术", ("文化", "宗教")),
+    Category(18, "health", "健康医疗", ("健康",)),
+    Category(19, "body", "身体部位"),
+    Category(20, "clothing", "衣物"),
+    Category(21, "colors", "颜色"),
+    Category(22, "numbers", "数字"),
+    Category(23, "time", "时间"),
+    Category(24, "time_adverbs", "时间副词"),
+    Category(25, "months", "月份"),
+    Category(26, "weekdays", "星期"),
+    Category(27, "weather", "天气"),
+    Category(28, "position", "方位", ("方位词",)),
+    Category(29, "emotions", "情绪"),
+    Category(30, "social", "社交关系"),
+    Category(31, "abstract", "抽象概念"),
+)
+
+BY_NAME = {category.name: category for category in TAXONOMY}
+CATEGORY_NAMES = tuple(BY_NAME)
+# 类别名（规范名和别名）→ 规范名
+ALIASES = {alias: category.name for category in TAXONOMY for alias in (category.name,) + category.aliases}
+
+
+def canonical(name):
+    """规范类别名；不在分类表中的原样返回（由校验报告）"""
+    return ALIASES.get(name, name)
+
+
+def category_fields(word):
+    """构建时写入词汇的字段"""
+    if 'category' not in word:
+        return {}
+    return {'category': canonical(word['category'])}
+
+
+def level_code(level):
+    return LEVELS.index(level) if level in LEVELS else None
+
+
+def category_code(name):
+    category = BY_NAME.get(canonical(name))
+    return category.code if category else None
+
+
+def build_taxonomy(words):
+    levels = [{'code': code, 'name': level, 'count': 0, 'members': []} for code, level in enumerate(LEVELS)]
+    categories = {
+        category.code: {'code': category.code, 'id': category.id, 'name': category.name, 'count': 0, 'members': []}
+        for category in TAXONOMY
+    }
+    index = {'ids': [], 'level': [], 'category': []}
+    for position, word in enumerate(words):
+        level = level_code(word['level'])
+        code = category_code(word['category'])
+        if level is None or code is None:
+            raise ValueError(f"{word['id']}: 等级 {word['level']!r} 或类别 {word['category']!r} 不在分类表中")
+        index['ids'].append(word['id'])
+        index['level'].append(level)
+        index['category'].append(code)
+        for entry in (levels[level], categories[code]):
+            entry['count'] += 1
+            entry['members'].append(position)
+    return {'levels': levels, 'categories': list(categories.values()), 'words': index}
+
+
+def render_taxonomy(docs):
+    taxonomy = build_taxonomy(docs['words'])
+    return {TAXONOMY_FILE: json.dumps(taxonomy, ensure_ascii=False, separators=(',', ':'))}
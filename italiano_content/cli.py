@@ -0,0 +1,672 @@
+# -*- coding: utf-8 -*-
+"""
+命令行入口：python -m italiano_content <命令>
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import timezone
+from pathlib import Path
+
+from . import analytics, categories, columnar, corpus, dedup, dictionary, examples, ids, importer, metrics, phonetics, reproducible
+from .assets import ASSETS, DATA_DIR, DERIVED_DIR, LEVELS
+from .build import build, source_date
+from .manifest import CACHE_DIR, Manifest
+from .release import RELEASE_DIR, emit_release, size_report
+from .render import render_document
+from .validate import format_errors, validate_all
+
+
+def cmd_build(args):
+    if args.benchmark:
+        return benchmark_build(args)
+    started = time.perf_counter()
+    report, stage_report = build(args.data_dir, only=set(args.only or ()), dry_run=args.dry_run,
+                                 full=args.full, cache_dir=args.cache_dir, jobs=args.jobs,
+                                 deterministic=args.deterministic, derived_dir=args.derived_dir)
+    seconds = time.perf_counter() - started
+    modes = {'skip': "未变化", 'incremental': "增量", 'full': "完整"}
+    for name, stats in report.items():
+        print(f"\n📦 {name} ({modes[stats['mode']]}构建, {stats['seconds'] * 1000:.1f} ms):")
+        for batch_name, (rows, added, updated) in stats['batches'].items():
+            print(f"  {batch_name}: {rows} 条, 新增 {added}, 更新 {updated}")
+        if stats['written']:
+            print(f"  ✅ 已写入, 重新序列化 {stats['emitted']} 条, 共 {stats['total']} 条")
+        elif args.dry_run and (stats['added'] or stats['updated']):
+            print(f"  🔍 预演模式, 未写入 (共 {stats['total']} 条)")
+        else:
+            print(f"  ⏭️  无变化, 跳过写入 (共 {stats['total']} 条)")
+    print("\n🧩 派生输出:")
+    for stats in stage_report:
+        if stats['skipped']:
+            print(f"  {stats['name']}: 输入未变化, 跳过 ({stats['outputs']} 个文件)")
+            continue
+        print(f"  {stats['name']}: {stats['outputs']} 个文件, 写入 {len(stats['written'])}, "
+              f"删除 {len(stats['removed'])} ({stats['seconds'] * 1000:.1f} ms)")
+        for path in stats['written'][:5]:
+            print(f"    ✏️  {path}")
+        if len(stats['written']) > 5:
+            print(f"    ... 另有 {len(stats['written']) - 5} 个文件")
+    print(f"\n⏱️  构建用时 {seconds * 1000:.1f} ms ({args.jobs} 个进程)")
+    if not args.dry_run:
+        print_coverage_summary(args.data_dir, args.cache_dir)
+    if args.release:
+        report = emit_release(Manifest.load(args.cache_dir), args.release_dir, dry_run=args.dry_run,
+                              derived_dir=args.derived_dir)
+        print_release(report, args.data_dir, args.release_dir)
+    return 0
+
+
+def benchmark_build(args):
+    """完整预演构建（不写文件）串行、并行各一次，比较用时"""
+    jobs = max(args.jobs, 2)
+    timings = []
+    for mode_jobs in (1, jobs):
+        started = time.perf_counter()
+        report, stage_report = build(args.data_dir, only=set(args.only or ()), dry_run=True, full=True,
+                                     cache_dir=args.cache_dir, jobs=mode_jobs, derived_dir=args.derived_dir)
+        wall = time.perf_counter() - started
+        tasks = sum(stats['seconds'] for stats in report.values()) + sum(s['seconds'] for s in stage_report)
+        timings.append(wall)
+        print(f"⏱️  {mode_jobs} 个进程: {wall * 1000:.1f} ms (各任务用时合计 {tasks * 1000:.1f} ms)")
+    serial, parallel = timings
+    print(f"\n🚀 并行加速 {serial / parallel:.2f}× (本机 {os.cpu_count()} 个 CPU)")
+    return 0
+
+
+def print_release(report, data_dir, out_dir):
+    print(f"\n🚀 发布版输出 ({out_dir}):")
+    for _, path, size, written in report:
+        mark = "✏️ " if written else "  "
+        print(f"  {mark}{path:<36}{size / 1024:8.1f} KB")
+    print("  与代替的开发格式资源相比:")
+    bundle_total = dev_total = 0
+    for stage, size, replaced, dev_size in size_report(report, data_dir):
+        bundle_total += size
+        dev_total += dev_size
+        if replaced:
+            print(f"    {stage}: {dev_size / 1024:.1f} KB ({', '.join(replaced)}) → {size / 1024:.1f} KB")
+        else:
+            print(f"    {stage}: {size / 1024:.1f} KB (没有对应的开发格式资源)")
+    print(f"  合计 {len(report)} 个文件 {bundle_total / 1024:.1f} KB, 代替的开发格式资源 {dev_total / 1024:.1f} KB")
+
+
+def print_coverage_summary(data_dir, cache_dir):
+    if analytics.np is None:
+        print("\n📈 语料分析: 未安装 numpy, 跳过 (pip install numpy)")
+        return
+    started = time.perf_counter()
+    matrix = analytics.analyze(data_dir, cache_dir)
+    coverage = matrix.coverage()['all']
+    shares = " ".join(f"{level} {share:.0%}" for level, share in zip(LEVELS, coverage) if share)
+    seconds = time.perf_counter() - started
+    print(f"\n📈 语料覆盖: {shares}, 未使用词汇 {len(matrix.unused())} 个, "
+          f"超纲语境 {len(matrix.above_level())} 个 ({seconds * 1000:.1f} ms, 详见 coverage 命令)")
+
+
+def cmd_coverage(args):
+    started = time.perf_counter()
+    matrix = analytics.analyze(args.data_dir, args.cache_dir)
+    built = time.perf_counter()
+    coverage = matrix.coverage()
+    density = matrix.density()
+    unused = matrix.unused()
+    above = matrix.above_level()
+    seconds = time.perf_counter() - built
+
+    print(f"📊 {len(matrix.words)} 个词汇 × {len(matrix.contexts)} 个语境, {matrix.rows.size} 个出现 "
+          f"(分词对应 {(built - started) * 1000:.1f} ms, 统计 {seconds * 1000:.1f} ms)")
+    print("\n📚 词汇覆盖率 (各等级词汇中出现过的比例):")
+    print("  " + " " * 10 + "".join(f"{level:>7}" for level in LEVELS))
+    for kind, shares in coverage.items():
+        name = "全部语境" if kind == "all" else analytics.KIND_NAMES[kind]
+        print(f"  {name:<8}" + "".join(f"{share:>7.0%}" for share in shares))
+    print("\n🔤 词汇密度 (语境中对应到词汇表的词占比):")
+    for level, contexts, share in density:
+        print(f"  {level}: {share:.0%} ({contexts} 个语境)")
+    print(f"\n💤 未使用词汇: {len(unused)} 个")
+    words = {word['id']: word for word in matrix.words}
+    for word_id in unused if args.verbose else unused[:10]:
+        word = words[word_id]
+        print(f"  {word_id} {word['italian']} ({word['level']}, {word['category']})")
+    if not args.verbose and len(unused) > 10:
+        print(f"  ... 另有 {len(unused) - 10} 个 (-v 列出全部)")
+    print(f"\n⚠️  超纲语境: {len(above)} 个")
+    for kind, context_id, level, ids in above if args.verbose else above[:10]:
+        # 重复词条显示相同，只列一次
+        labels = list(dict.fromkeys(f"{words[i]['italian']}({words[i]['level']})" for i in ids))
+        shown = ", ".join(labels[:6])
+        more = f" 等 {len(labels)} 个" if len(labels) > 6 else ""
+        print(f"  {analytics.KIND_NAMES[kind]} {context_id} ({level}): {shown}{more}")
+    if not args.verbose and len(above) > 10:
+        print(f"  ... 另有 {len(above) - 10} 个 (-v 列出全部)")
+    return 0
+
+
+def cmd_dedup(args):
+    asset = ASSETS['words']
+    original = asset.read_text(args.data_dir)
+    words = json.loads(original)
+    duplicates = dedup.find_duplicates(words)
+    removable = sum(len(members) - 1 for _, clusters in duplicates for members in clusters)
+    homographs = [(key, clusters) for key, clusters in duplicates if len(clusters) > 1]
+
+    print(f"📚 词汇总数: {len(words)}")
+    print(f"🔁 重复词形: {len(duplicates)} 个, 可合并记录: {removable} 条")
+    print(f"🔀 同形异义 (不合并): {len(homographs)} 个")
+    for key, clusters in homographs:
+        senses = " | ".join(
+            ", ".join(f"{words[i]['id']} {words[i]['chinese']}" for i in members) for members in clusters
+        )
+        print(f"  {key}: {senses}")
+    if args.verbose:
+        print("\n📋 重复词形明细:")
+        for key, clusters in duplicates:
+            for members in clusters:
+                if len(members) > 1:
+                    print(f"  {key}: " + ", ".join(
+                        f"{words[i]['id']}({words[i]['level']}, {words[i]['category']})" for i in members))
+
+    if not args.merge or not removable:
+        return 0
+    merged, aliases = dedup.merge_duplicates(words)
+    # 之前合并过的ID若指向本次被合并的记录，改指向最终保留的记录
+    previous = dedup.load_aliases()
+    previous = {old: aliases.get(target, target) for old, target in previous.items()}
+    previous.update(aliases)
+    text, _ = render_document(asset, merged)
+    asset.write_text(text, args.data_dir)
+    dedup.save_aliases(previous)
+    print(f"\n✅ 已合并 {len(aliases)} 条重复记录, 剩余 {len(merged)} 条")
+    print(f"📦 sample_words.json: {len(original.encode('utf-8')) / 1024:.0f} KB → {len(text.encode('utf-8')) / 1024:.0f} KB")
+    return 0
+
+
+def parse_mapping(pairs):
+    mapping = {}
+    for pair in pairs or ():
+        column, sep, field = pair.rpartition('=')
+        if not sep or not column:
+            raise ValueError(f"--map 应为 列名=字段: {pair}")
+        mapping[column] = field
+    return mapping
+
+
+def cmd_import(args):
+    report = importer.import_words(
+        args.file, args.data_dir, write=args.write, name=args.name, level=args.level,
+        category=args.category, delimiter=args.delimiter, overrides=parse_mapping(args.map),
+    )
+    print(f"📥 {Path(args.file).name} → 批次 {report.name}")
+    if report.ignored:
+        print(f"⚠️  忽略未识别的列: {', '.join(report.ignored)}")
+    print(f"📄 读入 {report.rows} 行: 导入 {report.imported}, 重复 {len(report.duplicates)}, "
+          f"无效 {len(report.invalid)}")
+    if report.imported:
+        print(f"🔢 ID: {report.first_id} - {report.last_id}")
+    shown = None if args.verbose else 10
+    for title, problems in (("🔁 重复", report.duplicates), ("❌ 无效", report.invalid)):
+        if problems:
+            print(f"\n{title}:")
+            for problem in problems[:shown]:
+                print(f"  {problem}")
+            if shown is not None and len(problems) > shown:
+                print(f"  ... 另有 {len(problems) - shown} 条 (-v 列出全部)")
+    print(f"\n⏱️  {report.seconds * 1000:.1f} ms, {report.rows_per_second:,.0f} 行/秒")
+    if report.written:
+        print(f"✅ 已写入 sample_words.json, 共 {report.total} 条")
+    elif args.write:
+        print("⏭️  没有可导入的行, 未写入")
+    else:
+        print(f"🔍 预演模式, 未写入 (导入后共 {report.total} 条, 加 --write 写入)")
+    return 1 if report.invalid and args.strict else 0
+
+
+def cmd_ingest(args):
+    report = dictionary.ingest(
+        args.dump, args.freq, args.data_dir, args.out, pos=args.pos.split(',') if args.pos else (),
+        max_rank=args.max_rank, levels=args.level, batch_size=args.batch_size, name=args.name, jobs=args.jobs,
+    )
+    print(f"📖 {Path(args.dump).name}: {report.entries} 个词条 ({report.entries_per_second:,.0f} 条/秒, "
+          f"{args.jobs} 个进程)")
+    print(f"  无频率排名 {report.unranked}, 排名或等级不符 {report.filtered}, 重复词形 {report.repeated}")
+    print("\n📊 按频率等级 (已收录 / 候选):")
+    for level, (present, found) in report.levels.items():
+        if present or found:
+            print(f"  {level}: {present} / {found}")
+    if report.mismatched:
+        print(f"\n🔀 已收录但等级与频率等级不同: {len(report.mismatched)} 个")
+        shown = report.mismatched if args.verbose else report.mismatched[:10]
+        for word, current, level, rank in shown:
+            print(f"  {word}: {current} → {level} (第 {rank} 位)")
+        if len(shown) < len(report.mismatched):
+            print(f"  ... 另有 {len(report.mismatched) - len(shown)} 个 (-v 列出全部)")
+    if report.batches:
+        print(f"\n📝 候选批次 {len(report.batches)} 个 (补全中文后用 import 命令导入):")
+        shown = report.batches if args.verbose else report.batches[:10]
+        for path, count in shown:
+            print(f"  {path}: {count} 个")
+        if len(shown) < len(report.batches):
+            print(f"  ... 另有 {len(report.batches) - len(shown)} 个 (-v 列出全部)")
+    else:
+        print("\n⏭️  没有未收录的候选词")
+    print(f"\n⏱️  {report.seconds * 1000:.1f} ms")
+    return 0
+
+
+def cmd_corpus(args):
+    scales = tuple(args.scale or corpus.SCALES)
+    print(f"🧪 合成语料 {', '.join(f'{scale}×' for scale in scales)}: 字典列表与 WordRecord 的峰值 RSS (已减去空载进程)")
+    print(f"  {'规模':<6}{'条数':>9}{'字典':>12}{'WordRecord':>14}{'节省':>8}{'读入用时 (字典 / WordRecord)':>30}")
+    for scale, count, found in corpus.benchmark(scales, args.data_dir):
+        plain, compact = found['dict'], found['corpus']
+        saved = 1 - compact['rss'] / plain['rss'] if plain['rss'] else 0.0
+        print(f"  {str(scale) + '×':<6}{count:>9}{plain['rss'] / 1024:>10.1f}MB{compact['rss'] / 1024:>12.1f}MB"
+              f"{saved:>8.0%}{plain['seconds']:>18.2f}s / {compact['seconds']:.2f}s")
+    print("\n✅ WordRecord 还原的记录与 sample_words.json 一致")
+    return 0
+
+
+def cmd_export(args):
+    asset = ASSETS['words']
+    text = asset.read_text(args.data_dir)
+    started = time.perf_counter()
+    words = json.loads(text)
+    json_seconds = time.perf_counter() - started
+
+    blob = columnar.encode(words)
+    out_dir = Path(args.out or args.data_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    outputs = [(out_dir / "sample_words.iwc", blob)]
+    for method in args.compress or ():
+        suffix = {'gzip': 'gz', 'zstd': 'zst'}[method]
+        outputs.append((out_dir / f"sample_words.iwc.{suffix}", columnar.compress(blob, method)))
+
+    minified = json.dumps(words, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    print(f"📊 {len(words)} 个词汇")
+    print(f"  {'sample_words.json:':<24}{len(text.encode('utf-8')) / 1024:8.1f} KB, 解析 {json_seconds * 1000:.1f} ms")
+    print(f"  {'JSON (去掉空白):':<24}{len(minified) / 1024:8.1f} KB")
+    expected = json.dumps(words, ensure_ascii=False)
+    for path, data in outputs:
+        with open(path, 'wb') as f:
+            f.write(data)
+        started = time.perf_counter()
+        decoded = columnar.decode(data)
+        seconds = time.perf_counter() - started
+        if json.dumps(decoded, ensure_ascii=False) != expected:
+            raise ValueError(f"{path.name} 往返校验失败")
+        print(f"  {path.name + ':':<24}{len(data) / 1024:8.1f} KB, 解析 {seconds * 1000:.1f} ms ✅ 往返一致")
+    return 0
+
+
+def cmd_passages(args):
+    passages_asset = ASSETS['passages']
+    passages = passages_asset.load(args.data_dir)
+    words = ASSETS['words'].load(args.data_dir)
+    started = time.perf_counter()
+    results = metrics.analyze_passages(passages, words, cache_dir=args.cache_dir)
+    seconds = time.perf_counter() - started
+
+    print(f"📖 {len(passages)} 篇文章, 分析用时 {seconds * 1000:.1f} ms\n")
+    print(f"  {'ID':<13}{'等级':<4}{'实测':<4}{'词数':>3}{'词元':>3}{'句数':>3}{'分钟':>3}  覆盖")
+    stale = 0
+    for passage, result in zip(passages, results):
+        coverage = " ".join(f"{level} {share:.0%}" for level, share in result['coverage'].items())
+        mark = "⚠️ " if result['mismatch'] else "  "
+        print(f"{mark}{result['id']:<13}{result['level']:<6}{result['measuredLevel'] or '-':<6}"
+              f"{result['wordCount']:>5}{result['uniqueLemmas']:>5}{result['sentences']:>5}"
+              f"{result['estimatedMinutes']:>5}  {coverage}, 未收录 {result['unknown']:.0%}")
+        fields = metrics.reading_fields(passage)
+        if any(passage.get(key) != value for key, value in fields.items()):
+            stale += 1
+            passage.update(fields)
+
+    mismatched = [result for result in results if result['mismatch']]
+    if mismatched:
+        print(f"\n⚠️  {len(mismatched)} 篇文章的声明等级与实测难度不一致: "
+              + ", ".join(f"{r['id']} ({r['level']} → {r['measuredLevel']})" for r in mismatched))
+    if not stale:
+        print("\n✅ wordCount 和 estimatedMinutes 均为最新")
+    elif not args.write:
+        print(f"\n🔍 {stale} 篇文章的 wordCount/estimatedMinutes 与计算值不同, 使用 --write 写回")
+    else:
+        text, _ = render_document(passages_asset, passages)
+        passages_asset.write_text(text, args.data_dir)
+        print(f"\n✅ 已更新 {stale} 篇文章的 wordCount 和 estimatedMinutes")
+    return 0
+
+
+def cmd_examples(args):
+    names = ('words', 'phrases')
+    docs = {name: ASSETS[name].load(args.data_dir) for name in names}
+    records = {name: ASSETS[name].records(docs[name]) for name in names}
+    started = time.perf_counter()
+    derive = {'words': examples.example_fields, 'phrases': examples.phrase_example_fields}
+    stats = {name: {'total': 0, 'strings': 0, 'no_chinese': 0, 'blank': 0} for name in names}
+    missing = []
+    changed = set()
+    for name in names:
+        for record in records[name]:
+            fields = derive[name](record)
+            if not fields:
+                continue
+            for before, after in zip(record['examples'], fields['examples']):
+                stats[name]['total'] += 1
+                stats[name]['strings'] += isinstance(before, str)
+                stats[name]['no_chinese'] += not after['chinese']
+                if name == 'words':
+                    if 'blank' in after:
+                        stats[name]['blank'] += 1
+                    else:
+                        missing.append((record['id'], record['italian'], after['italian']))
+            if fields['examples'] != record['examples']:
+                record.update(fields)
+                changed.add(name)
+    seconds = time.perf_counter() - started
+
+    print(f"📝 例句结构化用时 {seconds * 1000:.1f} ms")
+    for name in names:
+        counts = stats[name]
+        line = f"\n📋 {ASSETS[name].filename}: {counts['total']} 条例句, 字符串 {counts['strings']}"
+        if name == 'words':
+            line += f", 可挖空 {counts['blank']}"
+        print(line + f", 缺中文 {counts['no_chinese']}")
+    shown = missing if args.verbose else missing[:8]
+    if missing:
+        print(f"\n⚠️  {len(missing)} 条词汇例句中找不到词头或其屈折形式:")
+    for word_id, italian, sentence in shown:
+        print(f"  {word_id} {italian}: {sentence}")
+    if len(missing) > len(shown):
+        print(f"  ... 另有 {len(missing) - len(shown)} 条 (-v 列出全部)")
+
+    if not changed:
+        print("\n✅ 例句均为最新的结构化格式")
+    elif not args.write:
+        print("\n🔍 有需要结构化或更新挖空位置的例句, 使用 --write 写回")
+    else:
+        for name in sorted(changed):
+            asset = ASSETS[name]
+            if asset.has_summary:
+                asset.touch(docs[name])
+            text, _ = render_document(asset, docs[name])
+            asset.write_text(text, args.data_dir)
+            print(f"\n✅ 已更新 {asset.filename}")
+    return 0
+
+
+def cmd_categories(args):
+    asset = ASSETS['words']
+    words = asset.load(args.data_dir)
+    counts = {}
+    renamed = {}
+    unknown = {}
+    for word in words:
+        name = categories.canonical(word['category'])
+        if name not in categories.BY_NAME:
+            unknown.setdefault(name, []).append(word['id'])
+            continue
+        counts[name] = counts.get(name, 0) + 1
+        if name != word['category']:
+            renamed.setdefault(word['category'], [name, 0])[1] += 1
+            word['category'] = name
+
+    print(f"🗂️  分类表: {len(categories.TAXONOMY)} 个类别, 词汇 {len(words)} 条")
+    for category in categories.TAXONOMY:
+        aliases = f"  ← {', '.join(category.aliases)}" if category.aliases else ""
+        print(f"  {category.code:>3} {category.id:<14}{category.name}: {counts.get(category.name, 0)}{aliases}")
+    if renamed:
+        print(f"\n🔀 使用别名的类别: {len(renamed)} 个")
+        for alias, (name, count) in renamed.items():
+            print(f"  {alias} → {name}: {count} 条")
+    for name, word_ids in unknown.items():
+        more = f" 等 {len(word_ids)} 条" if len(word_ids) > 3 else ""
+        print(f"❌ 类别 {name!r} 不在分类表中: {', '.join(word_ids[:3])}{more}")
+    if unknown:
+        return 1
+
+    if not renamed:
+        print("\n✅ 类别均为规范名")
+    elif not args.write:
+        print("\n🔍 有使用别名的类别, 使用 --write 写回规范名")
+    else:
+        text, _ = render_document(asset, words)
+        asset.write_text(text, args.data_dir)
+        print(f"\n✅ 已更新 {asset.filename}")
+    return 0
+
+
+def phonetic_fields(docs):
+    """生成 (资源名, 位置说明, 原文, 字段所在的字典, 字段名, 注音格式)"""
+    for word in docs['words']:
+        yield 'words', word['id'], word['italian'], word, 'pronunciation', 'ipa'
+    for conversation in docs['conversations']:
+        for m, message in enumerate(conversation.get('messages') or ()):
+            for token in message.get('words') or ():
+                if not token.get('isPunctuation') and phonetics.words_of(token.get('text')):
+                    yield 'conversations', f"{conversation['id']}#{m}", token['text'], token, 'phonetic', 'bracket'
+    for phrase in docs['phrases']:
+        yield 'phrases', phrase['id'], phrase['italian'], phrase, 'phonetic', 'respelling'
+
+
+def cmd_phonetics(args):
+    names = ('words', 'conversations', 'phrases')
+    docs = {name: ASSETS[name].load(args.data_dir) for name in names}
+    records = {name: ASSETS[name].records(docs[name]) for name in names}
+    started = time.perf_counter()
+    lexicon = phonetics.stress_lexicon(records['words'])
+    counts = {name: {} for name in names}
+    differences = {name: [] for name in names}
+    changed = set()
+    for name, where, text, holder, key, style in phonetic_fields(records):
+        existing = holder.get(key)
+        # 词汇只用自己的注音作提示，与构建时的 pronunciation_fields 一致
+        hints = None if name == 'words' else lexicon
+        value, status = phonetics.canonical(text, existing, style, hints)
+        counts[name][status] = counts[name].get(status, 0) + 1
+        if status == "different":
+            differences[name].append((where, text, existing,
+                                      phonetics.transcribe(text, existing, style, hints)))
+        if value != existing:
+            holder[key] = value
+            changed.add(name)
+    seconds = time.perf_counter() - started
+
+    labels = {'same': "一致", 'format': "仅写法不同", 'different': "读音不同", 'missing': "缺失"}
+    print(f"🔊 注音生成与核对用时 {seconds * 1000:.1f} ms "
+          f"(缓存 {phonetics.transcribe_word.cache_info().currsize} 个词)")
+    for name in names:
+        summary = ", ".join(f"{labels[status]} {count}" for status, count in counts[name].items())
+        print(f"\n📋 {ASSETS[name].filename}: {summary}")
+        shown = differences[name] if args.verbose else differences[name][:8]
+        for where, text, existing, generated in shown:
+            print(f"  {where} {text}: {existing} ≠ {generated}")
+        if len(differences[name]) > len(shown):
+            print(f"  ... 另有 {len(differences[name]) - len(shown)} 处 (-v 列出全部)")
+
+    if not changed:
+        print("\n✅ 没有需要补全或统一写法的注音")
+    elif not args.write:
+        print("\n🔍 缺失和仅写法不同的注音可以用 --write 写回；读音不同的请人工核对")
+    else:
+        for name in sorted(changed):
+            asset = ASSETS[name]
+            if asset.has_summary:
+                asset.touch(docs[name])
+            text, _ = render_document(asset, docs[name])
+            asset.write_text(text, args.data_dir)
+            print(f"\n✅ 已更新 {asset.filename}")
+    return 0
+
+
+def cmd_repro(args):
+    moment = source_date(deterministic=True)
+    epoch = int(moment.replace(tzinfo=timezone.utc).timestamp())
+    started = time.perf_counter()
+    results, differing = reproducible.check_reproducible(args.data_dir, epoch)
+    seconds = time.perf_counter() - started
+    print(f"🔁 源时间 {moment.isoformat()}Z, 两次完整构建 (PYTHONHASHSEED={', '.join(reproducible.HASH_SEEDS)}) "
+          f"用时 {seconds:.1f} s, 比较 {len(results[0])} 个文件")
+    if differing:
+        print(f"\n❌ {len(differing)} 个文件两次输出不一致:")
+        for path in differing:
+            print(f"  {path}")
+        return 1
+    print("\n✅ 所有输出逐字节一致")
+    return 0
+
+
+def cmd_validate(args):
+    started = time.perf_counter()
+    results = validate_all(args.data_dir, names=args.only, jobs=args.jobs)
+    seconds = time.perf_counter() - started
+    failed = 0
+    for name, count, errors in results:
+        if errors:
+            failed += 1
+            print(f"❌ {format_errors(ASSETS[name].filename, errors)}")
+        else:
+            print(f"✅ {ASSETS[name].filename}: {count} 条记录")
+    print(f"\n⏱️  校验 {len(results)} 个资源文件用时 {seconds * 1000:.1f} ms")
+    return 1 if failed else 0
+
+
+def cmd_ids(args):
+    if args.action == 'reserve':
+        first, last, start = ids.reserve(args.sequence, args.batch, args.count)
+        print(f"✅ 已为批次 {args.batch} 预留 {args.count} 个ID: {first} - {last}")
+        print(f"   批次模块不写 FIRST_ID 即从 {start} 开始编号，记得把模块名加入 SOURCES")
+        return 0
+
+    ledger = ids.Ledger.load()
+    if args.action == 'check':
+        found = {name: [record['id'] for record in asset.records(asset.load(args.data_dir))]
+                 for name, asset in ASSETS.items()}
+        problems = ids.find_collisions(found, ledger)
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            return 1
+        print(f"✅ {sum(len(v) for v in found.values())} 个ID无冲突，均在台账预留区间内")
+        return 0
+
+    for sequence in ledger.sequences.values():
+        print(f"\n🔢 {sequence.name} ({sequence.asset}), 下一个: {sequence.format(sequence.next)}")
+        for batch_name, ranges in sequence.ranges.items():
+            spans = ", ".join(f"{sequence.format(start)}-{sequence.format(end)}" for start, end in ranges)
+            print(f"  {batch_name}: {spans}")
+    return 0
+
+
+def make_parser():
+    parser = argparse.ArgumentParser(prog="italiano_content", description="意大利语学习内容构建工具")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="资源目录 (默认 assets/data)")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="构建缓存目录 (默认 .content_cache)")
+    parser.add_argument('--derived-dir', default=DERIVED_DIR, help="派生输出目录 (默认 build/content)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('build', help="把 sources 中的批次应用到资源文件")
+    p.add_argument('--only', action='append', metavar='BATCH', help="只应用指定批次，可重复")
+    p.add_argument('--dry-run', action='store_true', help="只统计，不写文件")
+    p.add_argument('--full', action='store_true', help="忽略构建清单，完整解析并序列化")
+    p.add_argument('--release', action='store_true', help="把应用打包的派生文件输出到 assets/bundle 并报告体积")
+    p.add_argument('--release-dir', default=RELEASE_DIR, help="发布版输出目录 (默认 assets/bundle，即应用打包的目录)")
+    p.add_argument('-j', '--jobs', type=int, default=1, help="并行处理资源文件和派生阶段的进程数")
+    p.add_argument('--deterministic', action='store_true',
+                   help="新记录的 createdAt 取源时间 (SOURCE_DATE_EPOCH 或 sources 最后一次提交的时间)")
+    p.add_argument('--benchmark', action='store_true', help="完整预演串行、并行构建各一次并报告加速比，不写文件")
+    p.set_defaults(func=cmd_build)
+
+    p = commands.add_parser('dedup', help="检测并合并 sample_words.json 中的重复词条")
+    p.add_argument('--merge', action='store_true', help="合并同义重复记录并写回")
+    p.add_argument('-v', '--verbose', action='store_true', help="列出所有重复词形")
+    p.set_defaults(func=cmd_dedup)
+
+    p = commands.add_parser('coverage', help="分析词汇在文章、对话、例句、常用语中的覆盖和超纲用词")
+    p.add_argument('-v', '--verbose', action='store_true', help="列出全部未使用词汇和超纲语境")
+    p.set_defaults(func=cmd_coverage)
+
+    p = commands.add_parser('passages', help="统计阅读文章的词数、句数、阅读时间和词汇等级覆盖")
+    p.add_argument('--write', action='store_true', help="把计算出的 wordCount 和 estimatedMinutes 写回")
+    p.set_defaults(func=cmd_passages)
+
+    p = commands.add_parser('examples', help="把例句拆成意大利语、中文并计算填空题的挖空位置")
+    p.add_argument('--write', action='store_true', help="把结构化的例句写回")
+    p.add_argument('-v', '--verbose', action='store_true', help="列出全部找不到词头的例句")
+    p.set_defaults(func=cmd_examples)
+
+    p = commands.add_parser('categories', help="按分类表检查词汇类别，把别名换成规范名")
+    p.add_argument('--write', action='store_true', help="把别名换成规范名并写回")
+    p.set_defaults(func=cmd_categories)
+
+    p = commands.add_parser('phonetics', help="按规则生成 IPA 注音并与已有的注音核对")
+    p.add_argument('--write', action='store_true', help="补全缺失的注音（已有的注音不改写）")
+    p.add_argument('-v', '--verbose', action='store_true', help="列出全部读音不同的注音")
+    p.set_defaults(func=cmd_phonetics)
+
+    p = commands.add_parser('repro', help="从头重新生成批次记录两次，检查输出是否逐字节一致")
+    p.set_defaults(func=cmd_repro)
+
+    p = commands.add_parser('validate', help="按结构声明校验全部资源文件")
+    p.add_argument('--only', action='append', choices=sorted(ASSETS), metavar='ASSET',
+                   help="只校验指定资源，可重复")
+    p.add_argument('-j', '--jobs', type=int, default=1, help="并行校验的进程数")
+    p.set_defaults(func=cmd_validate)
+
+    p = commands.add_parser('ids', help="查看 ID 台账、为新批次预留ID、检查ID冲突")
+    actions = p.add_subparsers(dest='action')
+    actions.add_parser('show', help="列出各编号序列的预留区间 (默认)")
+    reserve = actions.add_parser('reserve', help="为新批次预留一段连续ID")
+    reserve.add_argument('sequence', help="编号序列，如 words、passages、conversations")
+    reserve.add_argument('batch', help="批次名（sources 下的模块名）")
+    reserve.add_argument('count', type=int, help="预留数量")
+    actions.add_parser('check', help="检查各资源之间的ID冲突和台账外的ID")
+    p.set_defaults(func=cmd_ids, action='show')
+
+    p = commands.add_parser('import', help="从 CSV/TSV/YAML 表格流式导入词汇（校验、查重、编号）")
+    p.add_argument('file', help="表格文件 (.csv、.tsv、.yaml)")
+    p.add_argument('--write', action='store_true', help="写入 sample_words.json 并在 ID 台账中预留区间")
+    p.add_argument('--name', help="导入批次名 (默认 import_<文件名>)")
+    p.add_argument('--level', help="表格没有等级时使用的等级")
+    p.add_argument('--category', help="表格没有类别时使用的类别")
+    p.add_argument('--delimiter', help="分隔符 (默认按扩展名: .csv 为逗号, .tsv 为制表符)")
+    p.add_argument('--map', action='append', metavar='COLUMN=FIELD', help="把其他列名映射到字段，可重复")
+    p.add_argument('--strict', action='store_true', help="有无效行时返回非零状态")
+    p.add_argument('-v', '--verbose', action='store_true', help="列出全部重复行和无效行")
+    p.set_defaults(func=cmd_import)
+
+    p = commands.add_parser('ingest', help="从本地词典导出 (JSONL) 按频率、词性筛出未收录的候选词批次")
+    p.add_argument('dump', help="Wiktionary 风格的 JSONL 词典导出 (可以是 .gz)")
+    p.add_argument('--freq', help="频率表 (每行一个词, 按频率降序)")
+    p.add_argument('--pos', default=','.join(dictionary.DEFAULT_POS), help="保留的词性, 逗号分隔 (默认 %(default)s)")
+    p.add_argument('--max-rank', type=int, default=dictionary.DEFAULT_MAX_RANK,
+                   help="只保留频率排名在此之内的词 (默认 %(default)s, 0 为不限)")
+    p.add_argument('--level', action='append', choices=LEVELS, help="只保留按频率划分为该等级的词，可重复")
+    p.add_argument('--batch-size', type=int, default=200, help="每个候选批次的词数 (默认 200)")
+    p.add_argument('--name', help="候选批次文件名前缀 (默认取导出文件名)")
+    p.add_argument('--out', default=dictionary.CANDIDATES_DIR, help="候选批次输出目录 (默认 build/candidates)")
+    p.add_argument('-j', '--jobs', type=int, default=1, help="并行解析的进程数")
+    p.add_argument('-v', '--verbose', action='store_true', help="列出全部等级不同的已收录词和全部候选批次")
+    p.set_defaults(func=cmd_ingest)
+
+    p = commands.add_parser('corpus', help="比较字典与紧凑语料模型在 1×/10×/100× 合成语料上的峰值内存")
+    p.add_argument('--scale', type=int, action='append', help="合成语料的倍数，可重复 (默认 1、10、100)")
+    p.set_defaults(func=cmd_corpus)
+
+    p = commands.add_parser('export', help="导出词汇的紧凑列式二进制格式并做往返校验")
+    p.add_argument('--compress', action='append', choices=columnar.COMPRESSORS,
+                   help="同时输出压缩版本，可重复")
+    p.add_argument('--out', help="输出目录 (默认与 JSON 同目录)")
+    p.set_defaults(func=cmd_export)
+
+    return parser
+
+
+def main(argv=None):
+    args = make_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+词汇的紧凑列式二进制格式（.iwc）
+
+sample_words.json 中每条记录都重复 "pronunciation"、"createdAt"、"examples"
+等键名并带缩进。列式格式把同一字段的值放在一起：所有字符串进入一个去重的
+字符串池（按偏移索引），类别和等级编码为小整数，键名只在文件头出现一次。
+
+文件布局（整数均为小端）：
+  b"IWC1"        魔数
+  u32            文件头长度
+  文件头 JSON    {count, shapes, columns, enums, sections}
+  各数据段       按文件头 sections 中的 [名称, 偏移, 长度] 定位
+
+数据段：
+  pool.offsets   u32 × (字符串数 + 1)，pool.data 中每个字符串的起止位置
+  pool.data      UTF-8 字符串拼接
+  shape          u8 × count，每条记录的键集合与顺序（shapes 中的下标）
+  <列>           str/json 列：ref × count，字符串池下标，全 1 表示 null 或缺失
+                 enum 列：u8/u16 × count，enums[列] 中的下标
+                 list 列：<列>.offsets u32 × (count + 1)，<列>.items ref，
+                          <列>.kinds u8（0 字符串，1 JSON）
+字符串池少于 65535 个字符串时 ref 为 u16（文件头 ref = "H"），否则为 u32。
+decode(encode(words)) == words，键顺序也一致。
+"""
+
+import gzip
+import json
+import struct
+import sys
+from array import array
+
+MAGIC = b"IWC1"
+NONE = 0xFFFFFFFF
+ENUM_COLUMNS = ("category", "level")
+LIST_COLUMNS = ("examples",)
+COMPRESSORS = ("gzip", "zstd")
+
+
+def _le(arr):
+    """数组转成小端字节"""
+    if sys.byteorder != 'little':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _from_le(typecode, data):
+    arr = array(typecode)
+    arr.frombytes(data)
+    if sys.byteorder != 'little':
+        arr.byteswap()
+    return arr
+
+
+class StringPool:
+    """去重的字符串池"""
+
+    def __init__(self):
+        self.index = {}
+        self.strings = []
+
+    def ref(self, value):
+        if value is None:
+            return NONE
+        position = self.index.get(value)
+        if position is None:
+            position = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return position
+
+
+def column_type(name, values):
+    if name in ENUM_COLUMNS and all(isinstance(v, str) for v in values):
+        return 'enum'
+    if name in LIST_COLUMNS and all(isinstance(v, list) for v in values):
+        return 'list'
+    if all(v is None or isinstance(v, str) for v in values):
+        return 'str'
+    return 'json'
+
+
+def encode(records):
+    """把记录列表编码为列式二进制"""
+    pool = StringPool()
+    shapes = {}
+    shape_codes = array('B')
+    names = []
+    for record in records:
+        keys = tuple(record)
+        if keys not in shapes:
+            shapes[keys] = len(shapes)
+            names.extend(key for key in keys if key not in names)
+        shape_codes.append(shapes[keys])
+    if len(shapes) > 255:
+        raise ValueError("记录的键组合超过 255 种，无法编码")
+
+    sections = {'shape': _le(shape_codes)}
+    refs = {}
+    columns = []
+    enums = {}
+    for name in names:
+        present = [record[name] for record in records if name in record]
+        kind = column_type(name, present)
+        columns.append([name, kind])
+        if kind == 'enum':
+            values = list(dict.fromkeys(present))
+            codes = {value: i for i, value in enumerate(values)}
+            typecode, missing = ('B', 0xFF) if len(values) < 0xFF else ('H', 0xFFFF)
+            enums[name] = values
+            sections[name] = _le(array(typecode, (
+                codes[record[name]] if name in record else missing for record in records)))
+        elif kind == 'list':
+            offsets = array('I', [0])
+            items = array('I')
+            kinds = array('B')
+            for record in records:
+                for item in record.get(name) or ():
+                    if isinstance(item, str):
+                        items.append(pool.ref(item))
+                        kinds.append(0)
+                    else:
+                        items.append(pool.ref(json.dumps(item, ensure_ascii=False)))
+                        kinds.append(1)
+                offsets.append(len(items))
+            sections[f"{name}.offsets"] = _le(offsets)
+            sections[f"{name}.items"] = refs[f"{name}.items"] = items
+            sections[f"{name}.kinds"] = _le(kinds)
+        else:
+            dump = (lambda v: v) if kind == 'str' else (lambda v: json.dumps(v, ensure_ascii=False))
+            sections[name] = refs[name] = array('I', (
+                pool.ref(dump(record[name])) if name in record and (record[name] is not None or kind == 'json')
+                else NONE
+                for record in records))
+
+    # 字符串池较小时用 u16 存下标
+    ref_code = 'H' if len(pool.strings) < 0xFFFF else 'I'
+    for name, column in refs.items():
+        if ref_code == 'H':
+            column = array('H', (0xFFFF if ref == NONE else ref for ref in column))
+        sections[name] = _le(column)
+
+    data = bytearray()
+    offsets = array('I', [0])
+    for value in pool.strings:
+        data += value.encode('utf-8')
+        offsets.append(len(data))
+    sections['pool.offsets'] = _le(offsets)
+    sections['pool.data'] = bytes(data)
+
+    layout = []
+    position = 0
+    for name, blob in sections.items():
+        layout.append([name, position, len(blob)])
+        position += len(blob)
+    header = json.dumps({
+        'count': len(records),
+        'ref': ref_code,
+        'shapes': [list(keys) for keys in shapes],
+        'columns': columns,
+        'enums': enums,
+        'sections': layout,
+    }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return MAGIC + struct.pack('<I', len(header)) + header + b''.join(sections.values())
+
+
+def decode(blob):
+    """把列式二进制还原为记录列表"""
+    blob = decompress(blob)
+    if blob[:4] != MAGIC:
+        raise ValueError("不是 IWC1 格式的文件")
+    (length,) = struct.unpack_from('<I', blob, 4)
+    header = json.loads(blob[8:8 + length].decode('utf-8'))
+    base = 8 + length
+    view = memoryview(blob)
+    sections = {name: view[base + start:base + start + size] for name, start, size in header['sections']}
+
+    offsets = _from_le('I', sections['pool.offsets'])
+    text = bytes(sections['pool.data'])
+    strings = [text[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+
+    count = header['count']
+    ref_code = header['ref']
+    none = 0xFFFF if ref_code == 'H' else NONE
+    values = {}
+    for name, kind in header['columns']:
+        if kind == 'enum':
+            table = header['enums'][name]
+            typecode = 'B' if len(table) < 0xFF else 'H'
+            codes = _from_le(typecode, sections[name])
+            values[name] = [table[c] if c < len(table) else None for c in codes]
+        elif kind == 'list':
+            starts = _from_le('I', sections[f"{name}.offsets"])
+            items = _from_le(ref_code, sections[f"{name}.items"])
+            kinds = _from_le('B', sections[f"{name}.kinds"])
+            decoded = [strings[ref] if k == 0 else json.loads(strings[ref]) for ref, k in zip(items, kinds)]
+            values[name] = [decoded[starts[i]:starts[i + 1]] for i in range(count)]
+        else:
+            refs = _from_le(ref_code, sections[name])
+            column = [None if ref == none else strings[ref] for ref in refs]
+            if kind == 'json':
+                column = [None if v is None else json.loads(v) for v in column]
+            values[name] = column
+
+    shapes = header['shapes']
+    shape_codes = _from_le('B', sections['shape'])
+    return [
+        {key: values[key][i] for key in shapes[code]}
+        for i, code in enumerate(shape_codes)
+    ]
+
+
+def compress(blob, method):
+    if method == 'gzip':
+        return gzip.compress(blob, compresslevel=9, mtime=0)
+    if method == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd 压缩需要安装 zstandard: pip install zstandard") from None
+        return zstandard.ZstdCompressor(level=19).compress(blob)
+    raise ValueError(f"未知的压缩方式: {method}")
+
+
+def decompress(blob):
+    """按魔数识别 gzip/zstd 压缩，未压缩时原样返回"""
+    if blob[:2] == b'\x1f\x8b':
+        return gzip.decompress(blob)
+    if blob[:4] == b'\x28\xb5\x2f\xfd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("读取 zstd 文件需要安装 zstandard: pip install zstandard") from None
+        return zstandard.ZstdDecompressor().decompress(blob)
+    return blob
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+预建的 SQLite 内容库
+
+把词汇、词汇例句、常用语、语法和阅读文章写进 content.db（派生输出目录
+build/content，发布时复制到 assets/bundle）。这是应用中这几个资源唯一的
+运行时来源，对应的 JSON 不打包。应用首次启动时把它复制到数据库目录后
+只读打开，按等级、类别查询走索引，文本搜索走 FTS5 全文索引，不必再解析
+几 MB 的 JSON。
+
+  words / examples / phrases / grammar / passages
+      每个资源一张表，position 为记录在资源文件中的顺序（INTEGER PRIMARY KEY，
+      VACUUM 不会改变）；嵌套的字段（规则、练习、题目等）以 JSON 文本保存。
+      words 另有等级、类别的整数编码（见 categories.py），按编码建索引
+  categories
+      分类表：编码、id、规范名和词数，按类别名查询时先在这里取编码
+  *_fts
+      无内容（content=''）的 FTS5 表，rowid 与对应表的 position 相同，
+      只存索引，查询得到 rowid 后回表取记录。分词器 unicode61 并去掉重音，
+      与 tokens.py 一致：拉丁字母按非字母数字切分，中文按字建索引
+      （写入时每个汉字之间加空格）
+  fields
+      每张表的列 → JSON 字段名和类型（text/integer/json/bool），应用据此把
+      行还原成与资源文件相同的记录，交给模型的 fromJson
+  meta
+      schema 版本和内容哈希；同时输出 content_db.json，应用比较其中的
+      version 与已复制库中的 meta 决定是否重新复制
+
+记录按资源文件中的顺序插入，最后 VACUUM，内容不变时生成的文件逐字节相同。
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+
+from .assets import BUNDLE_PREFIX
+from .categories import TAXONOMY, category_code, level_code
+from .examples import WORD_SEPARATOR, structure_example
+from .manifest import content_hash
+from .tokens import han_chars
+
+DB_FILE = "content.db"
+VERSION_FILE = "content_db.json"
+# 表结构变化时加一
+SCHEMA_VERSION = 5
+TOKENIZER = "unicode61 remove_diacritics 2"
+
+
+class Table:
+    """一个资源对应的表：columns 为 [(列名, 字段名, 类型)]，
+    类型 text/integer 直接保存，json 保存为 JSON 文本，bool 保存为 0/1"""
+
+    def __init__(self, name, asset, columns, indexes=(), fts=()):
+        self.name = name
+        self.asset = asset
+        self.columns = columns
+        self.indexes = indexes
+        # 全文索引的列：[(列名, 字段名, 是否按字切分)]
+        self.fts = fts
+
+    def create(self):
+        types = {'text': 'TEXT', 'integer': 'INTEGER', 'json': 'TEXT', 'bool': 'INTEGER'}
+        columns = ",\n  ".join(f"{column} {types[kind]}" for column, _, kind in self.columns)
+        statements = [f"CREATE TABLE {self.name} (\n  position INTEGER PRIMARY KEY,\n  {columns}\n)"]
+        for index in self.indexes:
+            statements.append(f"CREATE INDEX {self.name}_{'_'.join(index)} "
+                              f"ON {self.name} ({', '.join(index)}, position)")
+        if self.fts:
+            names = ", ".join(column for column, _, _ in self.fts)
+            statements.append(f"CREATE VIRTUAL TABLE {self.name}_fts USING fts5({names}, content='', "
+                              f"tokenize='{TOKENIZER}')")
+        return statements
+
+    def row(self, position, record):
+        values = [position]
+        for _, field, kind in self.columns:
+            value = record.get(field)
+            if value is not None and kind == 'json':
+                value = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+            elif value is not None and kind == 'bool':
+                value = int(bool(value))
+            values.append(value)
+        return values
+
+    def fts_row(self, position, record):
+        values = [position]
+        for _, field, by_char in self.fts:
+            text = record.get(field) or ''
+            values.append(" ".join(han_chars(text)) if by_char else text)
+        return values
+
+
+WORDS = Table("words", "words", [
+    ("id", "id", "text"),
+    ("italian", "italian", "text"),
+    ("chinese", "chinese", "text"),
+    ("english", "english", "text"),
+    ("pronunciation", "pronunciation", "text"),
+    ("category", "category", "text"),
+    ("level", "level", "text"),
+    ("audio_url", "audioUrl", "text"),
+    ("image_url", "imageUrl", "text"),
+    ("created_at", "createdAt", "text"),
+    ("level_code", "levelCode", "integer"),
+    ("category_code", "categoryCode", "integer"),
+], indexes=[("id",), ("level_code",), ("category_code",), ("level_code", "category_code")],
+    fts=[("italian", "italian", False), ("english", "english", False), ("chinese", "chinese", True)])
+
+CATEGORIES = Table("categories", "words", [
+    ("code", "code", "integer"),
+    ("id", "id", "text"),
+    ("name", "name", "text"),
+    ("count", "count", "integer"),
+], indexes=[("name",)])
+
+EXAMPLES = Table("examples", "words", [
+    ("word_id", "wordId", "text"),
+    ("seq", "seq", "integer"),
+    ("italian", "italian", "text"),
+    ("chinese", "chinese", "text"),
+    ("blank_start", "blankStart", "integer"),
+    ("blank_end", "blankEnd", "integer"),
+], indexes=[("word_id", "seq")],
+    fts=[("italian", "italian", False), ("chinese", "chinese", True)])
+
+PHRASES = Table("phrases", "phrases", [
+    ("id", "id", "text"),
+    ("italian", "italian", "text"),
+    ("chinese", "chinese", "text"),
+    ("phonetic", "phonetic", "text"),
+    ("category", "category", "text"),
+    ("context", "context", "text"),
+    ("level", "level", "text"),
+    ("examples", "examples", "json"),
+    ("emoji", "emoji", "text"),
+    ("is_popular", "isPopular", "bool"),
+], indexes=[("id",), ("level",), ("category",)],
+    fts=[("italian", "italian", False), ("chinese", "chinese", True)])
+
+GRAMMAR = Table("grammar", "grammar", [
+    ("id", "id", "text"),
+    ("title", "title", "text"),
+    ("category", "category", "text"),
+    ("level", "level", "text"),
+    ("description", "description", "text"),
+    ("rules", "rules", "json"),
+    ("examples", "examples", "json"),
+    ("exercises", "exercises", "json"),
+    ("image_url", "imageUrl", "text"),
+    ("created_at", "createdAt", "text"),
+], indexes=[("id",), ("level",), ("category",)],
+    fts=[("title", "title", False), ("description", "description", True)])
+
+PASSAGES = Table("passages", "passages", [
+    ("id", "id", "text"),
+    ("title", "title", "text"),
+    ("title_chinese", "titleChinese", "text"),
+    ("level", "level", "text"),
+    ("category", "category", "text"),
+    ("content", "content", "text"),
+    ("word_count", "wordCount", "integer"),
+    ("estimated_minutes", "estimatedMinutes", "integer"),
+    ("questions", "questions", "json"),
+    ("audio_url", "audioUrl", "text"),
+    ("created_at", "createdAt", "text"),
+], indexes=[("id",), ("level",), ("category",)],
+    fts=[("title", "title", False), ("content", "content", False), ("title_chinese", "titleChinese", True)])
+
+TABLES = (WORDS, EXAMPLES, CATEGORIES, PHRASES, GRAMMAR, PASSAGES)
+INPUTS = ("words", "phrases", "grammar", "passages")
+
+
+def example_records(words):
+    for word in words:
+        for seq, example in enumerate(word.get('examples') or ()):
+            if not isinstance(example, dict):
+                example = structure_example(example, WORD_SEPARATOR, word)
+            blank = example.get('blank') or (None, None)
+            yield {'wordId': word['id'], 'seq': seq, 'italian': example['italian'], 'chinese': example['chinese'],
+                   'blankStart': blank[0], 'blankEnd': blank[1]}
+
+
+def word_records(words):
+    for word in words:
+        yield {**word, 'levelCode': level_code(word['level']), 'categoryCode': category_code(word['category'])}
+
+
+def category_records(words):
+    counts = {}
+    for word in words:
+        code = category_code(word['category'])
+        counts[code] = counts.get(code, 0) + 1
+    for category in TAXONOMY:
+        yield {'code': category.code, 'id': category.id, 'name': category.name, 'count': counts.get(category.code, 0)}
+
+
+def table_records(table, docs):
+    if table is WORDS:
+        return word_records(docs['words'])
+    if table is EXAMPLES:
+        return example_records(docs['words'])
+    if table is CATEGORIES:
+        return category_records(docs['words'])
+    return docs[table.asset]
+
+
+def fill_fields(connection):
+    connection.execute("CREATE TABLE fields (table_name TEXT, column_name TEXT, field TEXT, kind TEXT)")
+    connection.executemany("INSERT INTO fields VALUES (?, ?, ?, ?)", [
+        (table.name, column, field, kind) for table in TABLES for column, field, kind in table.columns
+    ])
+
+
+def fill(connection, docs):
+    fill_fields(connection)
+    for table in TABLES:
+        for statement in table.create():
+            connection.execute(statement)
+        placeholders = ", ".join("?" * (len(table.columns) + 1))
+        fts_placeholders = ", ".join("?" * (len(table.fts) + 1))
+        for position, record in enumerate(table_records(table, docs)):
+            try:
+                connection.execute(f"INSERT INTO {table.name} VALUES ({placeholders})", table.row(position, record))
+            except sqlite3.Error as e:
+                raise ValueError(f"内容库 {table.name} 第 {position} 条记录写入失败: {e}")
+            if table.fts:
+                connection.execute(f"INSERT INTO {table.name}_fts (rowid, {', '.join(c for c, _, _ in table.fts)}) "
+                                   f"VALUES ({fts_placeholders})", table.fts_row(position, record))
+        if table.fts:
+            connection.execute(f"INSERT INTO {table.name}_fts ({table.name}_fts) VALUES ('optimize')")
+
+
+def build_database(docs):
+    """生成内容库，返回 (文件内容, 内容哈希)"""
+    version = content_hash([SCHEMA_VERSION] + [docs[name] for name in INPUTS])
+    handle, path = tempfile.mkstemp(suffix=".db")
+    os.close(handle)
+    try:
+        connection = sqlite3.connect(path)
+        try:
+            connection.execute("PRAGMA page_size = 4096")
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            with connection:
+                connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                connection.executemany("INSERT INTO meta VALUES (?, ?)", [
+                    ("schema", str(SCHEMA_VERSION)),
+                    ("version", version),
+                ])
+                fill(connection, docs)
+                connection.execute("ANALYZE")
+            connection.execute("VACUUM")
+        finally:
+            connection.close()
+        with open(path, 'rb') as f:
+            return f.read(), version
+    finally:
+        os.unlink(path)
+
+
+def render_content_db(docs):
+    data, version = build_database(docs)
+    info = {'file': BUNDLE_PREFIX + DB_FILE, 'schema': SCHEMA_VERSION, 'version': version, 'bytes': len(data)}
+    return {
+        DB_FILE: data,
+        VERSION_FILE: json.dumps(info, ensure_ascii=False, indent=2) + "\n",
+    }
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+内存紧凑的词汇语料模型
+
+各工具都直接操作 json 解析出的字典：每条词汇一个字典，例句又是一个
+字典列表，"A1"、"日常用语" 这样的值每条记录各存一份。语料扩大十倍、
+百倍时，这些小对象和重复字符串占去大部分内存。WordRecord 换成：
+
+  __slots__   字段与 create_word_data 相同（见 WORD_FIELDS），没有实例字典
+  枚举值      level、category、createdAt 经 sys.intern 驻留，同一个值只存一份
+  audioUrl    等于 assets/audio/words/<id>.mp3 时不保存，读取时再拼出来
+  examples    保存为紧凑的 JSON 文本，读取属性时才解析成列表（每次读取
+              都重新解析，需要反复使用时请自行保留结果）
+  其他字段    WORD_FIELDS 以外的字段放在 extra 字典中，保证原样往返
+
+WordRecord.to_dict() 与原记录相等（字段顺序也相同）。Corpus.load 用
+RecordReader 逐条读取，不会同时持有完整的字典列表。
+
+benchmark 在子进程中分别把 1×、10×、100× 规模的合成语料（sample_words.json
+的记录重复多份、ID 各不相同）读成字典列表和 Corpus，比较峰值 RSS。
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .assets import ASSETS, DATA_DIR, ROOT, WORD_FIELDS
+from .stream import RecordReader, RecordWriter, iter_records
+
+AUDIO_URL = "assets/audio/words/{id}.mp3"
+SCALES = (1, 10, 100)
+
+_STORED = tuple(field for field in WORD_FIELDS if field not in ('audioUrl', 'examples'))
+_INTERNED = ('level', 'category', 'createdAt')
+# 表示 audioUrl 按 AUDIO_URL 拼出
+_DEFAULT_AUDIO = object()
+_KEY_ORDERS = {}
+
+
+def intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class WordRecord:
+    """一条词汇；属性与 sample_words.json 中的字段同名"""
+
+    __slots__ = _STORED + ('_audio', '_examples', 'extra', '_order')
+
+    @classmethod
+    def from_dict(cls, record):
+        word = cls()
+        for field in _STORED:
+            value = record.get(field)
+            setattr(word, field, intern(value) if field in _INTERNED else value)
+        audio = record.get('audioUrl')
+        word._audio = _DEFAULT_AUDIO if audio is not None and audio == AUDIO_URL.format(id=record.get('id')) else audio
+        examples = record.get('examples')
+        word._examples = None if examples is None else json.dumps(examples, ensure_ascii=False, separators=(',', ':'))
+        word.extra = {key: value for key, value in record.items() if key not in WORD_FIELDS} or None
+        # 键与 WORD_FIELDS 不完全相同（顺序不同、缺字段、有其他字段）时记下原来的键，
+        # 同样的键序列只保存一份
+        keys = tuple(record)
+        word._order = None if keys == WORD_FIELDS else _KEY_ORDERS.setdefault(keys, keys)
+        return word
+
+    @property
+    def audioUrl(self):
+        return AUDIO_URL.format(id=self.id) if self._audio is _DEFAULT_AUDIO else self._audio
+
+    @property
+    def examples(self):
+        return None if self._examples is None else json.loads(self._examples)
+
+    def to_dict(self):
+        record = {}
+        for field in self._order or WORD_FIELDS:
+            if field in WORD_FIELDS:
+                record[field] = getattr(self, field)
+            else:
+                record[field] = self.extra[field]
+        return record
+
+
+class Corpus:
+    """按资源文件顺序排列的 WordRecord"""
+
+    def __init__(self, words):
+        self.words = words
+
+    @classmethod
+    def load(cls, data_dir=DATA_DIR):
+        return cls([WordRecord.from_dict(record) for record in iter_records(ASSETS['words'], data_dir)])
+
+    @classmethod
+    def read(cls, path):
+        return cls([WordRecord.from_dict(record) for record in RecordReader(path)])
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __getitem__(self, index):
+        return self.words[index]
+
+    def records(self):
+        for word in self.words:
+            yield word.to_dict()
+
+
+def write_synthetic(path, scale, data_dir=DATA_DIR):
+    """把 sample_words.json 的记录重复 scale 份写到 path，第 k 份的ID加后缀 _k"""
+    with RecordWriter(path) as writer:
+        for copy in range(scale):
+            for record in iter_records(ASSETS['words'], data_dir):
+                if copy:
+                    record['id'] = f"{record['id']}_{copy}"
+                    if record.get('audioUrl') is not None:
+                        record['audioUrl'] = AUDIO_URL.format(id=record['id'])
+                writer.write(record)
+    return writer.count
+
+
+def peak_rss():
+    """本进程的峰值 RSS (KB)
+
+    Linux 上读 /proc/self/status 的 VmHWM：getrusage 的 ru_maxrss 在 exec
+    后保留 fork 时父进程的值，父进程占用较多内存时子进程的测量会偏高。
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 的 ru_maxrss 以字节为单位
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def measure(path, kind):
+    """在子进程中调用：读入语料，输出峰值 RSS (KB) 和读入用时"""
+    started = time.perf_counter()
+    if kind == 'dict':
+        loaded = list(RecordReader(path))
+    elif kind == 'corpus':
+        loaded = Corpus.read(path)
+    else:
+        loaded = None
+    seconds = time.perf_counter() - started
+    print(json.dumps({'rss': peak_rss(), 'seconds': seconds,
+                      'count': len(loaded) if loaded is not None else 0}))
+
+
+def run_measure(path, kind):
+    process = subprocess.run(
+        [sys.executable, '-c', f"from italiano_content.corpus import measure; measure({str(path)!r}, {kind!r})"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if process.returncode:
+        raise ValueError(f"内存测量失败 ({kind}):\n{process.stderr[-2000:]}")
+    return json.loads(process.stdout)
+
+
+def check_roundtrip(data_dir=DATA_DIR):
+    """Corpus 还原出的记录必须与资源文件中的记录相同"""
+    corpus = Corpus.load(data_dir)
+    for word, record in zip(corpus.records(), iter_records(ASSETS['words'], data_dir)):
+        if word != record or list(word) != list(record):
+            raise ValueError(f"WordRecord 往返不一致: {record.get('id')}")
+    return len(corpus)
+
+
+def benchmark(scales=SCALES, data_dir=DATA_DIR):
+    """返回 [(规模, 条数, {'dict': 结果, 'corpus': 结果})]，RSS 已减去空载子进程的基线"""
+    if os.name != 'posix':
+        raise ValueError("内存基准需要 /proc 或 resource 模块 (仅支持 Linux/macOS)")
+    check_roundtrip(data_dir)
+    results = []
+    with tempfile.TemporaryDirectory() as temp:
+        baseline = run_measure(Path(temp) / "none.json", 'none')['rss']
+        for scale in scales:
+            path = Path(temp) / f"words_{scale}x.json"
+            count = write_synthetic(path, scale, data_dir)
+            found = {}
+            for kind in ('dict', 'corpus'):
+                result = run_measure(path, kind)
+                result['rss'] -= baseline
+                found[kind] = result
+            results.append((scale, count, found))
+            path.unlink()
+    return results
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+重复词条检测与合并
+
+按规范化词形（小写、去重音、合并空白，并去掉词头前的冠词，il sole 与
+sole 相同）建立哈希索引，一次遍历找出重复的意大利语词条。同一词形下
+只有释义（中文或英文）有交集的记录才视为同一词条，其余作为同形异义词
+只报告不合并，例如 vicino（近的）和 vicino（邻居）。
+
+合并时保留ID最小的记录，等级取最低，例句取并集；被合并掉的ID记录在
+word_aliases.json 中（旧ID → 保留ID），构建时不会被批次加回。保留的
+记录仍按批次更新，合并时改动的等级、例句需要同步改到批次中。
+"""
+
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+from .assets import LEVELS
+from .lemmas import ARTICLES
+
+ALIASES_PATH = Path(__file__).resolve().parent / "word_aliases.json"
+
+_SPACES = re.compile(r"\s+")
+_GLOSS_SPLIT = re.compile(r"[/／,，;；、()（）]")
+# 词头前的冠词（后面还有词时才去掉）：il sole、l'acqua、un'amica
+_ARTICLE = re.compile(r"^(?:(?:%s) |(?:l|un)')(?=\S)" % "|".join(sorted(ARTICLES, key=len, reverse=True)))
+
+
+def fold(text):
+    """小写并去掉重音符号：città → citta"""
+    text = unicodedata.normalize('NFD', text.strip().lower())
+    text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
+    return _SPACES.sub(' ', text.replace('’', "'"))
+
+
+def headword_key(text):
+    """规范化并去掉词头前的冠词：il sole、sole → sole，l'acqua → acqua"""
+    return _ARTICLE.sub('', fold(text or ''), count=1)
+
+
+def lemma_key(word):
+    return headword_key(word['italian'])
+
+
+def glosses(word):
+    """词条的释义集合，用于判断两条记录是否同一词义"""
+    found = set()
+    for field in ('chinese', 'english'):
+        for part in _GLOSS_SPLIT.split(word.get(field) or ''):
+            part = fold(part)
+            if part.startswith('to '):
+                part = part[3:]
+            if part:
+                found.add((field, part))
+    return found
+
+
+def example_key(example):
+    """例句去重用的键；例句可能是 "意大利语 - 中文" 字符串，也可能是 {italian, chinese}"""
+    if isinstance(example, dict):
+        example = example.get('italian') or ''
+    else:
+        example = example.split(' - ')[0]
+    return fold(example)
+
+
+def level_rank(level):
+    return LEVELS.index(level) if level in LEVELS else len(LEVELS)
+
+
+def build_index(words):
+    """规范化词形 → 记录下标列表"""
+    index = {}
+    for i, word in enumerate(words):
+        index.setdefault(lemma_key(word), []).append(i)
+    return index
+
+
+def sense_clusters(words, positions):
+    """把同一词形的记录按释义是否相交聚成若干词义簇"""
+    clusters = []
+    for position in positions:
+        senses = glosses(words[position])
+        joined = [c for c in clusters if c[1] & senses]
+        members, union = [position], set(senses)
+        for cluster in joined:
+            members.extend(cluster[0])
+            union |= cluster[1]
+            clusters.remove(cluster)
+        clusters.append((sorted(members), union))
+    return [members for members, _ in clusters]
+
+
+def find_duplicates(words):
+    """返回重复词形列表：[(词形, [[同义记录下标], ...]), ...]"""
+    duplicates = []
+    for key, positions in build_index(words).items():
+        if len(positions) > 1:
+            duplicates.append((key, sense_clusters(words, positions)))
+    return duplicates
+
+
+def merge_records(records):
+    """合并同一词义的记录：保留ID最小者，等级取最低，例句取并集"""
+    records = sorted(records, key=lambda w: int(w['id']))
+    merged = dict(records[0])
+    merged['level'] = min((w['level'] for w in records), key=level_rank)
+    examples, seen = [], set()
+    for word in records:
+        for example in word.get('examples') or []:
+            key = example_key(example)
+            if key not in seen:
+                seen.add(key)
+                examples.append(example)
+    merged['examples'] = examples
+    for field in ('english', 'pronunciation'):
+        if not merged.get(field):
+            merged[field] = next((w[field] for w in records if w.get(field)), merged.get(field))
+    return merged
+
+
+def merge_duplicates(words):
+    """合并所有同义重复记录，返回 (新记录列表, {旧ID: 保留ID})"""
+    replaced = {}
+    aliases = {}
+    for _, clusters in find_duplicates(words):
+        for members in clusters:
+            if len(members) < 2:
+                continue
+            merged = merge_records([words[i] for i in members])
+            for i in members:
+                if words[i]['id'] == merged['id']:
+                    replaced[i] = merged
+                else:
+                    replaced[i] = None
+                    aliases[words[i]['id']] = merged['id']
+    result = [replaced.get(i, word) for i, word in enumerate(words)]
+    return [word for word in result if word is not None], aliases
+
+
+def load_aliases(path=ALIASES_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_aliases(aliases, path=ALIASES_PATH):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(aliases.items(), key=lambda item: int(item[0]))), f, indent=2)
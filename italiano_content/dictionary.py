@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+从本地词典导出文件生成候选词汇批次
+
+输入是 Wiktionary 风格的 JSONL 词典导出（每行一个词条，如 kaikki.org 的
+意大利语导出，可以是 .gz），加上可选的频率表（每行 "词 次数"，按频率
+降序，行号即频率排名）。整个流程是一条生成器流水线，对导出文件只顺序
+读一遍：
+
+  读取    按块读入若干整行（BLOCK_SIZE），内存只与在途的块数有关
+  解析    各块在进程池中解析（-j N），只取出词形、词性、英文释义、IPA，
+          先按语言和词性过滤，回传的数据很小；结果按块的顺序合并
+  排名    词条自带 rank 时使用之，否则查频率表；没有排名的词条丢弃
+  过滤    --max-rank（默认 DEFAULT_MAX_RANK）、--pos；同一词形只保留第一个符合条件的词条
+  等级    按频率排名划分（LEVEL_RANKS），--level 只保留指定等级
+  对照    与 sample_words.json 按规范化词形（去掉冠词，与 dedup 相同）对照，
+          已收录的只计数
+  输出    未收录的按等级、排名分成每批 --batch-size 个的 TSV 候选批次，
+          列与 import 命令一致；中文释义（和名词的类别）留空，补全后
+          用 python -m italiano_content import 导入
+
+跳过只有 "xxx 的复数" 这类变形释义（form-of、alt-of）的词条。
+"""
+
+import gzip
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .assets import ASSETS, DATA_DIR, LEVELS, ROOT
+from .dedup import headword_key, lemma_key
+from .stream import iter_records
+
+CANDIDATES_DIR = ROOT / "build" / "candidates"
+
+BLOCK_SIZE = 1 << 22
+LANG_CODE = "it"
+
+# 频率排名上限 → 等级：A1 为最常用的 1000 词，A2 再加 1200 词
+# （与 add_a2_vocabulary.py 的 A2 目标 1000-1200 词一致），其余依次递增
+LEVEL_RANKS = (("A1", 1000), ("A2", 2200), ("B1", 4000), ("B2", 6500), ("C1", 10000), ("C2", None))
+
+# 导出中的词性 → 候选词的默认类别（与已有的类别名一致，没有对应类别的留空）
+POS_CATEGORIES = {"adj": "形容词", "verb": "动词"}
+DEFAULT_POS = ("noun", "verb", "adj", "adv")
+FORM_TAGS = {"form-of", "alt-of"}
+
+# 默认只看 C1 以内的词，更罕见的词不作为候选
+DEFAULT_MAX_RANK = 10000
+
+CANDIDATE_COLUMNS = ("italian", "chinese", "english", "pronunciation", "category", "level", "rank", "pos")
+MAX_GLOSSES = 2
+
+
+def read_blocks(path, block_size=BLOCK_SIZE):
+    """按块产出整行组成的字节串"""
+    opener = gzip.open if Path(path).suffix == '.gz' else open
+    with opener(path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                return
+            yield block + f.readline()
+
+
+def entry_fields(entry):
+    """词条 → (词形, 词性, 英文释义, IPA)，只有变形释义时返回 None"""
+    glosses = []
+    for sense in entry.get('senses') or ():
+        if FORM_TAGS & set(sense.get('tags') or ()) or 'form_of' in sense or 'alt_of' in sense:
+            continue
+        for gloss in sense.get('glosses') or ():
+            if gloss not in glosses:
+                glosses.append(gloss)
+                break
+    if not glosses:
+        return None
+    ipa = next((sound['ipa'] for sound in entry.get('sounds') or () if sound.get('ipa')), '')
+    return entry['word'], entry.get('pos', ''), '; '.join(glosses[:MAX_GLOSSES]), ipa.strip('/[]')
+
+
+def parse_block(block, pos):
+    """解析一块 JSONL，返回 [(词形, 词性, 英文释义, IPA, 自带的排名)]"""
+    found = []
+    for line in block.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        if entry.get('lang_code', LANG_CODE) != LANG_CODE or not entry.get('word'):
+            continue
+        if pos and entry.get('pos') not in pos:
+            continue
+        fields = entry_fields(entry)
+        if fields is not None:
+            found.append(fields + (entry.get('rank'),))
+    return found
+
+
+def parse_entries(path, pos, jobs=1):
+    """顺序读一遍导出文件，按原顺序产出解析出的词条；进程池中最多同时有 2×jobs 块"""
+    blocks = read_blocks(path)
+    if jobs <= 1:
+        for block in blocks:
+            yield from parse_block(block, pos)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for block in blocks:
+            pending.append(pool.submit(parse_block, block, pos))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def load_frequencies(path):
+    """频率表 → {规范化词形: 排名}，同一词形取最靠前的排名"""
+    ranks = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            parts = line.split()
+            if parts:
+                ranks.setdefault(headword_key(parts[0]), number)
+    return ranks
+
+
+def rank_level(rank):
+    for level, limit in LEVEL_RANKS:
+        if limit is None or rank <= limit:
+            return level
+    return LEVELS[-1]
+
+
+class IngestReport:
+    def __init__(self):
+        self.entries = 0
+        self.unranked = 0
+        self.filtered = 0
+        self.repeated = 0
+        # 等级 → [已收录数, 候选数]
+        self.levels = {level: [0, 0] for level in LEVELS}
+        # 已收录词的现有等级与频率等级不同：(词形, 现有等级, 频率等级, 排名)
+        self.mismatched = []
+        self.batches = []
+        self.seconds = 0.0
+
+    @property
+    def entries_per_second(self):
+        return self.entries / self.seconds if self.seconds else 0.0
+
+
+def candidates(entries, ranks, existing, report, max_rank=None, levels=None):
+    """排名、过滤、对照已有词汇，产出未收录的候选词（按导出文件中的顺序）"""
+    seen = set()
+    for word, pos, english, ipa, rank in entries:
+        report.entries += 1
+        # 与 dedup 相同的词形键：已收录的 il sole 与导出中的 sole 对应
+        key = headword_key(word)
+        rank = rank or ranks.get(key)
+        if rank is None:
+            report.unranked += 1
+            continue
+        level = rank_level(rank)
+        if (max_rank and rank > max_rank) or (levels and level not in levels):
+            report.filtered += 1
+            continue
+        if key in seen:
+            report.repeated += 1
+            continue
+        seen.add(key)
+        if key in existing:
+            report.levels[level][0] += 1
+            if level not in existing[key]:
+                report.mismatched.append((word, '/'.join(existing[key]), level, rank))
+            continue
+        report.levels[level][1] += 1
+        yield {
+            'italian': word, 'chinese': '', 'english': english, 'pronunciation': ipa,
+            'category': POS_CATEGORIES.get(pos, ''), 'level': level, 'rank': rank, 'pos': pos,
+        }
+
+
+def write_batch(path, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\t'.join(CANDIDATE_COLUMNS) + '\n')
+        for row in rows:
+            f.write('\t'.join(str(row[column]).replace('\t', ' ') for column in CANDIDATE_COLUMNS) + '\n')
+
+
+def ingest(path, frequency_path=None, data_dir=DATA_DIR, out_dir=CANDIDATES_DIR, pos=DEFAULT_POS,
+           max_rank=DEFAULT_MAX_RANK, levels=None, batch_size=200, name=None, jobs=1):
+    """返回 IngestReport；候选批次写到 out_dir/<name>_<等级>_<序号>.tsv"""
+    path = Path(path)
+    if not path.is_file():
+        raise ValueError(f"找不到文件: {path}")
+    for level in levels or ():
+        if level not in LEVELS:
+            raise ValueError(f"未知等级: {level} (可选: {', '.join(LEVELS)})")
+    if batch_size < 1:
+        raise ValueError("每批数量必须大于 0")
+    name = name or path.name.split('.')[0]
+    report = IngestReport()
+    started = time.perf_counter()
+
+    ranks = load_frequencies(frequency_path) if frequency_path else {}
+    existing = {}
+    for word in iter_records(ASSETS['words'], data_dir):
+        existing.setdefault(lemma_key(word), []).append(word.get('level'))
+
+    # 候选词只有排名、等级等几个短字段，全部留到最后分批
+    by_level = {}
+    entries = parse_entries(path, set(pos or ()), jobs)
+    for row in candidates(entries, ranks, existing, report, max_rank, set(levels or ())):
+        by_level.setdefault(row['level'], []).append(row)
+
+    out_dir = Path(out_dir)
+    for stale in out_dir.glob(f"{name}_*.tsv"):
+        stale.unlink()
+    for level in LEVELS:
+        rows = sorted(by_level.get(level, ()), key=lambda row: row['rank'])
+        for number, start in enumerate(range(0, len(rows), batch_size), 1):
+            batch_path = out_dir / f"{name}_{level}_{number:03d}.tsv"
+            write_batch(batch_path, rows[start:start + batch_size])
+            report.batches.append((batch_path, len(rows[start:start + batch_size])))
+    report.seconds = time.perf_counter() - started
+    return report
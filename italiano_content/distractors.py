@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+测验干扰项池
+
+为每个词汇预先挑出一组“像但不对”的干扰项，输出
+words/distractors.json（紧凑 JSON，发布时打包）：{词汇ID: [干扰项ID, ...]}，
+按合适程度从高到低排列。应用出题时直接从池里取，不再每题随机扫描词表。
+
+候选来自同类别、等级相差不超过一级的词，以及拼写上相近的词（意大利语字母三元组倒排索引，
+至少共享三个三元组），不够时用同等级的词补足。得分综合：同类别、等级接近、拼写相似、长度
+相近。排除同一词形的重复词条和释义有交集的同义词（见 dedup.py），
+同一个池里不出现中文或意大利语相同的两个选项。
+"""
+
+import heapq
+import json
+
+from .dedup import fold, glosses, level_rank
+
+DISTRACTORS_FILE = "words/distractors.json"
+POOL_SIZE = 8
+
+WEIGHT_CATEGORY = 3.0
+WEIGHT_LEVEL = 1.5
+WEIGHT_SPELLING = 2.0
+WEIGHT_LENGTH = 1.0
+
+
+def trigrams(text):
+    padded = f"  {fold(text)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class Candidate:
+    """出题用到的词汇特征，只计算一次"""
+
+    __slots__ = ('id', 'position', 'lemma', 'italian', 'chinese', 'category', 'level', 'length',
+                 'grams', 'glosses')
+
+    def __init__(self, position, word):
+        self.id = word['id']
+        self.position = position
+        self.lemma = fold(word['italian'])
+        self.italian = word['italian']
+        self.chinese = word['chinese']
+        self.category = word['category']
+        self.level = level_rank(word['level'])
+        self.length = len(self.lemma)
+        self.grams = trigrams(word['italian'])
+        self.glosses = glosses(word)
+
+
+def score(word, other, shared_grams):
+    spelling = shared_grams / (len(word.grams) + len(other.grams) - shared_grams)
+    return (
+        WEIGHT_CATEGORY * (word.category == other.category)
+        + WEIGHT_LEVEL * (1 - abs(word.level - other.level) / 5)
+        + WEIGHT_SPELLING * spelling
+        + WEIGHT_LENGTH * min(word.length, other.length) / max(word.length, other.length, 1)
+    )
+
+
+def excluded(word, other):
+    """重复词条、同义词、显示文字相同的词不能作为干扰项"""
+    return (
+        other.lemma == word.lemma
+        or other.chinese == word.chinese
+        or bool(word.glosses & other.glosses)
+    )
+
+
+def build_pools(words, size=POOL_SIZE):
+    candidates = [Candidate(i, word) for i, word in enumerate(words)]
+    by_category = {}
+    by_level = {}
+    by_gram = {}
+    for candidate in candidates:
+        by_category.setdefault((candidate.category, candidate.level), []).append(candidate)
+        by_level.setdefault(candidate.level, []).append(candidate)
+        for gram in candidate.grams:
+            by_gram.setdefault(gram, []).append(candidate)
+
+    pools = {}
+    for word in candidates:
+        shared = {}
+        for gram in word.grams:
+            for other in by_gram[gram]:
+                shared[other.position] = shared.get(other.position, 0) + 1
+        # 同类别中等级相差不超过一级的词
+        pool = {
+            other.position: other
+            for level in (word.level - 1, word.level, word.level + 1)
+            for other in by_category.get((word.category, level), ())
+        }
+        # 只共享一两个三元组（如词尾 "re "）算不上拼写相近
+        pool.update((position, candidates[position]) for position, count in shared.items() if count >= 3)
+        if len(pool) < size * 2:
+            # 小类别的词候选不够时，用同等级的其他词补足
+            pool.update((other.position, other) for other in by_level[word.level])
+
+        scored = (
+            (score(word, other, shared.get(other.position, 0)), -other.position, other)
+            for other in pool.values()
+            if other is not word and not excluded(word, other)
+        )
+        chosen = []
+        seen_chinese = set()
+        seen_italian = set()
+        # 取分数最高的若干个，跳过与已选项显示相同的
+        for _, _, other in heapq.nlargest(size * 3, scored, key=lambda item: item[:2]):
+            if other.chinese in seen_chinese or other.lemma in seen_italian:
+                continue
+            seen_chinese.add(other.chinese)
+            seen_italian.add(other.lemma)
+            chosen.append(other.id)
+            if len(chosen) == size:
+                break
+        pools[word.id] = chosen
+    return pools
+
+
+def render_distractors(docs):
+    pools = build_pools(docs['words'])
+    return {DISTRACTORS_FILE: json.dumps(pools, ensure_ascii=False, separators=(',', ':'))}
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+结构化例句
+
+批次中的例句是一个字符串：词汇例句为 "意大利语 - 中文"，常用语例句为
+"意大利语 (中文)"。构建时拆成 {italian, chinese}，词汇例句另加 blank：
+例句中词头（或其屈折形式，见 inflection.py）的位置 [起, 止)，应用出
+填空题时直接按位置挖空，不再在运行时拆字符串、找单词。
+
+  分隔符    取第一个汉字之前的最后一个分隔符，意大利语部分本身含 " - "
+            （Grazie! - Prego! - 谢谢! - 不客气!）时也能正确拆分
+  blank     先找词头（多词词头按词序列，带冠词的词头也找去掉冠词的形式），
+            找不到再找屈折形式，动词最后找以词干开头的词（过去分词、
+            未完成过去时、将来时、带代词后缀），取第一次出现的位置；
+            位置按 UTF-16 计，与 Dart 字符串下标一致；找不到时不写 blank
+已经是结构化的例句只重新计算 blank。
+"""
+
+import re
+
+from .inflection import adjective_forms, conjugate, inflect
+from .lemmas import ARTICLES, headword_forms, word_tokens
+from .tokens import han_chars
+
+WORD_SEPARATOR = " - "
+PHRASE_SEPARATOR = " ("
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def split_example(text, separator):
+    """拆成 (意大利语, 中文)，没有中文部分时中文为空字符串"""
+    text = text.strip()
+    han = next((i for i, c in enumerate(text) if han_chars(c)), len(text))
+    cut = text.rfind(separator, 0, han)
+    if cut < 0:
+        cut = text.find(separator)
+    if cut < 0:
+        return text, ''
+    italian = text[:cut].strip()
+    chinese = text[cut + len(separator):].strip()
+    if separator == PHRASE_SEPARATOR and chinese.endswith(')'):
+        chinese = chinese[:-1].strip()
+    return italian, chinese
+
+
+def utf16_offset(text, index):
+    return len(text[:index].encode('utf-16-le')) // 2
+
+
+def candidate_forms(word):
+    """可能出现在例句中的屈折形式
+
+    除 inflect 的结果外，不论类别、释义都按动词和形容词再变化一次
+    （英语释义不以 to 开头的 dovere、类别不是形容词的 bello）：
+    只在词汇自己的例句里找，多生成的形式不会误配。
+    """
+    forms = set(inflect(word))
+    tokens = word_tokens(word.get('italian'))
+    if len(tokens) > 1 and tokens[0] in ARTICLES:
+        tokens = tokens[1:]
+    if len(tokens) == 1:
+        token = tokens[0]
+        if token.endswith("rsi"):
+            token = token[:-2] + "e"
+        forms.update(conjugate(token))
+        forms.update(adjective_forms(token))
+    return forms
+
+
+def verb_stem(word):
+    """动词词干：其他时态、带代词后缀的形式（trovato、giocavo、aiutarti）都以它开头"""
+    tokens = word_tokens(word.get('italian'))
+    if not tokens:
+        return None
+    token = tokens[0]
+    if token.endswith("rsi"):
+        token = token[:-2] + "e"
+    if not token.endswith(("are", "ere", "ire")):
+        return None
+    stem = token[:-3]
+    if stem.endswith(("ci", "gi")):
+        # cominciare → comincerò
+        stem = stem[:-1]
+    return stem if len(stem) >= 3 else None
+
+
+def blank_span(italian, word):
+    """例句中词汇出现的位置 [起, 止)（UTF-16 下标），找不到时返回 None"""
+    matches = list(_WORD.finditer(italian))
+    tokens = [m.group().lower() for m in matches]
+    headwords = sorted(headword_forms(word), key=len, reverse=True)
+    inflected = candidate_forms(word)
+    for forms in (headwords, [(form,) for form in inflected]):
+        for start in range(len(tokens)):
+            for form in forms:
+                if tuple(tokens[start:start + len(form)]) == form:
+                    begin = matches[start].start()
+                    end = matches[start + len(form) - 1].end()
+                    return [utf16_offset(italian, begin), utf16_offset(italian, end)]
+    stem = verb_stem(word)
+    if stem:
+        for match, token in zip(matches, tokens):
+            if token.startswith(stem) and len(token) > len(stem) + 1:
+                return [utf16_offset(italian, match.start()), utf16_offset(italian, match.end())]
+    return None
+
+
+def structure_example(example, separator, word=None):
+    if isinstance(example, dict):
+        italian = example.get('italian') or ''
+        chinese = example.get('chinese') or ''
+    else:
+        italian, chinese = split_example(example, separator)
+    structured = {'italian': italian, 'chinese': chinese}
+    if word is not None:
+        span = blank_span(italian, word)
+        if span:
+            structured['blank'] = span
+    return structured
+
+
+def example_fields(word):
+    """构建时写入词汇的字段"""
+    if 'examples' not in word:
+        return {}
+    return {'examples': [structure_example(e, WORD_SEPARATOR, word) for e in word['examples'] or ()]}
+
+
+def phrase_example_fields(phrase):
+    """构建时写入常用语的字段"""
+    if 'examples' not in phrase:
+        return {}
+    return {'examples': [structure_example(e, PHRASE_SEPARATOR) for e in phrase['examples'] or ()]}
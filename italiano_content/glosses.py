@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+对话逐词标注的共享词表
+
+daily_conversations.json 中每条消息的 words 都是完整的标注对象
+（text、translation、type、phonetic），"un"、"e"、逗号、句号这类
+常见的词在整个文件里重复上百次。派生输出
+daily_conversations.packed.json（紧凑 JSON，只给程序读）把相同的
+标注只保存一次：
+
+  glosses        标注对象表，按首次出现的顺序
+  conversations  与 daily_conversations.json 相同，只是每条消息的 words
+                 换成 glosses 的下标列表
+
+应用只读这个文件（daily_conversations.json 是开发格式，不打包），先把
+glosses 解析成对象，消息直接按下标共享同一个对象。
+unpack(pack(conversations)) == conversations，生成时即做往返校验。
+"""
+
+import json
+
+PACKED_FILE = "daily_conversations.packed.json"
+
+
+def gloss_key(token):
+    return json.dumps(token, ensure_ascii=False, sort_keys=True)
+
+
+def pack(conversations):
+    glosses = []
+    index = {}
+    packed = []
+    for conversation in conversations:
+        messages = []
+        for message in conversation.get('messages') or ():
+            refs = []
+            for token in message.get('words') or ():
+                key = gloss_key(token)
+                if key not in index:
+                    index[key] = len(glosses)
+                    glosses.append(token)
+                refs.append(index[key])
+            messages.append({**message, 'words': refs} if 'words' in message else message)
+        packed.append({**conversation, 'messages': messages} if 'messages' in conversation else conversation)
+    return {'glosses': glosses, 'conversations': packed}
+
+
+def unpack(packed):
+    glosses = packed['glosses']
+    conversations = []
+    for conversation in packed['conversations']:
+        if 'messages' in conversation:
+            messages = [
+                {**message, 'words': [glosses[ref] for ref in message['words']]} if 'words' in message else message
+                for message in conversation['messages']
+            ]
+            conversation = {**conversation, 'messages': messages}
+        conversations.append(conversation)
+    return conversations
+
+
+def render_glosses(docs):
+    conversations = docs['conversations']
+    packed = pack(conversations)
+    if unpack(packed) != conversations:
+        raise ValueError(f"{PACKED_FILE} 往返校验失败")
+    return {PACKED_FILE: json.dumps(packed, ensure_ascii=False, separators=(',', ':'))}
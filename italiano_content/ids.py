@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+记录ID分配
+
+ID 台账 id_ledger.json（随代码提交）记录每个编号序列的下一个可用编号，
+以及每个批次预留的编号区间：
+
+  {序列名: {asset, prefix, width, next, ranges: {批次名: [[起, 止], ...]}}}
+
+新批次用 python -m italiano_content ids reserve <序列> <批次> <数量> 预留区间，
+只读写台账、不扫描资源文件；批次模块不写 FIRST_ID 时从台账区间的起点
+自动编号。多人同时添加批次时各自拿到不重叠的区间，合并分支时台账冲突
+会在 git 中直接暴露。构建时检查每个批次的ID都落在自己的区间内，
+ids check 额外检查各资源之间的ID冲突。
+"""
+
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+LEDGER_PATH = Path(__file__).resolve().parent / "id_ledger.json"
+
+# 台账中表示历史记录（批次化之前写入的内容）的区间
+LEGACY = "legacy"
+
+
+class Sequence:
+    """一个编号序列：ID 为 prefix + 补零到 width 位的编号"""
+
+    def __init__(self, name, asset, prefix='', width=0, next=1, ranges=None):
+        self.name = name
+        self.asset = asset
+        self.prefix = prefix
+        self.width = width
+        self.next = next
+        self.ranges = ranges or {}
+        self._pattern = re.compile(re.escape(prefix) + r'(\d+)$')
+
+    def format(self, number):
+        return f"{self.prefix}{number:0{self.width}d}"
+
+    def number(self, record_id):
+        """ID 对应的编号，不属于本序列时返回 None"""
+        match = self._pattern.match(record_id)
+        return int(match.group(1)) if match else None
+
+    def owner(self, number):
+        for batch_name, ranges in self.ranges.items():
+            if any(start <= number <= end for start, end in ranges):
+                return batch_name
+        return None
+
+    def to_json(self):
+        return {
+            'asset': self.asset,
+            'prefix': self.prefix,
+            'width': self.width,
+            'next': self.next,
+            'ranges': self.ranges,
+        }
+
+
+class Ledger:
+    """ID 台账"""
+
+    def __init__(self, sequences, path=LEDGER_PATH):
+        self.sequences = sequences
+        self.path = Path(path)
+
+    @classmethod
+    def load(cls, path=LEDGER_PATH):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        return cls({name: Sequence(name, **entry) for name, entry in data.items()}, path)
+
+    def save(self):
+        temp = self.path.with_name(self.path.name + '.tmp')
+        with open(temp, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({name: seq.to_json() for name, seq in self.sequences.items()},
+                               ensure_ascii=False, indent=2) + '\n')
+        os.replace(temp, self.path)
+
+    def for_batch(self, batch):
+        """批次所在的序列（台账里为它预留过区间的那个），没有时返回 None"""
+        for sequence in self.sequences.values():
+            if sequence.asset == batch.asset and batch.name in sequence.ranges:
+                return sequence
+        return None
+
+    def bind(self, batch):
+        """批次没有写 FIRST_ID 时，从台账区间起点按序列格式自动编号"""
+        sequence = self.for_batch(batch)
+        if sequence is not None and batch.first_id is None:
+            batch.first_id = sequence.ranges[batch.name][0][0]
+            batch.id_format = sequence.format
+
+    def check(self, batch, ids):
+        """批次的ID必须落在台账为它预留的区间内"""
+        sequence = self.for_batch(batch)
+        if sequence is None:
+            raise ValueError(f"批次 {batch.name} 没有在 ID 台账中预留区间，"
+                             f"请先运行 python -m italiano_content ids reserve")
+        for record_id in ids:
+            number = sequence.number(record_id)
+            owner = sequence.owner(number) if number is not None else None
+            if owner != batch.name:
+                where = f"属于 {owner}" if owner else "不在任何预留区间内"
+                raise ValueError(f"批次 {batch.name} 的 ID {record_id} {where}")
+
+    def reserve(self, sequence_name, batch_name, count):
+        """为批次预留 count 个连续编号，返回 (起, 止)"""
+        sequence = self.sequences.get(sequence_name)
+        if sequence is None:
+            raise ValueError(f"未知的编号序列: {sequence_name} (可选: {', '.join(self.sequences)})")
+        if count < 1:
+            raise ValueError("预留数量必须大于 0")
+        for other in self.sequences.values():
+            if batch_name in other.ranges and other is not sequence:
+                raise ValueError(f"批次 {batch_name} 已在序列 {other.name} 中预留过区间")
+        start, end = sequence.next, sequence.next + count - 1
+        sequence.ranges.setdefault(batch_name, []).append([start, end])
+        sequence.next = end + 1
+        return start, end
+
+
+@contextmanager
+def locked(path=LEDGER_PATH, timeout=10):
+    """独占台账：同一台机器上同时运行的 reserve 依次执行"""
+    lock = Path(str(path) + '.lock')
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                raise ValueError(f"ID 台账被占用，如无其他进程运行请删除 {lock}") from None
+            time.sleep(0.05)
+    try:
+        yield Ledger.load(path)
+    finally:
+        os.close(fd)
+        os.unlink(lock)
+
+
+def reserve(sequence_name, batch_name, count, path=LEDGER_PATH):
+    with locked(path) as ledger:
+        start, end = ledger.reserve(sequence_name, batch_name, count)
+        ledger.save()
+        sequence = ledger.sequences[sequence_name]
+        return sequence.format(start), sequence.format(end), start
+
+
+def find_collisions(ids_by_asset, ledger):
+    """ID 冲突检查，返回问题列表
+
+    ids_by_asset 为 {资源名: [ID, ...]}。检查同一资源内重复的ID、出现在多个
+    资源中的ID，以及编号序列中超出台账范围（未预留或 ≥ next）的ID。
+    """
+    problems = []
+    index = {}
+    for asset_name, ids in ids_by_asset.items():
+        for record_id in ids:
+            owner = index.get(record_id)
+            if owner == asset_name:
+                problems.append(f"{asset_name}: ID {record_id} 重复")
+            elif owner is not None:
+                problems.append(f"ID {record_id} 同时出现在 {owner} 和 {asset_name} 中")
+            else:
+                index[record_id] = asset_name
+
+    for sequence in ledger.sequences.values():
+        for record_id in ids_by_asset.get(sequence.asset, ()):
+            number = sequence.number(record_id)
+            if number is None:
+                continue
+            if number >= sequence.next:
+                problems.append(f"{sequence.asset}: ID {record_id} 超出台账下一个编号 {sequence.format(sequence.next)}")
+            elif sequence.owner(number) is None:
+                problems.append(f"{sequence.asset}: ID {record_id} 不在任何预留区间内")
+
+    for sequence in ledger.sequences.values():
+        spans = sorted((start, end, batch_name) for batch_name, ranges in sequence.ranges.items()
+                       for start, end in ranges)
+        for (_, end, first), (start, _, second) in zip(spans, spans[1:]):
+            if start <= end:
+                problems.append(f"序列 {sequence.name}: {first} 与 {second} 的区间重叠")
+    return problems
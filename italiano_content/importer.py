@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""
+从 CSV / TSV / YAML 表格批量导入词汇
+
+逐行读取表格，每行按表头映射到 create_word_data 的字段，补上计算字段
+（注音、结构化例句），随即校验、查重，通过的记录流式追加到
+sample_words.json 末尾。内存占用与表格行数无关，只有查重索引
+（已有词汇和已导入行的词形、释义）随词汇总数增长。
+
+  表头      不区分大小写和重音，可用英文字段名或中文列名（见 COLUMNS），
+            --map 列名=字段 指定其他列名；未识别的列忽略并报告
+  例句      一个单元格中用 | 分隔多条，每条为 "意大利语 - 中文"；
+            YAML 中也可以直接写列表
+  默认值    表格中没有等级、类别列（或单元格为空）时使用 --level、--category
+  YAML      每个文档是一行（映射）或若干行（映射的列表）；一个文档只在
+            读到时整体解析，大文件请每行一个文档（用 --- 分隔）
+  查重      与 dedup 相同：词形相同且释义有交集视为重复，跳过；
+            同形异义词照常导入
+  ID        导入批次在 ID 台账的 words 序列中预留区间（批次名默认为
+            import_<文件名>），写入期间独占台账
+
+默认只预演并报告各类行数和吞吐量，加 --write 才写入。
+"""
+
+import csv
+import time
+from pathlib import Path
+
+from .assets import ASSETS, DATA_DIR, LEVELS
+from .batch import created_at_text
+from .build import DERIVED_FIELDS, order_fields, source_date
+from .dedup import fold, glosses, lemma_key
+from .ids import LEDGER_PATH, Ledger, locked
+from .stream import RecordWriter, iter_records
+from .validate import CHECKS
+
+SEQUENCE = "words"
+
+# 字段 → 可识别的列名（比较时先 fold）
+COLUMNS = {
+    'italian': ("italian", "italiano", "word", "lemma", "意大利语", "单词"),
+    'chinese': ("chinese", "中文", "释义", "汉语"),
+    'english': ("english", "英文", "英语"),
+    'pronunciation': ("pronunciation", "ipa", "发音", "音标"),
+    'category': ("category", "类别", "分类"),
+    'level': ("level", "cefr", "等级"),
+    'examples': ("examples", "example", "例句"),
+}
+REQUIRED = ("italian", "chinese")
+
+# 与 a1_essential 批次的 DEFAULTS 相同
+DEFAULTS = {"audioUrl": "assets/audio/words/{id}.mp3", "imageUrl": None}
+
+EXAMPLE_SEPARATOR = "|"
+
+DELIMITERS = {'.csv': ',', '.tsv': '\t', '.tab': '\t'}
+YAML_SUFFIXES = ('.yaml', '.yml')
+
+_ALIASES = {fold(name): field for field, names in COLUMNS.items() for name in names}
+
+
+def map_columns(header, overrides=None):
+    """表头 → ({列下标: 字段}, 未识别的列名)"""
+    overrides = {fold(column): field for column, field in (overrides or {}).items()}
+    for field in overrides.values():
+        if field not in COLUMNS:
+            raise ValueError(f"未知字段: {field} (可选: {', '.join(COLUMNS)})")
+    mapping = {}
+    ignored = []
+    for i, name in enumerate(header):
+        key = fold(str(name))
+        field = overrides.get(key) or _ALIASES.get(key)
+        if field is None:
+            ignored.append(str(name))
+        elif field in mapping.values():
+            raise ValueError(f"列 {name} 与其他列都映射到字段 {field}")
+        else:
+            mapping[i] = field
+    missing = [field for field in REQUIRED if field not in mapping.values()]
+    if missing:
+        raise ValueError(f"表头缺少必需的列: {', '.join(missing)} (表头: {', '.join(map(str, header))})")
+    return mapping, ignored
+
+
+def read_table(path, delimiter, overrides=None):
+    """第一行为表头；先产出 (None, 未识别的列名)，再逐行产出 (行号, {字段: 值})"""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"{Path(path).name}: 文件为空")
+        mapping, ignored = map_columns(header, overrides)
+        yield None, ignored
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            yield reader.line_num, {field: row[i] for i, field in mapping.items() if i < len(row)}
+
+
+def read_yaml(path, overrides=None):
+    """逐个文档解析，产出 (行号, {字段: 值})，行号为第几个映射；最后产出 (None, 未识别的键)"""
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError("导入 YAML 需要安装 PyYAML: pip install pyyaml") from None
+    ignored = {}
+    number = 0
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        for doc in yaml.safe_load_all(f):
+            if doc is None:
+                continue
+            for item in doc if isinstance(doc, list) else [doc]:
+                number += 1
+                if not isinstance(item, dict):
+                    raise ValueError(f"{Path(path).name}: 第 {number} 行不是映射")
+                keys = list(item)
+                mapping, unknown = map_columns(keys, overrides)
+                ignored.update(dict.fromkeys(unknown))
+                yield number, {field: item[keys[i]] for i, field in mapping.items()}
+    yield None, list(ignored)
+
+
+def read_rows(path, delimiter=None, overrides=None):
+    """按扩展名选择读取方式，产出 (行号, {字段: 值})，其中有一项为 (None, 未识别的列名)"""
+    suffix = Path(path).suffix.lower()
+    if suffix in YAML_SUFFIXES:
+        return read_yaml(path, overrides)
+    delimiter = delimiter or DELIMITERS.get(suffix)
+    if delimiter is None:
+        raise ValueError(f"无法从扩展名 {suffix or '(无)'} 判断格式，请用 --delimiter 指定分隔符")
+    return read_table(path, delimiter, overrides)
+
+
+def cell_text(value):
+    if value is None:
+        return ''
+    return str(value).strip()
+
+
+def row_examples(value):
+    if isinstance(value, list):
+        parts = value
+    else:
+        parts = cell_text(value).replace('\n', EXAMPLE_SEPARATOR).split(EXAMPLE_SEPARATOR)
+    return [part if isinstance(part, dict) else cell_text(part) for part in parts
+            if isinstance(part, dict) or cell_text(part)]
+
+
+def row_record(row, defaults):
+    """表格行 → 词汇记录（不含 id、createdAt）"""
+    record = {field: cell_text(row.get(field)) for field in COLUMNS if field != 'examples'}
+    for field in ('category', 'level'):
+        if not record[field] and defaults.get(field):
+            record[field] = defaults[field]
+    record['level'] = record['level'].upper()
+    record['examples'] = row_examples(row.get('examples'))
+    for derive in DERIVED_FIELDS['words']:
+        record.update(derive(record))
+    return record
+
+
+class DuplicateIndex:
+    """词形 → 各记录的释义集合；与 dedup 的判断一致"""
+
+    def __init__(self):
+        self.senses = {}
+
+    def add(self, word, record_id):
+        self.senses.setdefault(lemma_key(word), []).append((glosses(word), record_id))
+
+    def find(self, word):
+        """返回与之重复的记录ID，没有时返回 None"""
+        found = glosses(word)
+        for senses, record_id in self.senses.get(lemma_key(word), ()):
+            if senses & found:
+                return record_id
+        return None
+
+
+class ImportReport:
+    def __init__(self, name, defaults):
+        self.name = name
+        self.defaults = defaults
+        self.rows = 0
+        self.imported = 0
+        self.duplicates = []
+        self.invalid = []
+        self.ignored = []
+        self.first_id = None
+        self.last_id = None
+        self.total = 0
+        self.seconds = 0.0
+        self.written = False
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def check_record(record, where):
+    errors = []
+    if CHECKS['words'](record, where, errors) is False:
+        errors.append(f"{where}: 记录应为对象")
+    return errors
+
+
+def import_rows(rows, index, sequence, start, created_at, report, source):
+    """校验、查重并编号，逐条产出可写入的记录"""
+    number = start
+    for line, row in rows:
+        if line is None:
+            report.ignored = row
+            continue
+        report.rows += 1
+        where = f"{source}:{line}"
+        record = row_record(row, report.defaults)
+        record_id = sequence.format(number)
+        record['id'] = record_id
+        record['createdAt'] = created_at
+        for key, value in DEFAULTS.items():
+            record.setdefault(key, value.replace('{id}', record_id) if isinstance(value, str) else value)
+        record = order_fields(record, ASSETS['words'].fields)
+        errors = check_record(record, where)
+        if errors:
+            report.invalid.append("; ".join(errors))
+            continue
+        duplicate = index.find(record)
+        if duplicate is not None:
+            report.duplicates.append(f"{where}: {record['italian']} 与 {duplicate} 重复")
+            continue
+        index.add(record, record_id)
+        if report.first_id is None:
+            report.first_id = record_id
+        report.last_id = record_id
+        report.imported += 1
+        number += 1
+        yield record
+
+
+def import_words(path, data_dir=DATA_DIR, write=False, name=None, level=None, category=None,
+                 delimiter=None, overrides=None, ledger_path=LEDGER_PATH):
+    """把表格中的词汇导入 sample_words.json，返回 ImportReport"""
+    path = Path(path)
+    if not path.is_file():
+        raise ValueError(f"找不到文件: {path}")
+    if level is not None and level.upper() not in LEVELS:
+        raise ValueError(f"未知等级: {level} (可选: {', '.join(LEVELS)})")
+    asset = ASSETS['words']
+    report = ImportReport(name or "import_" + path.stem, {'level': level, 'category': category})
+    moment = source_date()
+    created_at = created_at_text(moment)
+    started = time.perf_counter()
+
+    index = DuplicateIndex()
+    existing = 0
+    for word in iter_records(asset, data_dir):
+        index.add(word, word.get('id'))
+        existing += 1
+    rows = read_rows(path, delimiter, overrides)
+
+    if not write:
+        sequence = Ledger.load(ledger_path).sequences[SEQUENCE]
+        for _ in import_rows(rows, index, sequence, sequence.next, created_at, report, path.name):
+            pass
+        report.total = existing + report.imported
+        report.seconds = time.perf_counter() - started
+        return report
+
+    with locked(ledger_path) as ledger:
+        sequence = ledger.sequences[SEQUENCE]
+        if report.name in sequence.ranges:
+            raise ValueError(f"批次 {report.name} 已导入过，请用 --name 指定新的批次名")
+        try:
+            with RecordWriter(asset.path(data_dir), asset.records_key) as writer:
+                for word in iter_records(asset, data_dir):
+                    writer.write(word)
+                for record in import_rows(rows, index, sequence, sequence.next, created_at, report, path.name):
+                    writer.write(record)
+                report.total = writer.count
+                if not report.imported:
+                    # 没有可导入的行：放弃临时文件，资源文件保持不变
+                    raise NothingImported()
+        except NothingImported:
+            pass
+        else:
+            ledger.reserve(SEQUENCE, report.name, report.imported)
+            ledger.save()
+            report.written = True
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+class NothingImported(Exception):
+    pass
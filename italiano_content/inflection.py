@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+意大利语词形变化：由词头生成屈折形式
+
+规则按 sample_grammar.json 的 presente_indicativo 和 genere_numero：
+  名词    单复数（libro → libri，casa → case，amico → amici/amichi）
+  形容词  性和数四种形式（rosso → rossa, rossi, rosse）
+  动词    -are/-ere/-ire 直陈式现在时六个人称，-ire 另生成 -isc- 形式，
+          反身动词（svegliarsi）按去掉 si 的动词变位
+不规则动词和名词用例外表。规则会多生成一些不存在的形式（如 amichi），
+不存在的形式不会在文本中出现，无害；生成的形式小写、保留重音，
+与 lemmas.word_tokens 的分词一致。
+
+生成结果按词汇内容哈希缓存在缓存目录（默认 .content_cache，与构建清单
+相同，见 --cache-dir）的 inflections.json，只有新增或修改过的词汇才重新生成。
+"""
+
+import json
+import os
+from pathlib import Path
+
+from .lemmas import ARTICLES, word_tokens
+from .manifest import CACHE_DIR, content_hash
+
+CACHE_FILE = "inflections.json"
+# 规则或例外表变化时加一，旧缓存整体作废
+RULES_VERSION = 1
+
+IRREGULAR_VERBS = {
+    "essere": "sono sei è siamo siete",
+    "avere": "ho hai ha abbiamo avete hanno",
+    "andare": "vado vai va andiamo andate vanno",
+    "fare": "faccio fai fa facciamo fate fanno",
+    "stare": "sto stai sta stiamo state stanno",
+    "dare": "do dai dà diamo date danno",
+    "dire": "dico dici dice diciamo dite dicono",
+    "venire": "vengo vieni viene veniamo venite vengono",
+    "volere": "voglio vuoi vuole vogliamo volete vogliono",
+    "potere": "posso puoi può possiamo potete possono",
+    "dovere": "devo devi deve dobbiamo dovete devono",
+    "sapere": "so sai sa sappiamo sapete sanno",
+    "uscire": "esco esci esce usciamo uscite escono",
+    "bere": "bevo bevi beve beviamo bevete bevono",
+    "rimanere": "rimango rimani rimane rimaniamo rimanete rimangono",
+    "tenere": "tengo tieni tiene teniamo tenete tengono",
+    "piacere": "piaccio piaci piace piacciamo piacete piacciono",
+    "sedere": "siedo siedi siede sediamo sedete siedono",
+    "salire": "salgo sali sale saliamo salite salgono",
+    "scegliere": "scelgo scegli sceglie scegliamo scegliete scelgono",
+    "tradurre": "traduco traduci traduce traduciamo traducete traducono",
+    "proporre": "propongo proponi propone proponiamo proponete propongono",
+    "porre": "pongo poni pone poniamo ponete pongono",
+    "morire": "muoio muori muore moriamo morite muoiono",
+}
+
+IRREGULAR_NOUNS = {
+    "uomo": "uomini",
+    "uovo": "uova",
+    "mano": "mani",
+    "dio": "dei",
+    "moglie": "mogli",
+    "ala": "ali",
+    "arma": "armi",
+    "bue": "buoi",
+    "tempio": "templi",
+    "dito": "dita",
+    "labbro": "labbra",
+    "braccio": "braccia",
+    "ginocchio": "ginocchia",
+    "orecchio": "orecchie",
+    "osso": "ossa",
+    "paio": "paia",
+}
+
+VERB_ENDINGS = {
+    "are": ("o", "i", "a", "iamo", "ate", "ano"),
+    "ere": ("o", "i", "e", "iamo", "ete", "ono"),
+    "ire": ("o", "i", "e", "iamo", "ite", "ono"),
+}
+ISC_ENDINGS = ("isco", "isci", "isce", "iscono")
+
+# 这些类别的词按形容词变化（颜色词 rosso → rossa）
+ADJECTIVE_CATEGORIES = frozenset(("形容词", "颜色"))
+
+# 复合动词按同一后缀的动词变位：comporre → compongo，produrre → produco，ottenere → ottengo
+COMPOUND_VERBS = (("porre", "porre"), ("durre", "tradurre"), ("tenere", "tenere"), ("venire", "venire"))
+
+
+def conjugate(infinitive):
+    """直陈式现在时，infinitive 已小写"""
+    if infinitive in IRREGULAR_VERBS:
+        return IRREGULAR_VERBS[infinitive].split()
+    for suffix, model in COMPOUND_VERBS:
+        if infinitive.endswith(suffix):
+            prefix = infinitive[:-len(suffix)]
+            skip = len(model) - len(suffix)
+            return [prefix + form[skip:] for form in IRREGULAR_VERBS[model].split()]
+    ending = infinitive[-3:]
+    if ending not in VERB_ENDINGS or len(infinitive) < 4:
+        return []
+    stem = infinitive[:-3]
+    forms = [stem + e for e in VERB_ENDINGS[ending]]
+    if ending == "are":
+        if stem.endswith(("c", "g")):
+            # cercare → cerchi, cerchiamo
+            forms += [stem + "hi", stem + "hiamo"]
+        if stem.endswith("i"):
+            # mangiare → mangi, mangiamo
+            forms += [stem[:-1] + "i", stem[:-1] + "iamo"]
+    if ending == "ire":
+        # capire → capisco ...
+        forms += [stem + e for e in ISC_ENDINGS]
+    return forms
+
+
+def plural(noun):
+    """名词复数（可能给出多个候选）"""
+    if noun in IRREGULAR_NOUNS:
+        return [IRREGULAR_NOUNS[noun]]
+    if noun.endswith(("co", "go")):
+        return [noun[:-1] + "hi", noun[:-1] + "i"]
+    if noun.endswith(("ca", "ga")):
+        return [noun[:-1] + "he"]
+    if noun.endswith(("cia", "gia")):
+        return [noun[:-1] + "e", noun[:-2] + "e"]
+    if noun.endswith("io"):
+        return [noun[:-1], noun[:-2] + "i"]
+    if noun.endswith("o") or noun.endswith("e"):
+        return [noun[:-1] + "i"]
+    if noun.endswith("a"):
+        # casa → case；problema、poeta 等阳性 -a 复数为 -i
+        return [noun[:-1] + "e", noun[:-1] + "i"]
+    return []
+
+
+def adjective_forms(adjective):
+    """形容词的阴性和复数形式"""
+    if adjective.endswith("o"):
+        feminine = adjective[:-1] + "a"
+        return [feminine] + plural(adjective) + plural(feminine)
+    return plural(adjective)
+
+
+def is_verb(word, token):
+    english = (word.get('english') or '').lower()
+    return english.startswith("to ") and token.endswith(("are", "ere", "ire", "rre", "arsi", "ersi", "irsi", "rsi"))
+
+
+def invariable(text):
+    """以重音元音或辅音结尾的词（città、caffè、autobus、bar）不变"""
+    last = text.strip().lower()[-1:]
+    return not last or last in "àèéìòóù" or last not in "aeiou"
+
+
+def inflect(word):
+    """词汇的屈折形式（不含词头本身），每个形式是一个小写的词"""
+    tokens = word_tokens(word.get('italian'))
+    if len(tokens) > 1 and tokens[0] in ARTICLES:
+        tokens = tokens[1:]
+    if len(tokens) != 1:
+        return []
+    token = tokens[0]
+    if is_verb(word, token):
+        if token.endswith("rsi"):
+            token = token[:-2] + "e"
+        forms = conjugate(token)
+    elif invariable(word.get('italian') or ''):
+        forms = []
+    elif word.get('category') in ADJECTIVE_CATEGORIES:
+        forms = adjective_forms(token)
+    else:
+        forms = plural(token)
+    return sorted({form for form in forms if form != token})
+
+
+def word_key(word):
+    return content_hash([word.get('italian'), word.get('english'), word.get('category')])
+
+
+def inflection_forms(words, cache_dir=CACHE_DIR):
+    """所有词汇的屈折形式 {词汇ID: [形式, ...]}，未变化的词汇直接取缓存"""
+    cache_path = Path(cache_dir) / CACHE_FILE
+    cached = {}
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == RULES_VERSION:
+            cached = data['words']
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+
+    result = {}
+    entries = {}
+    changed = False
+    for word in words:
+        key = word_key(word)
+        entry = cached.get(word['id'])
+        if entry is None or entry[0] != key:
+            entry = [key, inflect(word)]
+            changed = True
+        entries[word['id']] = entry
+        result[word['id']] = entry[1]
+    if changed or len(entries) != len(cached):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp = cache_path.with_name(cache_path.name + '.tmp')
+        with open(temp, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'version': RULES_VERSION, 'words': entries}, ensure_ascii=False))
+        os.replace(temp, cache_path)
+    return result
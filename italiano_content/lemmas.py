@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+词形表：把文本中的词（或连续几个词）对应到词汇ID
+
+词汇的每个词头小写后分词（保留重音，là 和 la、è 和 e 是不同的词），
+作为键登记到哈希表，
+多词词头（per favore、l'anno prossimo）按词序列登记；带冠词的词头
+（il sole、la pioggia）同时登记去掉冠词的形式。同一个形式可以对应多个
+词汇ID（重复词条、同形异义词）。
+
+屈折形式（见 inflection.py）只补充词头没有占用的形式：parte 是名词
+词头时，不再作为 partire 的变位对应到 partire。
+"""
+
+import re
+
+_WORD = re.compile(r"[^\W_]+")
+
+ARTICLES = frozenset(("il", "lo", "la", "i", "gli", "le", "l", "un", "uno", "una"))
+
+
+def word_tokens(text):
+    """小写后按非字母数字切分：L'acqua è → [l, acqua, è]"""
+    return _WORD.findall((text or '').lower())
+
+
+def headword_forms(word):
+    """词头本身可能出现在文本中的形式：[(词, ...), ...]"""
+    tokens = tuple(word_tokens(word.get('italian')))
+    if not tokens:
+        return []
+    forms = [tokens]
+    if len(tokens) > 1 and tokens[0] in ARTICLES:
+        forms.append(tokens[1:])
+    return forms
+
+
+class LemmaTable:
+    """形式（词元组）→ 词汇ID列表"""
+
+    def __init__(self):
+        self.forms = {}
+        self.longest = 1
+
+    def add(self, form, word_id):
+        ids = self.forms.setdefault(form, [])
+        if word_id not in ids:
+            ids.append(word_id)
+        self.longest = max(self.longest, len(form))
+
+    @classmethod
+    def from_words(cls, words, inflections=None):
+        """inflections 为 {词汇ID: [屈折形式, ...]}"""
+        table = cls()
+        for word in words:
+            for form in headword_forms(word):
+                table.add(form, word['id'])
+        headwords = set(table.forms)
+        for word_id, forms in (inflections or {}).items():
+            for form in forms:
+                if (form,) not in headwords:
+                    table.add((form,), word_id)
+        return table
+
+    def match(self, tokens):
+        """找出词序列中所有能对应到词汇的片段，生成 (起, 止, [词汇ID])"""
+        tokens = tuple(tokens)
+        for start in range(len(tokens)):
+            for end in range(start + 1, min(start + self.longest, len(tokens)) + 1):
+                ids = self.forms.get(tokens[start:end])
+                if ids:
+                    yield start, end, ids
+
+    def resolve(self, text):
+        """文本中出现的所有词汇ID（按首次出现的顺序）"""
+        found = {}
+        for _, _, ids in self.match(word_tokens(text)):
+            for word_id in ids:
+                found.setdefault(word_id, None)
+        return list(found)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+词汇的语境反向索引
+
+把对话消息、阅读文章和其他词汇的例句逐词对应到词汇ID（见 lemmas.py，
+包括 inflection.py 生成的屈折形式），
+输出 words/contexts.json（紧凑 JSON），写到派生输出目录 build/content：
+  conversations  对话ID表，下标即对话编号
+  passages       文章ID表
+  words          {词汇ID: {c: [[对话编号, 消息下标], ...],
+                           p: [文章编号, ...],
+                           e: [[词汇ID, 例句下标], ...]}}
+没有出现在任何语境中的词汇不列出，空的键省略。应用目前没有查看语境的
+界面，这个索引只给工具和内容编辑用，不打包进应用（见 stages.py）。
+"""
+
+import json
+
+from .inflection import inflection_forms
+from .lemmas import LemmaTable, word_tokens
+from .manifest import CACHE_DIR
+
+CONTEXTS_FILE = "words/contexts.json"
+
+
+def example_text(example):
+    if isinstance(example, dict):
+        return example.get('italian') or ''
+    return example.split(' - ')[0]
+
+
+def message_tokens(message):
+    """消息的词：优先用逐词标注（跳过标点），没有时按原文分词"""
+    words = message.get('words')
+    if not words:
+        return word_tokens(message.get('italian'))
+    tokens = []
+    for word in words:
+        if not word.get('isPunctuation'):
+            tokens.extend(word_tokens(word.get('text')))
+    return tokens
+
+
+def build_contexts(words, conversations, passages, table=None, cache_dir=CACHE_DIR):
+    table = table or LemmaTable.from_words(words, inflection_forms(words, cache_dir))
+    contexts = {}
+
+    def entry(word_id, kind):
+        return contexts.setdefault(word_id, {}).setdefault(kind, [])
+
+    for c, conversation in enumerate(conversations):
+        for m, message in enumerate(conversation.get('messages') or ()):
+            seen = set()
+            for _, _, ids in table.match(message_tokens(message)):
+                for word_id in ids:
+                    if word_id not in seen:
+                        seen.add(word_id)
+                        entry(word_id, 'c').append([c, m])
+    for p, passage in enumerate(passages):
+        for word_id in table.resolve(passage.get('content')):
+            entry(word_id, 'p').append(p)
+    for word in words:
+        for k, example in enumerate(word.get('examples') or ()):
+            for word_id in table.resolve(example_text(example)):
+                # 词汇自己的例句已经和词汇放在一起，不再列出
+                if word_id != word['id']:
+                    entry(word_id, 'e').append([word['id'], k])
+
+    order = {word['id']: i for i, word in enumerate(words)}
+    return {
+        'conversations': [conversation['id'] for conversation in conversations],
+        'passages': [passage['id'] for passage in passages],
+        'words': {word_id: contexts[word_id] for word_id in sorted(contexts, key=order.get)},
+    }
+
+
+def render_contexts(docs, cache_dir=CACHE_DIR):
+    index = build_contexts(docs['words'], docs['conversations'], docs['passages'], cache_dir=cache_dir)
+    return {CONTEXTS_FILE: json.dumps(index, ensure_ascii=False, separators=(',', ':'))}
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+构建清单：记录每个批次记录和每个资源记录的内容哈希
+
+清单保存在 .content_cache/build_manifest.json（不提交），内容包括：
+  batches  {批次名: {记录ID: 源记录哈希}}
+  assets   {资源名: {size, mtime_ns, sha, records: {记录ID: [哈希, 起, 止]}}}
+  stages   {阶段名: {inputs: 输入哈希, outputs: [输出文件, ...]}}
+资源文件的大小和修改时间与清单一致时，直接信任其中的记录位置，
+无需解析整个 JSON。
+
+批次记录和阶段输入的哈希都包含生成代码的版本（code_version：相关模块
+源码的哈希），修改计算字段或渲染规则后对应的记录和输出会重新生成。
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+
+from .assets import ROOT
+
+CACHE_DIR = ROOT / ".content_cache"
+MANIFEST_VERSION = 1
+
+
+def content_hash(value):
+    """值的内容哈希（键顺序无关）"""
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.blake2b(value.encode('utf-8'), digest_size=10).hexdigest()
+
+
+def package_modules(module):
+    """模块直接引用的本包模块（导入的模块，或导入的函数、类所在的模块）"""
+    package = __name__.rpartition('.')[0] + '.'
+    for value in vars(module).values():
+        name = value.__name__ if isinstance(value, ModuleType) else getattr(value, '__module__', None)
+        if isinstance(name, str) and name.startswith(package):
+            yield sys.modules[name]
+
+
+def code_version(*functions):
+    """函数所在模块及其递归引用的本包模块的源码哈希"""
+    sources = {}
+    pending = [sys.modules[function.__module__] for function in functions]
+    while pending:
+        module = pending.pop()
+        if module.__name__ not in sources:
+            sources[module.__name__] = Path(module.__file__).read_text(encoding='utf-8')
+            pending.extend(package_modules(module))
+    return content_hash([sources[name] for name in sorted(sources)])
+
+
+class Manifest:
+    """构建清单"""
+
+    def __init__(self, path, data=None):
+        self.path = Path(path)
+        data = data or {}
+        if data.get('version') != MANIFEST_VERSION:
+            data = {}
+        self.batches = data.get('batches', {})
+        self.assets = data.get('assets', {})
+        self.stages = data.get('stages', {})
+
+    @classmethod
+    def load(cls, cache_dir=CACHE_DIR):
+        path = Path(cache_dir) / "build_manifest.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(path, json.load(f))
+        except (FileNotFoundError, ValueError):
+            return cls(path)
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'version': MANIFEST_VERSION,
+            'batches': self.batches,
+            'assets': self.assets,
+            'stages': self.stages,
+        }
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+
+    def asset_entry(self, asset, data_dir):
+        """资源文件与清单一致时返回其条目，否则返回 None"""
+        entry = self.assets.get(asset.name)
+        if not entry:
+            return None
+        try:
+            stat = os.stat(asset.path(data_dir))
+        except FileNotFoundError:
+            return None
+        if (stat.st_size, stat.st_mtime_ns) == (entry['size'], entry['mtime_ns']):
+            return entry
+        # 修改时间变了（例如 git checkout）但内容相同时仍然可用
+        if stat.st_size == entry['size'] and content_hash(asset.read_text(data_dir)) == entry['sha']:
+            entry['mtime_ns'] = stat.st_mtime_ns
+            return entry
+        return None
+
+    def record_asset(self, asset, data_dir, text, ids, spans):
+        """写入资源文件后记录其状态与每条记录的位置"""
+        stat = os.stat(asset.path(data_dir))
+        self.assets[asset.name] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha': content_hash(text),
+            'records': {
+                record_id: [content_hash(text[start:end]), start, end]
+                for record_id, (start, end) in zip(ids, spans)
+            },
+        }
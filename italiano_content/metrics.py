@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+阅读文章指标
+
+每篇文章只分词一次（lemmas.word_tokens），同时得到：
+  词数        含字母的词（l'acqua 算 l 和 acqua 两个词，纯数字不算）
+  不同词元    词对应到词汇表（含屈折形式，见 inflection.py）后按词汇计，
+              未收录的词按词形计
+  句数        按句末标点和换行切分后含词的片段（标题、列表项各算一句）
+  阅读时间    按文章等级的学习者阅读速度估算，向上取整到分钟
+  等级覆盖    收录的词中各 CEFR 等级词汇所占比例，以及未收录词的比例
+
+实测难度取能覆盖 90% 收录词的最低等级，与文章声明的 level 不一致时标出。
+wordCount 和 estimatedMinutes 由构建时按 reading_fields 计算写入，
+不再在批次中手填；python -m italiano_content passages --write 可以把
+已有文章的这两个字段一并更新。
+"""
+
+import math
+import re
+
+from .assets import LEVELS
+from .dedup import level_rank
+from .inflection import inflection_forms
+from .lemmas import LemmaTable, word_tokens
+from .manifest import CACHE_DIR
+
+# 各等级学习者每分钟阅读的词数
+READING_SPEED = {"A1": 50, "A2": 70, "B1": 90, "B2": 110, "C1": 130, "C2": 150}
+# 收录词中达到这个比例的最低等级算作实测难度
+COVERAGE_TARGET = 0.9
+
+_SENTENCE_END = re.compile(r"[.!?…]+|\n")
+_LETTER = re.compile(r"[^\W\d_]")
+
+
+def words_of(text):
+    return [token for token in word_tokens(text) if _LETTER.search(token)]
+
+
+def count_sentences(text):
+    return sum(1 for part in _SENTENCE_END.split(text or '') if words_of(part))
+
+
+def reading_minutes(word_count, level):
+    return max(1, math.ceil(word_count / READING_SPEED.get(level, READING_SPEED["A2"])))
+
+
+def reading_fields(passage):
+    """构建时写入文章的字段"""
+    word_count = len(words_of(passage.get('content')))
+    return {
+        'wordCount': word_count,
+        'estimatedMinutes': reading_minutes(word_count, passage.get('level')),
+    }
+
+
+def measured_level(counts, target=COVERAGE_TARGET):
+    """counts[i] 为 LEVELS[i] 等级的收录词数，返回覆盖率达到 target 的最低等级"""
+    known = sum(counts)
+    if not known:
+        return None
+    covered = 0
+    for rank, count in enumerate(counts):
+        covered += count
+        if covered >= target * known:
+            return LEVELS[rank]
+    return LEVELS[-1]
+
+
+def analyze_passages(passages, words, table=None, cache_dir=CACHE_DIR):
+    """所有文章的指标，每篇文章一个字典，顺序与 passages 相同"""
+    table = table or LemmaTable.from_words(words, inflection_forms(words, cache_dir))
+    ranks = {word['id']: level_rank(word['level']) for word in words}
+    results = []
+    for passage in passages:
+        tokens = words_of(passage.get('content'))
+        lemmas = set()
+        counts = [0] * len(LEVELS)
+        unknown = 0
+        for token in tokens:
+            ids = table.forms.get((token,))
+            if not ids:
+                unknown += 1
+                lemmas.add(token)
+                continue
+            lemmas.add(ids[0])
+            rank = min(ranks[word_id] for word_id in ids)
+            if rank < len(LEVELS):
+                counts[rank] += 1
+        total = len(tokens) or 1
+        level = passage.get('level')
+        measured = measured_level(counts)
+        results.append({
+            'id': passage['id'],
+            'level': level,
+            'wordCount': len(tokens),
+            'uniqueLemmas': len(lemmas),
+            'sentences': count_sentences(passage.get('content')),
+            'estimatedMinutes': reading_minutes(len(tokens), level),
+            'coverage': {LEVELS[rank]: count / total for rank, count in enumerate(counts) if count},
+            'unknown': unknown / total,
+            'measuredLevel': measured,
+            'mismatch': measured is not None and measured != level,
+        })
+    return results
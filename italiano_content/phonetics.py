@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+意大利语字母到音素的转换（G2P）
+
+按规则把意大利语拼写转成 IPA：
+  c/g       在 e、i 前为 tʃ/dʒ，ch/gh 为 k/g，ci/gi 后接元音时 i 不发音
+  sc        在 e、i 前为 ʃ，sch 为 sk
+  gli/gn    ʎ/ɲ，元音之间读作长辅音（ʎʎ、ɲɲ、ʃʃ）
+  z         词首为 dz，其余为 ts，元音之间总是长辅音（azione → atˈtsjoːne）
+  s         元音之间、浊辅音前为 z
+  qu        kw；n 在 k、g 前为 ŋ（bianco → ˈbjaŋko）
+  i/u       后接元音时为半元音 j/w（双音节词 mia、due 除外）；前面是 a/e/o 时
+            组成下降二合元音，不单独成音节（ˈbaita、ˈɛuro、vorˈrɛi）
+  双写辅音  长辅音（tt、ttʃ、ddʒ）
+重音：带重音符号的元音（città、caffè），否则倒数第二个音节，
+-abile/-ibile/-evole 等后缀为倒数第三个音节；重读开音节的元音加长音符号 ː
+（二合元音不加），单音节词不标重音。重音落在词尾二合元音上的词（vorrei、
+andrei）没有重音符号，靠提示。
+
+词汇重音和 e/o 的开闭（ɛ/ɔ）从拼写无法确定：已有的注音中标了重音或开口音时
+作为提示传入（见 hint），规则只统一其余部分的写法。没有标重音的注音不用来
+推断重音（其中的开口音不一定在重读音节上，如 kamɛra）。转换结果按（词, 提示）
+缓存，整个语料库重复的词只转换一次。
+
+生成的注音只用来补全缺失的值；已有的注音与之不同时只报告，不改写。
+
+三种输出格式与资源文件中的字段对应：
+  词汇 pronunciation   IPA，不加括号：ˈneːro
+  对话逐词 phonetic    IPA 加方括号：[ˈneːro]
+  常用语 phonetic      音节拼读，连字符分隔，重读音节大写：ke BEL-la jor-NA-ta
+"""
+
+import re
+from functools import lru_cache
+
+VOWELS = "aeiouɛɔ"
+ACCENTED = {"à": "a", "á": "a", "è": "ɛ", "é": "e", "ì": "i", "í": "i",
+            "ò": "ɔ", "ó": "o", "ù": "u", "ú": "u"}
+FRONT = "eièéìí"
+VOICED = ("b", "d", "g", "l", "m", "n", "r", "v", "dʒ", "dz")
+# 与后面的元音组成音节首的辅音 + 流音
+ONSET_CLUSTERS = {a + b for a in "pbtdkgfv" for b in "rl"}
+# 元音之间总是读作长辅音
+INHERENTLY_LONG = {"ʎ", "ɲ", "ʃ", "ts", "dz"}
+# 长辅音的前半部分：ttʃ = t + tʃ
+GEMINATE_HEAD = {"tʃ": "t", "dʒ": "d", "ts": "t", "dz": "d"}
+ANTEPENULTIMATE = ("abile", "ibile", "evole", "issimo", "issima", "esimo", "esima", "agine", "igine",
+                   "udine", "ologo", "ografo", "ereo")
+# 下降二合元音的第一个元音，后接不重读的 i、u：ai、ei、oi、au、eu
+DIPHTHONG_HEADS = "aeoɛɔ"
+SIMPLE = {"b": "b", "d": "d", "f": "f", "l": "l", "m": "m", "n": "n", "p": "p", "r": "r", "t": "t",
+          "v": "v", "k": "k", "j": "j", "w": "w", "y": "i", "x": "k s"}
+RESPELLING = {"tʃ": "ch", "dʒ": "j", "ʃ": "sh", "ʎ": "ly", "ɲ": "ny", "ŋ": "n", "j": "y",
+              "ɛ": "e", "ɔ": "o"}
+# 长辅音前半部分在音节尾的拼读：famiglia → fa-MIL-lya
+RESPELLING_CODA = {"ʎ": "l", "ɲ": "n", "ʃ": "s"}
+
+_WORD = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+
+
+def words_of(text):
+    """注音的单位：省略形式与后一个词连读（l'acqua → lacqua）"""
+    return [word.replace("'", "") for word in _WORD.findall((text or '').lower().replace("’", "'"))]
+
+
+def is_vowel(letter):
+    return bool(letter) and (letter in "aeiou" or letter in ACCENTED)
+
+
+def letters_to_phonemes(word, hiatus=False):
+    """[(音素, 是否重读元音)]；长辅音展开为两个音素（ttʃ = t + tʃ）
+
+    hiatus 为真时词尾的 -ia、-io 等保留为两个元音（farmacia、mio）
+    """
+    phonemes = []
+    i = 0
+    n = len(word)
+
+    def at(k):
+        return word[k] if 0 <= k < n else ""
+
+    def silent_i(k):
+        """k 处的 i 只表示前面的 c/g/sc 读软音（ciao、giorno、sciopero）"""
+        return at(k) == "i" and is_vowel(at(k + 1)) and not (hiatus and k + 2 == n)
+
+    def emit(phoneme, long=False):
+        if long:
+            phonemes.append((GEMINATE_HEAD.get(phoneme, phoneme), False))
+        phonemes.append((phoneme, False))
+
+    while i < n:
+        c = word[i]
+        long = not is_vowel(c) and (c == at(i + 1) or c + at(i + 1) == "cq")
+        if long:
+            i += 1
+            c = word[i]
+            # 词尾的双写辅音来自省略（dell'、all'），读单辅音
+            long = i + 1 < n
+        nxt = at(i + 1)
+        if is_vowel(c):
+            if c in "iu" and is_vowel(nxt) and not (hiatus and i + 2 == n):
+                # 半元音：ieri、piano、buono、uomo
+                phonemes.append(("j" if c == "i" else "w", False))
+            else:
+                phonemes.append((ACCENTED.get(c, c), c in ACCENTED))
+            i += 1
+        elif c in "cg" and nxt == "h":
+            emit("k" if c == "c" else "g", long)
+            i += 2
+        elif c == "g" and nxt == "n":
+            emit("ɲ")
+            i += 2
+        elif c == "g" and nxt == "l" and at(i + 2) == "i":
+            emit("ʎ")
+            # gli 后接元音时 i 不发音，否则读 ʎi
+            i += 3 if silent_i(i + 2) else 2
+        elif c in "cg" and nxt and nxt in FRONT:
+            emit("tʃ" if c == "c" else "dʒ", long)
+            i += 2 if silent_i(i + 1) else 1
+        elif c == "s" and nxt == "c" and at(i + 2) and at(i + 2) in FRONT:
+            emit("ʃ")
+            i += 3 if silent_i(i + 2) else 2
+        elif c == "q" and nxt == "u":
+            emit("k", long)
+            phonemes.append(("w", False))
+            i += 2
+        elif c in "cgq":
+            emit("g" if c == "g" else "k", long)
+            i += 1
+        elif c == "z":
+            emit("ts" if phonemes else "dz", long)
+            i += 1
+        elif c == "s":
+            emit("s", long)
+            i += 1
+        elif c in SIMPLE:
+            for part in SIMPLE[c].split():
+                emit(part, long)
+            i += 1
+        else:
+            i += 1
+    return assimilate(phonemes)
+
+
+def assimilate(phonemes):
+    """依赖前后音素的变化：元音间的长辅音、s 浊化、n 同化"""
+    result = []
+    for k, (phoneme, stressed) in enumerate(phonemes):
+        prev = result[-1][0] if result else ""
+        nxt = phonemes[k + 1][0] if k + 1 < len(phonemes) else ""
+        if (phoneme in INHERENTLY_LONG and prev and prev in VOWELS
+                and nxt and nxt in VOWELS + "jw"):
+            result.append((GEMINATE_HEAD.get(phoneme, phoneme), False))
+        elif phoneme == "s" and prev != "s" and nxt != "s" and (
+                (prev and prev in VOWELS and nxt and nxt in VOWELS + "jw") or nxt in VOICED):
+            phoneme = "z"
+        elif phoneme == "n" and nxt in ("k", "g"):
+            phoneme = "ŋ"
+        result.append((phoneme, stressed))
+    return result
+
+
+def nucleus_positions(phonemes, diphthongs=True):
+    """音节核心（元音）的位置；a/e/o 后的 i、u（baita、euro）和词尾元音后的
+    i、u（sei、mai、lui）与前一个元音组成二合元音，不单独成音节
+
+    diphthongs 为假时只合并词尾的二合元音（提示中分开读的 paˈura）
+    """
+    nuclei = []
+    for k, phoneme in enumerate(phonemes):
+        if phoneme not in VOWELS:
+            continue
+        if (diphthongs and phoneme in "iu" and nuclei and nuclei[-1] == k - 1
+                and phonemes[k - 1] in DIPHTHONG_HEADS):
+            continue
+        nuclei.append(k)
+    if len(nuclei) > 1 and nuclei[-1] == len(phonemes) - 1 == nuclei[-2] + 1 and phonemes[-1] in ("i", "u"):
+        nuclei.pop()
+    return nuclei
+
+
+def syllabify(phonemes, diphthongs=True):
+    """按元音切分音节：([[音素, ...], ...], 带重音符号的音节下标或 None)
+
+    元音之间的辅音中，最后一个辅音（连同其后的半元音、其前的塞音/擦音 + 流音
+    组合）归下一个音节，其余归前一个音节：mat.ti.na、pa.dre、pas.ta；
+    二合元音的 i、u 留在前一个音节：bai.ta
+    """
+    nuclei = nucleus_positions([phoneme for phoneme, _ in phonemes], diphthongs)
+    if not nuclei:
+        return [[phoneme for phoneme, _ in phonemes]], None
+    bounds = [0]
+    for a, b in zip(nuclei, nuclei[1:]):
+        between = [phoneme for phoneme, _ in phonemes[a + 1:b]]
+        onset = len(between)
+        while onset > 0 and between[onset - 1] in ("j", "w"):
+            onset -= 1
+        if onset > 0:
+            onset -= 1
+            if onset > 0 and between[onset - 1] + between[onset] in ONSET_CLUSTERS:
+                onset -= 1
+        bounds.append(a + 1 + onset)
+    bounds.append(len(phonemes))
+    syllables = [[phoneme for phoneme, _ in phonemes[s:e]] for s, e in zip(bounds, bounds[1:])]
+    marked = [k for k, (s, e) in enumerate(zip(bounds, bounds[1:])) if any(flag for _, flag in phonemes[s:e])]
+    return syllables, (marked[0] if marked else None)
+
+
+def is_diphthong(syllable):
+    """音节以二合元音结尾（bai、rei）"""
+    return len(syllable) > 1 and syllable[-1] in VOWELS and syllable[-2] in VOWELS
+
+
+def default_stress(word, syllables):
+    count = len(syllables)
+    if count >= 3 and word.endswith(ANTEPENULTIMATE):
+        return count - 3
+    return max(count - 2, 0)
+
+
+@lru_cache(maxsize=None)
+def transcribe_word(word, hint=None):
+    """一个词的音节和重音：(音节列表, 重读音节下标)
+
+    hint 为 parse_hint 的结果 (重读元音序号, 开口元音序号集合, 元音数)
+    """
+    phonemes = letters_to_phonemes(word)
+    nuclei = len(nucleus_positions([phoneme for phoneme, _ in phonemes]))
+    glide = any(phoneme in ("j", "w") for phoneme, _ in phonemes)
+    if (nuclei == 1 and glide and word[-2:-1] in ("i", "u") and word[-1] not in ACCENTED) or (
+            hint and hint[2] == nuclei + 1 and hint[0] == hint[2] - 2):
+        # mia、zio、due、io 的 i/u 自成音节；提示的重音落在词尾 -ia/-io 的 i 上时
+        # 读作两个音节（farmacia）
+        phonemes = letters_to_phonemes(word, hiatus=True)
+    syllables, marked = syllabify(phonemes)
+    if hint and hint[2] == len(syllables) + 1:
+        # 提示中分开读的元音（paˈura）不合并为二合元音
+        syllables, marked = syllabify(phonemes, diphthongs=False)
+    stress = default_stress(word, syllables) if marked is None else marked
+    if hint and hint[2] == len(syllables):
+        open_vowels = hint[1]
+        # 重音符号优先；不带重音符号的多音节词重音只在词尾二合元音上（vorrei）
+        # 才落在最后一个音节
+        final = len(syllables) if is_diphthong(syllables[-1]) else len(syllables) - 1
+        allowed = range(final) if marked is None else ()
+        if hint[0] in allowed:
+            stress = hint[0]
+    else:
+        open_vowels = ()
+    # 开口音只出现在重读音节
+    syllables = [list(syllable) for syllable in syllables]
+    for s, syllable in enumerate(syllables):
+        for k, phoneme in enumerate(syllable):
+            if s == stress and s in open_vowels and phoneme in "eo":
+                syllable[k] = "ɛ" if phoneme == "e" else "ɔ"
+            elif s != stress and phoneme in "ɛɔ":
+                syllable[k] = "e" if phoneme == "ɛ" else "o"
+    return tuple(tuple(syllable) for syllable in syllables), stress
+
+
+def word_ipa(syllables, stress):
+    if len(syllables) == 1:
+        return "".join(syllables[0])
+    parts = []
+    for s, syllable in enumerate(syllables):
+        text = "".join(syllable)
+        if s == stress:
+            # 重读开音节（不在词尾）的元音加长，二合元音不加
+            if s < len(syllables) - 1 and syllable[-1] in VOWELS and not is_diphthong(syllable):
+                text += "ː"
+            text = "ˈ" + text
+        parts.append(text)
+    return "".join(parts)
+
+
+def word_respelling(syllables, stress):
+    parts = []
+    for s, syllable in enumerate(syllables):
+        coda = syllable[-1] if syllable[-1] in RESPELLING_CODA else None
+        text = "".join(RESPELLING.get(phoneme, phoneme) for phoneme in (syllable[:-1] if coda else syllable))
+        if coda:
+            text += RESPELLING_CODA[coda]
+        parts.append(text.upper() if s == stress and len(syllables) > 1 else text)
+    return "-".join(parts)
+
+
+def parse_hint(ipa):
+    """从已有的 IPA 注音中取出每个词的 (重读元音序号, 开口元音序号集合, 元音数)"""
+    hints = []
+    for part in re.sub(r"[\[\]/.ːˌ]", "", ipa or '').split():
+        vowels = nucleus_positions(part)
+        mark = part.find("ˈ")
+        stress = None
+        if mark >= 0:
+            stress = sum(1 for position in vowels if position < mark)
+            if stress >= len(vowels):
+                stress = None
+        open_vowels = frozenset(k for k, position in enumerate(vowels) if part[position] in "ɛɔ")
+        hints.append((stress, open_vowels, len(vowels)))
+    return hints
+
+
+def stress_lexicon(words):
+    """从词汇的 pronunciation 中收集标了重音的词：{词: 提示}
+
+    对话和常用语中的词没有自己的 IPA 提示时，用词汇表中同一个词的重音
+    """
+    lexicon = {}
+    for word in words:
+        forms = words_of(word.get('italian'))
+        hints = parse_hint(word.get('pronunciation'))
+        if len(forms) == len(hints):
+            for form, hint in zip(forms, hints):
+                if hint[0] is not None:
+                    lexicon.setdefault(form, hint)
+    return lexicon
+
+
+def transcribe(text, existing=None, style="ipa", lexicon=None):
+    """把一段文字转成注音
+
+    existing 为已有的 IPA 注音，用作重音和开口音的提示；没有时查 lexicon
+    （见 stress_lexicon）。style: ipa（词汇）、bracket（对话逐词）、respelling（常用语）
+    """
+    words = words_of(text)
+    hints = parse_hint(existing) if existing and style != "respelling" else []
+    if len(hints) != len(words):
+        hints = [None] * len(words)
+    if lexicon:
+        hints = [hint if hint and hint[0] is not None else lexicon.get(word, hint)
+                 for word, hint in zip(words, hints)]
+    render = word_respelling if style == "respelling" else word_ipa
+    result = " ".join(render(*transcribe_word(word, hint)) for word, hint in zip(words, hints))
+    if style == "bracket":
+        return f"[{result}]" if result else ""
+    return result
+
+
+# 同一个音的不同写法
+EQUIVALENT = str.maketrans({"ɡ": "g", "ʧ": "tʃ", "ʤ": "dʒ", "ʦ": "ts", "ʣ": "dz", "ŋ": "n", "ɱ": "m",
+                            "ɑ": "a", "ɾ": "r"})
+
+
+def normalize(value):
+    """比较用的形式：去掉括号、音节点、长音符号，统一等价写法"""
+    value = re.sub(r"[\[\]/.ːˌ]", "", value or '').translate(EQUIVALENT)
+    return " ".join(value.lower().split())
+
+
+def compare(existing, generated, style="ipa"):
+    """same（完全一致）、format（只有写法不同）、different（读音不同）或 missing"""
+    if not existing:
+        return "missing"
+    if existing == generated:
+        return "same"
+    if style == "respelling":
+        # 拼读的大小写表示重音；保留原文的标点（ma ti PA-re?）
+        strip = re.compile(r"[?!.,]")
+        same = " ".join(strip.sub("", existing).split()) == " ".join(strip.sub("", generated).split())
+        return "same" if same else "different"
+    # 已有注音没有标重音而生成的标了（多音节词）：重音无法核对，按读音不同报告
+    if "ˈ" not in existing and "ˈ" in generated:
+        return "different"
+    if normalize(existing) == normalize(generated):
+        return "format"
+    return "different"
+
+
+def canonical(text, existing, style="ipa", lexicon=None):
+    """(应当写入的注音, 比较结果)：只补全缺失的注音；已有的注音（包括
+    只有写法不同的）保留原值，差异只报告，留给人工核对
+    """
+    generated = transcribe(text, existing, style, lexicon)
+    status = compare(existing, generated, style)
+    if status == "missing" and generated:
+        return generated, status
+    return existing, status
+
+
+def pronunciation_fields(word):
+    """构建时写入词汇的字段"""
+    value, _ = canonical(word.get('italian'), word.get('pronunciation'))
+    return {'pronunciation': value}
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+发布版资源输出
+
+应用打包的是 assets/bundle（pubspec.yaml 只登记这个目录），内容为派生阶段
+中 Stage.bundled 为真的输出：内容库、对话共享词表、分类表和干扰项池。这些
+文件生成时已是紧凑格式，这里从派生输出目录（build/content）原样复制。
+
+每个资源在应用中只有一个运行时来源：assets/data 下 indent=2 的开发格式资源
+不打包，各自由 SUPERSEDED 中的派生文件代替。体积报告把打包的文件与它们
+代替的开发格式资源对比。
+
+assets/bundle 是生成的目录，不提交：克隆后和内容变化后，flutter run / build
+之前先运行 build --release。应用启动时检查它是否存在（ContentDatabase.checkBundle）。
+"""
+
+from pathlib import Path
+
+from .assets import ASSETS, BUNDLE_DIR, DATA_DIR, DERIVED_DIR
+from .stages import STAGES, write_if_changed
+
+RELEASE_DIR = BUNDLE_DIR
+
+# 资源 → 应用运行时代替它读取的派生阶段；这些资源只在开发和工具中使用，不打包
+SUPERSEDED = {
+    'words': 'content_db',
+    'phrases': 'content_db',
+    'grammar': 'content_db',
+    'passages': 'content_db',
+    'conversations': 'glosses',
+}
+
+
+def release_files(manifest, derived_dir=DERIVED_DIR):
+    """发布版要输出的文件：[(阶段名, 源文件, 相对路径)]"""
+    files = []
+    for stage in STAGES:
+        if stage.bundled:
+            outputs = manifest.stages.get(stage.name, {}).get('outputs', ())
+            files.extend((stage.name, Path(derived_dir) / path, path) for path in outputs)
+    return files
+
+
+def emit_release(manifest, out_dir=RELEASE_DIR, dry_run=False, derived_dir=DERIVED_DIR):
+    """复制打包的文件，返回 [(阶段名, 相对路径, 字节数, 是否写入)]"""
+    out_dir = Path(out_dir)
+    report = []
+    files = release_files(manifest, derived_dir)
+    for stage, source, path in files:
+        with open(source, 'rb') as f:
+            data = f.read()
+        written = not dry_run and write_if_changed(out_dir / path, data)
+        report.append((stage, path, len(data), written))
+    if not dry_run:
+        # 删除不再生成或不再打包的旧文件
+        keep = {path for _, _, path in files}
+        for stale in out_dir.rglob('*'):
+            if stale.is_file() and stale.relative_to(out_dir).as_posix() not in keep:
+                stale.unlink()
+        for directory in sorted((path for path in out_dir.rglob('*') if path.is_dir()), reverse=True):
+            if not any(directory.iterdir()):
+                directory.rmdir()
+    return report
+
+
+def size_report(report, data_dir=DATA_DIR):
+    """按阶段汇总：[(阶段名, 打包字节数, 代替的资源文件名, 这些资源的开发格式字节数)]"""
+    sizes = {}
+    for stage, _, size, _ in report:
+        sizes[stage] = sizes.get(stage, 0) + size
+    rows = []
+    for stage, size in sizes.items():
+        replaced = [ASSETS[name] for name, by in SUPERSEDED.items() if by == stage]
+        dev_size = sum(asset.path(data_dir).stat().st_size for asset in replaced)
+        rows.append((stage, size, [asset.filename for asset in replaced], dev_size))
+    return rows
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+资源文件序列化
+
+输出与 json.dump(doc, ensure_ascii=False, indent=2) 相同，只是全为数字的
+数组写在一行（例句的填空位置 "blank": [3, 8]，不占四行），
+同时记下每条记录在文本中的位置，供增量构建只替换变化的记录。
+"""
+
+import json
+import re
+
+INDENT = 2
+
+# indent 输出中只含数字的数组；JSON 字符串里的换行会转义，不会匹配到字符串内容
+_NUMBER_ARRAY = re.compile(r'\[\n *(-?[\d.eE+-]+(?:,\n *-?[\d.eE+-]+)*)\n *\]')
+_ITEM_BREAK = re.compile(r',\n *')
+
+
+def inline_numbers(match):
+    return '[' + _ITEM_BREAK.sub(', ', match.group(1)) + ']'
+
+
+def render_value(value, depth=0):
+    """以 indent=2 序列化一个值（数字数组写在一行），depth 为其所在的嵌套层级"""
+    text = json.dumps(value, ensure_ascii=False, indent=INDENT)
+    if '[\n' in text:
+        text = _NUMBER_ARRAY.sub(inline_numbers, text)
+    if depth:
+        text = text.replace('\n', '\n' + ' ' * (INDENT * depth))
+    return text
+
+
+def record_depth(asset):
+    """记录在文档中的嵌套层级：顶层数组为1，挂在键下为2"""
+    return 1 if asset.records_key is None else 2
+
+
+def render_records(records, depth):
+    """序列化记录数组，返回 (文本, [(起, 止), ...])，位置相对数组文本"""
+    if not records:
+        return '[]', []
+    pad = ' ' * (INDENT * depth)
+    parts = ['[\n']
+    spans = []
+    offset = 2
+    for i, record in enumerate(records):
+        if i:
+            parts.append(',\n')
+            offset += 2
+        text = render_value(record, depth)
+        parts.append(pad)
+        offset += len(pad)
+        spans.append((offset, offset + len(text)))
+        parts.append(text)
+        offset += len(text)
+    parts.append('\n' + ' ' * (INDENT * (depth - 1)) + ']')
+    return ''.join(parts), spans
+
+
+def render_document(asset, doc):
+    """序列化整个文档，返回 (文本, 记录位置列表)"""
+    records = asset.records(doc)
+    depth = record_depth(asset)
+    body, spans = render_records(records, depth)
+    if asset.records_key is None:
+        return body, spans
+    # 其余键照常序列化，记录数组在 null 占位处代入后再平移位置
+    shell = render_value({**doc, asset.records_key: None})
+    start = shell.index(f'"{asset.records_key}": null') + len(asset.records_key) + 4
+    text = shell[:start] + body + shell[start + len('null'):]
+    return text, [(s + start, e + start) for s, e in spans]
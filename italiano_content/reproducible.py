@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+可复现构建检查
+
+把资源目录复制两份，各自删掉所有批次产生的记录（模拟从头重新生成这些
+批次），再用不同的 PYTHONHASHSEED 在子进程中各做一次确定性完整构建，
+逐个文件比较两次的输出。相同输入的两次构建必须逐字节一致；不一致的
+文件说明输出依赖了当前时间、集合的迭代顺序等构建以外的状态。
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from .assets import ASSETS, ROOT
+from .ids import Ledger
+from .render import render_document
+from .sources import load_batches
+
+HASH_SEEDS = ("1", "2")
+# 结果中派生输出（derived_dir 中的文件）加此前缀，与资源目录中的文件区分
+DERIVED_PREFIX = "derived/"
+
+
+def strip_batches(data_dir):
+    """删除资源文件中由批次产生的记录"""
+    ledger = Ledger.load()
+    by_asset = {}
+    for batch in load_batches():
+        ledger.bind(batch)
+        by_asset.setdefault(batch.asset, set()).update(record['id'] for record in batch.records())
+    for name, ids in by_asset.items():
+        asset = ASSETS[name]
+        doc = asset.load(data_dir)
+        records = asset.records(doc)
+        records[:] = [record for record in records if record['id'] not in ids]
+        text, _ = render_document(asset, doc)
+        asset.write_text(text, data_dir)
+
+
+def digest_tree(root):
+    root = Path(root)
+    return {
+        path.relative_to(root).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(root.rglob('*')) if path.is_file()
+    }
+
+
+def check_reproducible(data_dir, epoch):
+    """返回 (每次构建的 {文件: 哈希}, 两次不一致的文件列表)"""
+    results = []
+    with tempfile.TemporaryDirectory() as temp:
+        for seed in HASH_SEEDS:
+            run_dir = Path(temp) / f"run{seed}"
+            run_data = run_dir / "data"
+            shutil.copytree(data_dir, run_data)
+            strip_batches(run_data)
+            env = dict(os.environ, PYTHONHASHSEED=seed, SOURCE_DATE_EPOCH=str(epoch))
+            run_derived = run_dir / "derived"
+            process = subprocess.run(
+                [sys.executable, '-m', 'italiano_content', '--data-dir', str(run_data),
+                 '--cache-dir', str(run_dir / "cache"), '--derived-dir', str(run_derived),
+                 'build', '--full', '--deterministic'],
+                cwd=ROOT, env=env, capture_output=True, text=True,
+            )
+            if process.returncode:
+                output = process.stdout[-2000:] + process.stderr[-2000:]
+                raise ValueError(f"构建失败 (PYTHONHASHSEED={seed}):\n{output}")
+            digests = digest_tree(run_data)
+            digests.update({f"{DERIVED_PREFIX}{path}": digest for path, digest in digest_tree(run_derived).items()})
+            results.append(digests)
+    first, second = results
+    differing = sorted(path for path in set(first) | set(second) if first.get(path) != second.get(path))
+    return results, differing
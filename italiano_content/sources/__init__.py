@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+内容批次源
+
+每个模块是一个声明式批次（格式见 italiano_content.batch），
+按 SOURCES 的顺序应用；新增批次时把模块名追加到末尾。
+"""
+
+import importlib
+
+from ..batch import Batch
+
+SOURCES = [
+    "vocabulary_461_600",
+    "a1_basic",
+    "a2_basic",
+    "a1_essential",
+    "reading_011_020",
+]
+
+
+def load_batches(only=None):
+    """按顺序加载批次；only 为批次名集合时只加载其中的批次"""
+    batches = []
+    for name in SOURCES:
+        if only and name not in only:
+            continue
+        module = importlib.import_module(f"{__name__}.{name}")
+        batches.append(Batch.from_module(name, module))
+    return batches
@@ -1,25 +1,12 @@
-#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-批量添加A1基础词汇
-重点类别：颜色、身体部位、衣物、情绪、天气、方位、量词
+A1基础词汇批次（原 add_a1_vocabulary.py）
+重点类别：颜色、身体部位、衣物、情绪、天气、方位
 """
 
-import json
-from datetime import datetime
-
-# 读取现有词汇
-with open('assets/data/sample_words.json', 'r', encoding='utf-8') as f:
-    words = json.load(f)
-
-# 找到最大ID
-max_id = max([int(w['id']) for w in words])
-print(f"当前最大ID: {max_id}")
-print(f"当前A1词汇数: {len([w for w in words if w.get('level') == 'A1'])}")
-
-# 新词汇列表
-new_words = []
-current_id = max_id + 1
+ASSET = "words"
+COLUMNS = ("italian", "chinese", "english", "pronunciation", "examples")
+DEFAULTS = {"level": "A1"}
 
 # ========== 1. 颜色 (15词) ==========
 colors = [
@@ -40,20 +27,6 @@ colors = [
     ("scuro", "深色的", "dark", "ˈskuro", ["Fuori è scuro. - 外面很暗。", "Porto vestiti scuri. - 我穿深色的衣服。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in colors:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "颜色",
-        "level": "A1",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
 # ========== 2. 身体部位 (25词) ==========
 body_parts = [
     ("testa", "头", "head", "ˈtesta", ["Mi fa male la testa. - 我头疼。", "Ho una grande testa. - 我有一个大头。"]),
@@ -83,20 +56,6 @@ body_parts = [
     ("sangue", "血", "blood", "ˈsangwe", ["Ho paura del sangue. - 我怕血。", "Dono il sangue. - 我献血。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in body_parts:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "身体部位",
-        "level": "A1",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
 # ========== 3. 衣物 (20词) ==========
 clothing = [
     ("vestito", "连衣裙/衣服", "dress/clothes", "vesˈtito", ["Il vestito è bello. - 裙子很漂亮。", "Compro un vestito nuovo. - 我买一件新衣服。"]),
@@ -121,20 +80,6 @@ clothing = [
     ("costume", "泳衣", "swimsuit", "kosˈtume", ["Il costume è nuovo. - 泳衣是新的。", "Compro un costume da bagno. - 我买一件泳衣。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in clothing:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "衣物",
-        "level": "A1",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
 # ========== 4. 情绪 (15词) ==========
 emotions = [
     ("felice", "快乐的", "happy", "feˈlitʃe", ["Sono molto felice! - 我很快乐!", "Lei è felice oggi. - 她今天很开心。"]),
@@ -154,20 +99,6 @@ emotions = [
     ("geloso", "嫉妒的", "jealous", "dʒeˈlozo", ["Sono geloso. - 我嫉妒。", "Lui è geloso di lei. - 他嫉妒她。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in emotions:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "情绪",
-        "level": "A1",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
 # ========== 5. 天气 (15词) ==========
 weather = [
     ("tempo", "天气", "weather", "ˈtempo", ["Che tempo fa? - 天气怎么样?", "Il tempo è bello oggi. - 今天天气好。"]),
@@ -187,20 +118,6 @@ weather = [
     ("stagione", "季节", "season", "stadʒˈʒone", ["La mia stagione preferita è l'estate. - 我最喜欢的季节是夏天。", "Ci sono quattro stagioni. - 有四个季节。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in weather:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "天气",
-        "level": "A1",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
 # ========== 6. 方位词 (10词) ==========
 directions = [
     ("sopra", "在...上面", "above", "ˈsopra", ["Il libro è sopra il tavolo. - 书在桌子上。", "L'aereo vola sopra le nuvole. - 飞机在云上飞。"]),
@@ -215,35 +132,11 @@ directions = [
     ("sinistra", "左边", "left", "siˈnistra", ["Gira a sinistra. - 向左转。", "Il negozio è a sinistra. - 商店在左边。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in directions:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "方位词",
-        "level": "A1",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
-# 添加新词汇到列表
-words.extend(new_words)
-
-# 写回文件
-with open('assets/data/sample_words.json', 'w', encoding='utf-8') as f:
-    json.dump(words, f, ensure_ascii=False, indent=2)
-
-print(f"\n✅ 成功添加 {len(new_words)} 个A1词汇!")
-print(f"新的总词汇数: {len(words)}")
-print(f"新的A1词汇数: {len([w for w in words if w.get('level') == 'A1'])}")
-print(f"\n添加的类别统计:")
-print(f"  - 颜色: 15词")
-print(f"  - 身体部位: 25词")
-print(f"  - 衣物: 20词")
-print(f"  - 情绪: 15词")
-print(f"  - 天气: 15词")
-print(f"  - 方位词: 10词")
-print(f"  总计: 100词")
+GROUPS = [
+    ("颜色", {"category": "颜色"}, colors),
+    ("身体部位", {"category": "身体部位"}, body_parts),
+    ("衣物", {"category": "衣物"}, clothing),
+    ("情绪", {"category": "情绪"}, emotions),
+    ("天气", {"category": "天气"}, weather),
+    ("方位词", {"category": "方位词"}, directions),
+]
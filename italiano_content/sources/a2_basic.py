@@ -1,26 +1,12 @@
-#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-批量添加A2词汇
+A2词汇批次（原 add_a2_vocabulary.py）
 重点类别：通讯科技、娱乐运动、抽象概念、工作学习、社交关系
-目标：补充150个A2高频词汇，提升CEFR覆盖率到95%+
 """
 
-import json
-from datetime import datetime
-
-# 读取现有词汇
-with open('assets/data/sample_words.json', 'r', encoding='utf-8') as f:
-    words = json.load(f)
-
-# 找到最大ID
-max_id = max([int(w['id']) for w in words])
-print(f"当前最大ID: {max_id}")
-print(f"当前A2词汇数: {len([w for w in words if w.get('level') == 'A2'])}")
-
-# 新词汇列表
-new_words = []
-current_id = max_id + 1
+ASSET = "words"
+COLUMNS = ("italian", "chinese", "english", "pronunciation", "examples")
+DEFAULTS = {"level": "A2"}
 
 # ========== 1. 通讯科技 (35词) ==========
 technology = [
@@ -61,20 +47,6 @@ technology = [
     ("tecnologia", "技术", "technology", "teknoloˈdʒia", ["La tecnologia è importante. - 技术很重要。", "Amo la tecnologia. - 我喜欢技术。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in technology:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "通讯科技",
-        "level": "A2",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
 # ========== 2. 娱乐运动 (30词) ==========
 entertainment = [
     ("musica", "音乐", "music", "ˈmuzika", ["Ascolto la musica. - 我听音乐。", "La musica è bella. - 音乐很美。"]),
@@ -109,20 +81,6 @@ entertainment = [
     ("divertimento", "娱乐/乐趣", "fun", "divertiˈmento", ["È per divertimento. - 这是为了娱乐。", "Il divertimento è importante. - 娱乐很重要。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in entertainment:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "娱乐运动",
-        "level": "A2",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
 # ========== 3. 抽象概念 (30词) ==========
 abstract = [
     ("cosa", "事情/东西", "thing", "ˈkɔza", ["Che cosa fai? - 你在做什么？", "È una bella cosa. - 这是件好事。"]),
@@ -157,20 +115,6 @@ abstract = [
     ("fortuna", "运气", "luck", "forˈtuna", ["Buona fortuna! - 祝你好运！", "Ho fortuna. - 我有运气。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in abstract:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "抽象概念",
-        "level": "A2",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
 # ========== 4. 工作学习 (30词) ==========
 work_study = [
     ("lavoro", "工作", "work", "laˈvoro", ["Il mio lavoro è interessante. - 我的工作很有趣。", "Vado al lavoro. - 我去上班。"]),
@@ -205,20 +149,6 @@ work_study = [
     ("ricerca", "研究", "research", "riˈtʃɛrka", ["Faccio una ricerca. - 我做研究。", "La ricerca è interessante. - 研究很有趣。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in work_study:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "工作学习",
-        "level": "A2",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
 # ========== 5. 社交关系 (25词) ==========
 social = [
     ("amicizia", "友谊", "friendship", "amiˈtʃitsja", ["L'amicizia è importante. - 友谊很重要。", "Abbiamo una bella amicizia. - 我们有美好的友谊。"]),
@@ -248,43 +178,10 @@ social = [
     ("educazione", "教育/礼貌", "education", "edukatˈtsjone", ["L'educazione è importante. - 教育很重要。", "Ha molta educazione. - 他很有礼貌。"]),
 ]
 
-for italian, chinese, english, pronunciation, examples in social:
-    new_words.append({
-        "id": str(current_id),
-        "italian": italian,
-        "chinese": chinese,
-        "english": english,
-        "pronunciation": pronunciation,
-        "category": "社交关系",
-        "level": "A2",
-        "createdAt": datetime.now().isoformat() + "Z",
-        "examples": examples
-    })
-    current_id += 1
-
-# 添加新词汇到列表
-words.extend(new_words)
-
-# 写回文件
-with open('assets/data/sample_words.json', 'w', encoding='utf-8') as f:
-    json.dump(words, f, ensure_ascii=False, indent=2)
-
-print(f"\n✅ 成功添加 {len(new_words)} 个A2词汇!")
-print(f"新的总词汇数: {len(words)}")
-print(f"新的A2词汇数: {len([w for w in words if w.get('level') == 'A2'])}")
-print(f"\n添加的类别统计:")
-print(f"  - 通讯科技: 35词")
-print(f"  - 娱乐运动: 30词")
-print(f"  - 抽象概念: 30词")
-print(f"  - 工作学习: 30词")
-print(f"  - 社交关系: 25词")
-print(f"  总计: 150词")
-
-# 计算A2覆盖率
-a2_count = len([w for w in words if w.get('level') == 'A2'])
-coverage_low = (a2_count / 1200) * 100
-coverage_high = (a2_count / 1000) * 100
-print(f"\n📊 CEFR A2覆盖率:")
-print(f"  - 标准范围: 1000-1200词")
-print(f"  - 当前A2词汇: {a2_count}词")
-print(f"  - 覆盖率: {coverage_low:.1f}%-{coverage_high:.1f}%")
+GROUPS = [
+    ("通讯科技", {"category": "通讯科技"}, technology),
+    ("娱乐运动", {"category": "娱乐运动"}, entertainment),
+    ("抽象概念", {"category": "抽象概念"}, abstract),
+    ("工作学习", {"category": "工作学习"}, work_study),
+    ("社交关系", {"category": "社交关系"}, social),
+]
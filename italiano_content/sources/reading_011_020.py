@@ -1,29 +1,18 @@
-#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-批量添加阅读文章
-目标：从10篇增加到20篇（A1: 4→7篇, A2: 6→13篇）
+阅读文章批次 reading_011 - reading_020（原 add_reading_passages.py）
 重点类别：实用文本、新闻、社交、广告、通知等
+wordCount 和 estimatedMinutes 由构建时计算（见 italiano_content/metrics.py）
 """
 
-import json
-from datetime import datetime
+ASSET = "passages"
 
-# 读取现有文章
-with open('assets/data/reading_passages.json', 'r', encoding='utf-8') as f:
-    passages = json.load(f)
-
-print(f"当前文章数: {len(passages)}")
-print(f"当前A1: {len([p for p in passages if p.get('level') == 'A1'])}篇")
-print(f"当前A2: {len([p for p in passages if p.get('level') == 'A2'])}篇")
-
-# 新文章列表
-new_passages = []
+ROWS = []
 
 # ========== A1级别文章 (3篇) ==========
 
 # A1-1: 超市广告
-new_passages.append({
+ROWS.append({
     "id": "reading_011",
     "title": "Offerte del supermercato",
     "titleChinese": "超市促销",
@@ -48,8 +37,6 @@ Carne e Pesce:
 ORARI: Lunedì-Sabato 8:00-20:00, Domenica 9:00-13:00
 
 Offerte valide dal 10 al 16 gennaio.""",
-    "wordCount": 78,
-    "estimatedMinutes": 2,
     "questions": [
         {
             "id": "q1",
@@ -96,12 +83,11 @@ Offerte valide dal 10 al 16 gennaio.""",
             "answer": "新鲜鱼",
             "explanation": "新鲜鱼12,00€/kg是价格最高的商品"
         }
-    ],
-    "createdAt": datetime.now().isoformat() + "Z"
+    ]
 })
 
 # A1-2: 电影院海报
-new_passages.append({
+ROWS.append({
     "id": "reading_012",
     "title": "Al cinema",
     "titleChinese": "电影院海报",
@@ -129,8 +115,6 @@ PREZZI:
 • Bambini sotto 12 anni: 5€
 
 Info: www.cinemaroma.it - Tel. 06-1234567""",
-    "wordCount": 96,
-    "estimatedMinutes": 2,
     "questions": [
         {
             "id": "q1",
@@ -177,12 +161,11 @@ Info: www.cinemaroma.it - Tel. 06-1234567""",
             "answer": "5€",
             "explanation": "价格表：Bambini sotto 12 anni: 5€（12岁以下儿童5欧）"
         }
-    ],
-    "createdAt": datetime.now().isoformat() + "Z"
+    ]
 })
 
 # A1-3: 公寓出租广告
-new_passages.append({
+ROWS.append({
     "id": "reading_013",
     "title": "Annuncio: Appartamento in affitto",
     "titleChinese": "出租公寓广告",
@@ -210,8 +193,6 @@ Tel: 02-9876543
 Email: maria.rossi@email.it
 
 Solo referenze serie!""",
-    "wordCount": 89,
-    "estimatedMinutes": 2,
     "questions": [
         {
             "id": "q1",
@@ -258,14 +239,13 @@ Solo referenze serie!""",
             "answer": "真",
             "explanation": "位置说明：Vicino alla metro (5 minuti a piedi)"
         }
-    ],
-    "createdAt": datetime.now().isoformat() + "Z"
+    ]
 })
 
 # ========== A2级别文章 (7篇) ==========
 
 # A2-1: 简单新闻 - 天气预报
-new_passages.append({
+ROWS.append({
     "id": "reading_014",
     "title": "Previsioni meteo per il weekend",
     "titleChinese": "周末天气预报",
@@ -288,8 +268,6 @@ Centro: Nuvole in aumento, ma senza piogge. Temperature stabili.
 Sud: Miglioramento generale, ritorno del sole. Temperature in leggero aumento.
 
 Consigli: Portate l'ombrello nel Nord e in Sicilia! Al Centro e Sud Italia è un buon weekend per passeggiate all'aria aperta.""",
-    "wordCount": 134,
-    "estimatedMinutes": 3,
     "questions": [
         {
             "id": "q1",
@@ -336,12 +314,11 @@ Consigli: Portate l'ombrello nel Nord e in Sicilia! Al Centro e Sud Italia è un
             "answer": "带雨伞去北部和西西里",
             "explanation": "建议：Portate l'ombrello nel Nord e in Sicilia!"
         }
-    ],
-    "createdAt": datetime.now().isoformat() + "Z"
+    ]
 })
 
 # A2-2: 社交媒体帖子
-new_passages.append({
+ROWS.append({
     "id": "reading_015",
     "title": "Post sui social media",
     "titleChinese": "社交媒体帖子",
@@ -367,8 +344,6 @@ Chi di voi è già stato a Venezia? Consigliatemi altri posti da visitare!
 ❤️ 1,234 Mi piace
 💬 87 Commenti
 🔄 45 Condivisioni""",
-    "wordCount": 162,
-    "estimatedMinutes": 3,
     "questions": [
         {
             "id": "q1",
@@ -415,12 +390,11 @@ Chi di voi è già stato a Venezia? Consigliatemi altri posti da visitare!
             "answer": "1234",
             "explanation": "底部统计：❤️ 1,234 Mi piace"
         }
-    ],
-    "createdAt": datetime.now().isoformat() + "Z"
+    ]
 })
 
 # A2-3: 邮件 - 工作相关
-new_passages.append({
+ROWS.append({
     "id": "reading_016",
     "title": "Email di lavoro",
     "titleChinese": "工作邮件",
@@ -453,8 +427,6 @@ Marco Bianchi
 Project Manager
 Tech Italia S.r.l.
 Tel: +39 02-1234567""",
-    "wordCount": 156,
-    "estimatedMinutes": 3,
     "questions": [
         {
             "id": "q1",
@@ -501,12 +473,11 @@ Tel: +39 02-1234567""",
             "answer": "星期五之前",
             "explanation": "要求：per favore rispondete a questa email entro venerdì"
         }
-    ],
-    "createdAt": datetime.now().isoformat() + "Z"
+    ]
 })
 
 # A2-4: 简单新闻 - 文化活动
-new_passages.append({
+ROWS.append({
     "id": "reading_017",
     "title": "Festival della musica a Roma",
     "titleChinese": "罗马音乐节",
@@ -521,8 +492,6 @@ Durante i cinque giorni di festival, oltre 80 artisti italiani e internazionali
 Il festival ha offerto anche workshop gratuiti per musicisti emergenti e lezioni di musica per bambini. Grazie al successo di quest'anno, gli organizzatori hanno già annunciato che il festival tornerà nel 2026 con un programma ancora più ricco.
 
 Il sindaco di Roma ha dichiarato: "Questo festival dimostra che la musica unisce le persone e arricchisce la nostra città. Siamo orgogliosi di ospitare un evento così importante.""",
-    "wordCount": 192,
-    "estimatedMinutes": 3,
     "questions": [
         {
             "id": "q1",
@@ -569,12 +538,11 @@ Il sindaco di Roma ha dichiarato: "Questo festival dimostra che la musica unisce
             "answer": "2026",
             "explanation": "组织者宣布：il festival tornerà nel 2026"
         }
-    ],
-    "createdAt": datetime.now().isoformat() + "Z"
+    ]
 })
 
 # A2-5: 博客文章 - 健康生活
-new_passages.append({
+ROWS.append({
     "id": "reading_018",
     "title": "Consigli per una vita sana",
     "titleChinese": "健康生活建议",
@@ -602,8 +570,6 @@ Passare tempo con amici e famiglia è importante per la salute mentale. Le relaz
 Ricordate: piccoli cambiamenti quotidiani portano grandi risultati! Iniziate con una o due abitudini e aggiungete le altre gradualmente.
 
 Qual è la vostra abitudine preferita per stare bene? Scrivetelo nei commenti!""",
-    "wordCount": 238,
-    "estimatedMinutes": 3,
     "questions": [
         {
             "id": "q1",
@@ -650,12 +616,11 @@ Qual è la vostra abitudine preferita per stare bene? Scrivetelo nei commenti!""
             "answer": "阅读、听音乐、冥想或瑜伽",
             "explanation": "减压方法：leggete un libro, ascoltate musica, meditate o praticate yoga"
         }
-    ],
-    "createdAt": datetime.now().isoformat() + "Z"
+    ]
 })
 
 # A2-6: 产品评论
-new_passages.append({
+ROWS.append({
     "id": "reading_019",
     "title": "Recensione: Ristorante 'Da Giuseppe'",
     "titleChinese": "餐厅评论：朱塞佩餐厅",
@@ -683,8 +648,6 @@ Il conto finale è stato di 85€ per due persone, incluso vino e dessert. Un po
 
 CONCLUSIONE
 Torneremo sicuramente! Consiglio vivamente questo ristorante a chiunque cerchi autentica cucina italiana in un ambiente piacevole. Ricordatevi di prenotare, perché è sempre molto frequentato!""",
-    "wordCount": 242,
-    "estimatedMinutes": 3,
     "questions": [
         {
             "id": "q1",
@@ -731,12 +694,11 @@ Torneremo sicuramente! Consiglio vivamente questo ristorante a chiunque cerchi a
             "answer": "提前预订",
             "explanation": "建议：Ricordatevi di prenotare, perché è sempre molto frequentato!"
         }
-    ],
-    "createdAt": datetime.now().isoformat() + "Z"
+    ]
 })
 
 # A2-7: 旅游攻略
-new_passages.append({
+ROWS.append({
     "id": "reading_020",
     "title": "Guida turistica: Un giorno a Firenze",
     "titleChinese": "旅游攻略：佛罗伦萨一日游",
@@ -769,8 +731,6 @@ CONSIGLI PRATICI:
 • Il centro storico è piccolo - tutto è raggiungibile a piedi
 
 Buon viaggio! 🇮🇹""",
-    "wordCount": 278,
-    "estimatedMinutes": 4,
     "questions": [
         {
             "id": "q1",
@@ -817,42 +777,5 @@ Buon viaggio! 🇮🇹""",
             "answer": "穿舒适的鞋",
             "explanation": "实用建议：Indossate scarpe comode - camminerete molto!"
         }
-    ],
-    "createdAt": datetime.now().isoformat() + "Z"
+    ]
 })
-
-# 添加新文章到列表
-passages.extend(new_passages)
-
-# 写回文件
-with open('assets/data/reading_passages.json', 'w', encoding='utf-8') as f:
-    json.dump(passages, f, ensure_ascii=False, indent=2)
-
-print(f"\n✅ 成功添加 {len(new_passages)} 篇阅读文章!")
-print(f"新的总文章数: {len(passages)}")
-a1_new = len([p for p in passages if p.get('level') == 'A1'])
-a2_new = len([p for p in passages if p.get('level') == 'A2'])
-print(f"新的A1文章数: {a1_new}")
-print(f"新的A2文章数: {a2_new}")
-
-print(f"\n添加的文章类型统计:")
-print(f"  A1级别:")
-print(f"    - 超市广告 (实用文本)")
-print(f"    - 电影院海报 (实用文本)")
-print(f"    - 公寓出租广告 (实用文本)")
-print(f"\n  A2级别:")
-print(f"    - 天气预报 (实用文本)")
-print(f"    - 社交媒体帖子 (实用文本)")
-print(f"    - 工作邮件 (工作学习)")
-print(f"    - 音乐节新闻 (文化)")
-print(f"    - 健康生活博客 (日常生活)")
-print(f"    - 餐厅评论 (日常生活)")
-print(f"    - 佛罗伦萨旅游攻略 (旅游)")
-
-# 统计总字数
-total_words = sum([p['wordCount'] for p in passages])
-print(f"\n📊 阅读材料统计:")
-print(f"  - 总文章数: {len(passages)}篇")
-print(f"  - 总字数: {total_words}词")
-print(f"  - 总问题数: {len(passages) * 5}题")
-print(f"  - 预计总阅读时间: {sum([p['estimatedMinutes'] for p in passages])}分钟")
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+派生输出阶段
+
+资源文件构建完成后，各阶段从一个或多个资源生成派生文件（索引、内容库等），
+写到 derived_dir（默认 build/content）。派生文件都是生成的，不提交。
+阶段输入和渲染代码的哈希记录在构建清单中，都未变化时整个阶段跳过；
+需要重新生成时也只写入内容真正变化的文件，并删除上次生成、这次不再
+生成的旧文件；已删除的阶段上次生成的文件也一并删除。
+
+bundled=False 的阶段只给工具用（语境索引），发布版不包含它们的输出。
+cached=True 的阶段 render 另接收缓存目录（词形变化缓存，见 inflection.py）。
+
+jobs > 1 时需要重新生成的阶段在进程池中并行渲染（每个进程自己读取
+输入），写文件和更新清单仍在主进程中按 STAGES 的顺序进行，结果与串行
+相同。
+"""
+
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .assets import ASSETS, DATA_DIR, DERIVED_DIR
+from .manifest import CACHE_DIR, code_version, content_hash
+from . import categories, content_db, distractors, glosses, links
+
+
+class Stage:
+    """一个派生输出阶段：render(docs) 返回 {相对输出目录的路径: 文本或字节}"""
+
+    def __init__(self, name, inputs, render, bundled=True, cached=False):
+        self.name = name
+        self.inputs = inputs
+        self.render = render
+        self.bundled = bundled
+        self.cached = cached
+
+
+STAGES = [
+    Stage("taxonomy", ("words",), categories.render_taxonomy),
+    Stage("contexts", ("words", "conversations", "passages"), links.render_contexts, bundled=False,
+          cached=True),
+    Stage("distractors", ("words",), distractors.render_distractors),
+    Stage("glosses", ("conversations",), glosses.render_glosses),
+    Stage("content_db", content_db.INPUTS, content_db.render_content_db),
+]
+
+
+def map_jobs(function, calls, jobs=1):
+    """依次或在进程池中执行 function(*args)，结果按 calls 的顺序返回"""
+    calls = list(calls)
+    if jobs > 1 and len(calls) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(calls))) as pool:
+            futures = [pool.submit(function, *args) for args in calls]
+            return [future.result() for future in futures]
+    return [function(*args) for args in calls]
+
+
+def write_if_changed(path, content):
+    """内容（文本或字节）不同时才写入，返回是否写入"""
+    path = Path(path)
+    data = content if isinstance(content, bytes) else content.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def remove_output(out_dir, path):
+    """删除一个输出文件，以及因此变空的上级目录（不超出 out_dir）"""
+    out_dir = Path(out_dir)
+    target = out_dir / path
+    target.unlink()
+    parent = target.parent
+    while parent != out_dir and not any(parent.iterdir()):
+        parent.rmdir()
+        parent = parent.parent
+
+
+class Inputs:
+    """同一次构建内共享的资源文本与解析结果，每个资源最多读取、解析一次"""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.texts = {}
+        self.docs = {}
+
+    def text(self, name):
+        if name not in self.texts:
+            self.texts[name] = ASSETS[name].read_text(self.data_dir)
+        return self.texts[name]
+
+    def doc(self, name):
+        if name not in self.docs:
+            self.docs[name] = ASSETS[name].records(json.loads(self.text(name)))
+        return self.docs[name]
+
+
+def render_stage(name, data_dir, cache_dir=CACHE_DIR, inputs=None):
+    """渲染一个阶段，返回 (输出, 用时)；在子进程中运行时自己读取输入"""
+    started = time.perf_counter()
+    stage = next(stage for stage in STAGES if stage.name == name)
+    inputs = inputs or Inputs(data_dir)
+    docs = {name: inputs.doc(name) for name in stage.inputs}
+    outputs = stage.render(docs, cache_dir) if stage.cached else stage.render(docs)
+    return outputs, time.perf_counter() - started
+
+
+def stage_digest(stage, inputs):
+    """阶段输入和渲染代码的哈希"""
+    return content_hash([code_version(stage.render)] + [inputs.text(name) for name in stage.inputs])
+
+
+def is_fresh(stage, digest, manifest, derived_dir=DERIVED_DIR):
+    previous = manifest.stages.get(stage.name, {})
+    return previous.get('inputs') == digest and all(
+        (Path(derived_dir) / path).exists() for path in previous.get('outputs', ()))
+
+
+def apply_stage(stage, digest, outputs, manifest, derived_dir=DERIVED_DIR, dry_run=False):
+    """写入阶段输出（只写变化的文件，删除不再生成的旧文件），返回统计"""
+    out_dir = Path(derived_dir)
+    previous = manifest.stages.get(stage.name, {})
+    stats = {'name': stage.name, 'written': [], 'removed': [], 'outputs': len(outputs), 'skipped': False}
+    if not dry_run:
+        for path, content in outputs.items():
+            if write_if_changed(out_dir / path, content):
+                stats['written'].append(path)
+        for path in previous.get('outputs', ()):
+            if path not in outputs and (out_dir / path).exists():
+                remove_output(out_dir, path)
+                stats['removed'].append(path)
+        manifest.stages[stage.name] = {'inputs': digest, 'outputs': sorted(outputs)}
+    return stats
+
+
+def skipped_stage(stage, manifest):
+    outputs = manifest.stages.get(stage.name, {}).get('outputs', ())
+    return {'name': stage.name, 'written': [], 'removed': [], 'outputs': len(outputs), 'skipped': True,
+            'seconds': 0.0}
+
+
+def retire_stages(manifest, derived_dir=DERIVED_DIR, dry_run=False):
+    """删除清单中已不存在的阶段上次生成的文件，返回统计"""
+    report = []
+    names = {stage.name for stage in STAGES}
+    for name in sorted(set(manifest.stages) - names):
+        stats = {'name': name, 'written': [], 'removed': [], 'outputs': 0, 'skipped': False, 'seconds': 0.0}
+        if not dry_run:
+            for path in manifest.stages.pop(name).get('outputs', ()):
+                if (Path(derived_dir) / path).exists():
+                    remove_output(derived_dir, path)
+                    stats['removed'].append(path)
+        report.append(stats)
+    return report
+
+
+def run_stages(data_dir, manifest, force=False, dry_run=False, jobs=1, derived_dir=DERIVED_DIR,
+               cache_dir=CACHE_DIR):
+    """运行所有派生阶段，返回每个阶段的统计（按 STAGES 的顺序）"""
+    inputs = Inputs(data_dir)
+    digests = {stage.name: stage_digest(stage, inputs) for stage in STAGES}
+    pending = [stage for stage in STAGES
+               if force or not is_fresh(stage, digests[stage.name], manifest, derived_dir)]
+    if jobs > 1:
+        rendered = map_jobs(render_stage, [(stage.name, data_dir, cache_dir) for stage in pending], jobs)
+    else:
+        rendered = [render_stage(stage.name, data_dir, cache_dir, inputs) for stage in pending]
+    results = dict(zip((stage.name for stage in pending), rendered))
+
+    report = retire_stages(manifest, derived_dir, dry_run)
+    for stage in STAGES:
+        if stage.name not in results:
+            report.append(skipped_stage(stage, manifest))
+            continue
+        outputs, seconds = results[stage.name]
+        started = time.perf_counter()
+        stats = apply_stage(stage, digests[stage.name], outputs, manifest, derived_dir, dry_run)
+        stats['seconds'] = seconds + time.perf_counter() - started
+        report.append(stats)
+    return report
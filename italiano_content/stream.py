@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+资源文件的流式读写
+
+RecordReader 按块读取文件，每次只解析一条记录，内存占用取决于单条记录
+的大小，与文件大小无关；RecordWriter 逐条写出记录，输出与
+render.render_document 逐字节一致。两者配合可以
+对 daily_conversations.json 这类大文件做逐条转换：
+
+    transform_asset(ASSETS['conversations'], fix_conversation)
+
+文档顶层的其他键（如 italian_phrases.json 的 updated_at、total_count）
+按出现位置分别记在 head（记录数组之前）和 tail（之后）。
+"""
+
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+
+from .assets import DATA_DIR
+from .render import INDENT, render_value
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = ' \t\n\r'
+_BRACKETS = re.compile(r'[\[\]{}"]')
+_QUOTE = re.compile(r'["\\]')
+_LITERAL_END = re.compile(r'[\s,\]}]')
+
+
+class RecordReader:
+    """逐条读取资源文件中的记录；第一条记录产出时 head 已完整，迭代结束后 tail 才完整"""
+
+    def __init__(self, path, records_key=None, chunk_size=CHUNK_SIZE):
+        self.path = Path(path)
+        self.records_key = records_key
+        self.chunk_size = chunk_size
+        self.head = {}
+        self.tail = {}
+        self._file = None
+        self._buffer = ''
+        self._pos = 0
+
+    def __iter__(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self._file = f
+            self._buffer, self._pos = '', 0
+            if self.records_key is None:
+                yield from self._array()
+            else:
+                yield from self._object()
+            if self._peek():
+                raise ValueError(f"{self.path.name}: 文档结束后还有多余内容")
+
+    def _fill(self):
+        """在缓冲区末尾读入下一块，返回是否读到了新内容"""
+        chunk = self._file.read(self.chunk_size)
+        self._buffer += chunk
+        return bool(chunk)
+
+    def _peek(self):
+        """跳过空白，返回下一个字符（文件结束时为空串）"""
+        while True:
+            buffer = self._buffer
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(buffer) or not self._fill():
+                return self._buffer[self._pos:self._pos + 1]
+
+    def _expect(self, chars):
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(f"{self.path.name}: 期望 {' 或 '.join(chars)}, 实际为 {char or '文件结束'!r}")
+        self._pos += 1
+        return char
+
+    def _search(self, pattern, index, what):
+        """在缓冲区中从 index 起查找，找不到就继续读入"""
+        while True:
+            match = pattern.search(self._buffer, index)
+            if match:
+                return match
+            if not self._fill():
+                raise ValueError(f"{self.path.name}: {what}未结束")
+
+    def _string_end(self, index):
+        """index 处是引号，返回字符串结束后的位置"""
+        index += 1
+        while True:
+            match = self._search(_QUOTE, index, "字符串")
+            if match.group() == '"':
+                return match.end()
+            # 反斜杠转义下一个字符
+            index = match.end() + 1
+            while index > len(self._buffer) and self._fill():
+                pass
+
+    def _value_end(self):
+        """返回从当前位置开始的一个完整 JSON 值的结束位置"""
+        first = self._buffer[self._pos]
+        if first == '"':
+            return self._string_end(self._pos)
+        if first not in '[{':
+            while True:
+                match = _LITERAL_END.search(self._buffer, self._pos)
+                if match:
+                    return match.start()
+                if not self._fill():
+                    return len(self._buffer)
+        depth = 0
+        index = self._pos
+        while True:
+            match = self._search(_BRACKETS, index, "文档")
+            if match.group() == '"':
+                index = self._string_end(match.start())
+                continue
+            depth += 1 if match.group() in '[{' else -1
+            index = match.end()
+            if depth == 0:
+                return index
+
+    def _read_value(self):
+        if not self._peek():
+            raise ValueError(f"{self.path.name}: 文档未结束")
+        # 丢掉已经解析过的部分，缓冲区只保留当前值
+        if self._pos > self.chunk_size:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        end = self._value_end()
+        text = self._buffer[self._pos:end]
+        self._pos = end
+        return json.loads(text)
+
+    def _array(self):
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._read_value()
+            if self._expect(',]') == ']':
+                return
+
+    def _object(self):
+        self._expect('{')
+        found = False
+        if self._peek() != '}':
+            while True:
+                key = self._read_value()
+                self._expect(':')
+                if key == self.records_key and not found:
+                    found = True
+                    yield from self._array()
+                else:
+                    (self.tail if found else self.head)[key] = self._read_value()
+                if self._expect(',}') == '}':
+                    break
+        else:
+            self._pos += 1
+        if not found:
+            raise ValueError(f"{self.path.name}: 缺少 {self.records_key}")
+
+
+class RecordWriter:
+    """逐条写出记录到临时文件，正常退出时替换目标文件
+
+    head 在写第一条记录前确定即可，tail 在退出前确定即可。
+    """
+
+    def __init__(self, path, records_key=None, head=None, tail=None):
+        self.path = Path(path)
+        self.records_key = records_key
+        self.head = dict(head or {})
+        self.tail = dict(tail or {})
+        self.count = 0
+        self._depth = 1 if records_key is None else 2
+        self._temp = self.path.with_name(self.path.name + '.tmp')
+        self._file = None
+        self._started = False
+
+    def __enter__(self):
+        self._file = open(self._temp, 'w', encoding='utf-8')
+        return self
+
+    def _write_key(self, key):
+        self._file.write('\n' + ' ' * INDENT + json.dumps(key, ensure_ascii=False) + ': ')
+
+    def _start(self):
+        self._started = True
+        if self.records_key is not None:
+            self._file.write('{')
+            for key, value in self.head.items():
+                self._write_key(key)
+                self._file.write(render_value(value, 1) + ',')
+            self._write_key(self.records_key)
+        self._file.write('[')
+
+    def write(self, record):
+        if not self._started:
+            self._start()
+        pad = ' ' * (INDENT * self._depth)
+        self._file.write((',\n' if self.count else '\n') + pad + render_value(record, self._depth))
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, traceback):
+        try:
+            if exc_type is None:
+                if not self._started:
+                    self._start()
+                if self.count:
+                    self._file.write('\n' + ' ' * (INDENT * (self._depth - 1)))
+                self._file.write(']')
+                if self.records_key is not None:
+                    for key, value in self.tail.items():
+                        self._file.write(',')
+                        self._write_key(key)
+                        self._file.write(render_value(value, 1))
+                    self._file.write('\n}')
+        finally:
+            self._file.close()
+        if exc_type is None:
+            os.replace(self._temp, self.path)
+        else:
+            self._temp.unlink()
+        return False
+
+
+def iter_records(asset, data_dir=DATA_DIR):
+    """逐条读取资源文件中的记录，返回的 RecordReader 迭代后可取 head/tail"""
+    return RecordReader(asset.path(data_dir), asset.records_key)
+
+
+def transform_asset(asset, transform, data_dir=DATA_DIR):
+    """对资源文件逐条应用 transform(record) 并流式写回，返回 None 的记录被删除
+
+    返回 (读入条数, 写出条数)。记录数变化时同步记录数组之后的汇总字段。
+    """
+    reader = iter_records(asset, data_dir)
+    read = 0
+    with RecordWriter(asset.path(data_dir), asset.records_key) as writer:
+        for record in reader:
+            if not read:
+                writer.head.update(reader.head)
+            read += 1
+            result = transform(record)
+            if result is not None:
+                writer.write(result)
+        if not read:
+            writer.head.update(reader.head)
+        writer.tail.update(reader.tail)
+        if writer.count != read:
+            if asset.count_key in reader.head or asset.updated_key in reader.head:
+                raise ValueError(f"{asset.filename}: 汇总字段位于记录之前，无法流式更新")
+            if asset.count_key in writer.tail:
+                writer.tail[asset.count_key] = writer.count
+            if asset.updated_key in writer.tail:
+                writer.tail[asset.updated_key] = datetime.now().isoformat()
+    return read, writer.count
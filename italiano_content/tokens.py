@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+搜索分词规则
+
+内容库的 FTS5 全文索引（content_db.py）和应用中的查询（vocabulary_provider.dart）
+使用同样的规则：拉丁字母去重音、小写后按非字母数字切分，中文按字切分。
+"""
+
+import re
+
+from .dedup import fold
+
+_TOKEN = re.compile(r"[0-9a-z]+")
+
+
+def latin_tokens(text):
+    """去重音、小写后按非字母数字切分：l'acqua → [l, acqua]"""
+    return _TOKEN.findall(fold(text or ''))
+
+
+def han_chars(text):
+    """需要按字建索引的字符：去重音后仍不是 ASCII 的文字和数字（汉字等）"""
+    return [c for c in (text or '') if ord(c) > 0x7F and c.isalnum() and not fold(c).isascii()]
@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+"""
+资源文件结构校验
+
+每个资源的记录结构用 Field 声明（与 lib/shared/models 中 fromJson 的要求一致），
+启动时编译成嵌套的检查函数，校验时逐条记录走一遍即可，不再解释声明。
+检查内容：必需字段、类型、等级等枚举值、未知字段（多为拼写错误）、
+记录ID和对话消息ID唯一、题目答案必须在选项中、例句挖空位置在例句内、
+汇总字段与记录数一致。
+
+构建时只校验新增和变化的记录，python -m italiano_content validate 逐条流式读取并校验全部资源。
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from .assets import ASSETS, DATA_DIR, LEVELS
+from .categories import CATEGORY_NAMES
+from .stream import iter_records
+
+# 一个资源最多报告的错误数，其余只计数
+MAX_ERRORS = 20
+
+
+class Field:
+    """字段声明：kind 为类型、嵌套结构（dict）或可选类型的元组"""
+
+    def __init__(self, kind, required=True, nullable=False, choices=None,
+                 items=None, nonempty=False):
+        self.kind = kind
+        self.required = required
+        self.nullable = nullable
+        self.choices = choices
+        self.items = items
+        self.nonempty = nonempty
+
+
+def text(**options):
+    return Field(str, nonempty=True, **options)
+
+
+def optional(kind, **options):
+    return Field(kind, required=False, nullable=True, **options)
+
+
+def list_of(items, **options):
+    return Field(list, items=items, **options)
+
+
+def level():
+    return Field(str, choices=LEVELS)
+
+
+def category():
+    return Field(str, nonempty=True, choices=CATEGORY_NAMES)
+
+
+def answer_in_options(record):
+    options = record.get('options')
+    if options and record.get('answer') not in options:
+        return f"答案 {record.get('answer')!r} 不在选项 {options} 中"
+    return None
+
+
+def options_required(record):
+    if record.get('type') == 'choice' and not record.get('options'):
+        return "选择题缺少 options"
+    return None
+
+
+def blank_in_example(example):
+    """blank 为例句中的位置 [起, 止)"""
+    blank = example.get('blank')
+    italian = example.get('italian')
+    if blank is None or type(italian) is not str:
+        return None
+    if (type(blank) is not list or len(blank) != 2 or any(type(k) is not int for k in blank)
+            or not 0 <= blank[0] < blank[1] <= len(italian)):
+        return f"blank {blank!r} 应为 [起, 止]，0 <= 起 < 止 <= {len(italian)}"
+    return None
+
+
+WORD_EXAMPLE = {
+    'italian': text(),
+    'chinese': text(),
+    'blank': list_of(int, required=False),
+    '__checks__': (blank_in_example,),
+}
+PHRASE_EXAMPLE = {'italian': text(), 'chinese': text()}
+
+WORD = {
+    'id': text(),
+    'italian': text(),
+    'chinese': text(),
+    'english': Field(str),
+    'pronunciation': Field(str),
+    'category': category(),
+    'level': level(),
+    'createdAt': optional(str),
+    'examples': list_of((str, WORD_EXAMPLE)),
+    'audioUrl': optional(str),
+    'imageUrl': optional(str),
+}
+
+QUESTION = {
+    'id': text(),
+    'type': Field(str, choices=('choice', 'true_false')),
+    'question': text(),
+    'questionItalian': text(),
+    'options': list_of(str, required=False),
+    'answer': text(),
+    'explanation': Field(str),
+    '__checks__': (answer_in_options, options_required),
+}
+
+PASSAGE = {
+    'id': text(),
+    'title': text(),
+    'titleChinese': text(),
+    'level': level(),
+    'category': text(),
+    'content': text(),
+    'wordCount': Field(int),
+    'estimatedMinutes': Field(int),
+    'questions': list_of(QUESTION),
+    'audioUrl': optional(str),
+    'createdAt': text(),
+}
+
+TOKEN = {
+    'text': text(),
+    'translation': Field(str),
+    'type': text(),
+    'phonetic': optional(str),
+    'isPunctuation': optional(bool),
+}
+
+MESSAGE = {
+    'id': text(),
+    'speaker': text(),
+    'italian': text(),
+    'chinese': text(),
+    'context': Field(str),
+    'words': list_of(TOKEN),
+    'audioUrl': optional(str),
+}
+
+CONVERSATION = {
+    'id': text(),
+    'title': text(),
+    'description': Field(str),
+    'category': text(),
+    'level': level(),
+    'scenario': Field(str),
+    'vocabulary': list_of(str),
+    'culturalNote': optional(str),
+    'isPopular': optional(bool),
+    'emoji': text(),
+    'messages': list_of(MESSAGE, nonempty=True),
+}
+
+PHRASE = {
+    'id': text(),
+    'italian': text(),
+    'chinese': text(),
+    'phonetic': Field(str),
+    'category': text(),
+    'context': Field(str),
+    'level': level(),
+    'examples': list_of((str, PHRASE_EXAMPLE)),
+    'emoji': optional(str),
+    'isPopular': optional(bool),
+}
+
+GRAMMAR_EXERCISE = {
+    'id': Field(str, required=False),
+    'type': Field(str, choices=('choice', 'fill_blank')),
+    'question': text(),
+    'options': list_of(str, required=False),
+    'answer': text(),
+    'explanation': optional(str),
+    '__checks__': (answer_in_options, options_required),
+}
+
+GRAMMAR = {
+    'id': text(),
+    'title': text(),
+    'category': text(),
+    'level': level(),
+    'description': Field(str),
+    'rules': list_of({'title': text(), 'content': Field(str), 'points': list_of(str)}),
+    'examples': list_of({
+        'italian': text(),
+        'chinese': text(),
+        'english': optional(str),
+        'highlight': optional(str),
+        'highlights': list_of(str, required=False),
+    }),
+    'exercises': list_of(GRAMMAR_EXERCISE),
+    'imageUrl': optional(str),
+    'createdAt': optional(str),
+}
+
+# 资源名 → 嵌套记录的字段：其中记录的 ID 在整个资源中唯一
+NESTED_IDS = {
+    'conversations': 'messages',
+}
+
+SCHEMAS = {
+    'words': WORD,
+    'passages': PASSAGE,
+    'conversations': CONVERSATION,
+    'phrases': PHRASE,
+    'grammar': GRAMMAR,
+}
+
+_TYPE_NAMES = {str: "字符串", int: "整数", bool: "布尔值", list: "数组", dict: "对象"}
+
+
+def _type_name(kind):
+    if isinstance(kind, tuple):
+        return " 或 ".join(_type_name(k) for k in kind)
+    return _TYPE_NAMES[dict if isinstance(kind, dict) else kind]
+
+
+def compile_kind(kind):
+    """把类型或嵌套结构编译成 check(value, path, errors)，类型不符时返回 False"""
+    if isinstance(kind, tuple):
+        options = [(dict if isinstance(k, dict) else k, compile_kind(k)) for k in kind]
+
+        def check_any(value, path, errors):
+            for python_type, check in options:
+                if type(value) is python_type:
+                    return check(value, path, errors)
+            return False
+        return check_any
+
+    if isinstance(kind, dict):
+        return compile_schema(kind)
+
+    def check_type(value, path, errors):
+        # bool 是 int 的子类，用 type 精确比较
+        return type(value) is kind
+    return check_type
+
+
+def compile_field(name, field):
+    check_kind = compile_kind(field.kind)
+    check_item = compile_kind(field.items) if field.items is not None else None
+    expected = _type_name(field.kind)
+    item_expected = _type_name(field.items) if field.items is not None else None
+    choices = set(field.choices) if field.choices else None
+
+    def check(record, path, errors):
+        if name not in record:
+            if field.required:
+                errors.append(f"{path}: 缺少字段 {name}")
+            return
+        value = record[name]
+        where = f"{path}.{name}"
+        if value is None:
+            if not field.nullable:
+                errors.append(f"{where}: 不能为 null")
+            return
+        if check_kind(value, where, errors) is False:
+            errors.append(f"{where}: 应为{expected}, 实际为 {type(value).__name__}")
+            return
+        if field.nonempty and not (value.strip() if type(value) is str else value):
+            errors.append(f"{where}: 不能为空")
+        if choices is not None and value not in choices:
+            errors.append(f"{where}: {value!r} 不是有效值 ({', '.join(field.choices)})")
+        if check_item is not None:
+            for i, item in enumerate(value):
+                if check_item(item, f"{where}[{i}]", errors) is False:
+                    errors.append(f"{where}[{i}]: 应为{item_expected}, 实际为 {type(item).__name__}")
+    return check
+
+
+def compile_schema(schema):
+    """把结构声明编译成检查函数"""
+    fields = [compile_field(name, field) for name, field in schema.items() if name != '__checks__']
+    rules = schema.get('__checks__', ())
+    known = set(schema)
+
+    def check(record, path, errors):
+        if type(record) is not dict:
+            return False
+        for check_field in fields:
+            check_field(record, path, errors)
+        for key in record:
+            if key not in known:
+                errors.append(f"{path}: 未知字段 {key}")
+        for rule in rules:
+            message = rule(record)
+            if message:
+                errors.append(f"{path}: {message}")
+        return True
+    return check
+
+
+CHECKS = {name: compile_schema(schema) for name, schema in SCHEMAS.items()}
+
+
+def record_path(asset, index, record):
+    record_id = record.get('id') if isinstance(record, dict) else None
+    return f"{asset.filename}[{index}]" + (f"(id={record_id})" if record_id else "")
+
+
+def nested_ids(asset, record, path):
+    """嵌套记录的 (ID, 路径)"""
+    key = NESTED_IDS.get(asset.name)
+    items = record.get(key) if key else None
+    if type(items) is not list:
+        return
+    for k, item in enumerate(items):
+        if type(item) is dict and type(item.get('id')) is str:
+            yield item['id'], f"{path}.{key}[{k}]"
+
+
+def validate_records(asset, records, positions=None):
+    """逐条校验记录，返回错误列表；positions 为记录在资源中的下标（默认按顺序）"""
+    check = CHECKS[asset.name]
+    errors = []
+    seen = {}
+    seen_nested = {}
+    for i, record in enumerate(records):
+        index = positions[i] if positions is not None else i
+        path = record_path(asset, index, record)
+        if check(record, path, errors) is False:
+            errors.append(f"{path}: 记录应为对象")
+            continue
+        record_id = record.get('id')
+        if record_id in seen:
+            errors.append(f"{path}: ID 与第 {seen[record_id]} 条重复")
+        elif record_id is not None:
+            seen[record_id] = index
+        for nested_id, nested_path in nested_ids(asset, record, path):
+            if nested_id in seen_nested:
+                errors.append(f"{nested_path}: ID {nested_id} 与 {seen_nested[nested_id]} 重复")
+            else:
+                seen_nested[nested_id] = nested_path
+    return errors
+
+
+def document_shape(asset):
+    if asset.records_key is None:
+        return "顶层应为记录数组"
+    return f"顶层应为对象，记录数组在 {asset.records_key} 键下"
+
+
+def check_summary(asset, summary, count):
+    """汇总字段（记录数、更新时间）与记录数一致"""
+    errors = []
+    if asset.count_key and summary.get(asset.count_key) != count:
+        errors.append(f"{asset.filename}: {asset.count_key}={summary.get(asset.count_key)} 与记录数 {count} 不符")
+    if asset.updated_key and not isinstance(summary.get(asset.updated_key), str):
+        errors.append(f"{asset.filename}: 缺少 {asset.updated_key}")
+    return errors
+
+
+def shape_errors(asset, doc):
+    """顶层结构检查，通过后才能用 asset.records(doc) 取记录"""
+    if asset.records_key is None:
+        valid = isinstance(doc, list)
+    else:
+        valid = isinstance(doc, dict) and isinstance(doc.get(asset.records_key), list)
+    return [] if valid else [f"{asset.filename}: {document_shape(asset)}"]
+
+
+def validate_document(asset, doc):
+    """校验整个文档：先检查顶层结构，再校验记录本身和汇总字段"""
+    errors = shape_errors(asset, doc)
+    if errors:
+        return errors
+    records = asset.records(doc)
+    errors = validate_records(asset, records)
+    if asset.records_key is not None:
+        errors += check_summary(asset, doc, len(records))
+    return errors
+
+
+def validate_asset(name, data_dir=DATA_DIR):
+    """逐条读取并校验一个资源文件，返回 (资源名, 记录数, 错误列表)
+
+    用 RecordReader 流式读取，不把整个文档载入内存；顶层结构不对或 JSON
+    解析失败时只报告这一个错误，记录数为 0。
+    """
+    asset = ASSETS[name]
+    reader = iter_records(asset, data_dir)
+    count = 0
+
+    def records():
+        nonlocal count
+        for record in reader:
+            count += 1
+            yield record
+
+    try:
+        errors = validate_records(asset, records())
+    except json.JSONDecodeError as e:
+        return name, 0, [f"{asset.filename}: JSON 解析失败: {e}"]
+    except ValueError as e:
+        return name, 0, [f"{e} ({document_shape(asset)})"]
+    if asset.records_key is not None:
+        errors += check_summary(asset, {**reader.head, **reader.tail}, count)
+    return name, count, errors
+
+
+def validate_all(data_dir=DATA_DIR, names=None, jobs=1):
+    """校验多个资源文件，jobs > 1 时按文件并行"""
+    names = list(names or ASSETS)
+    if jobs > 1 and len(names) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(names))) as pool:
+            return list(pool.map(validate_asset, names, [data_dir] * len(names)))
+    return [validate_asset(name, data_dir) for name in names]
+
+
+def format_errors(filename, errors):
+    shown = errors[:MAX_ERRORS]
+    lines = [f"{filename} 校验失败 ({len(errors)} 个错误):"] + [f"  {error}" for error in shown]
+    if len(errors) > len(shown):
+        lines.append(f"  ... 另有 {len(errors) - len(shown)} 个错误")
+    return "\n".join(lines)
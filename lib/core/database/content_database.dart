@@ -0,0 +1,198 @@
+import 'dart:convert';
+import 'dart:io';
+import 'package:flutter/foundation.dart';
+import 'package:flutter/services.dart';
+import 'package:sqflite/sqflite.dart';
+import 'package:path/path.dart' as path;
+import '../../shared/models/example_sentence.dart';
+import '../../shared/models/word.dart';
+
+/// 预建的只读内容库（assets/bundle/content.db，由 italiano_content 生成）
+///
+/// 词汇、常用语、语法和阅读文章只从这里读取，对应的 JSON 不打包。
+/// 首次使用时把资源中的库复制到数据库目录；content_db.json 中的 version
+/// 与已复制库的 meta.version 不同时（内容更新后）重新复制。
+/// 库不可用时各查询返回 null，由调用方按加载失败处理。
+class ContentDatabase {
+  static final ContentDatabase instance = ContentDatabase._init();
+  static const String assetPath = 'assets/bundle/content.db';
+  static const String versionAssetPath = 'assets/bundle/content_db.json';
+  static const String fileName = 'italiano_content.db';
+
+  Future<Database?>? _database;
+
+  ContentDatabase._init();
+
+  Future<Database?> get database => _database ??= _open();
+
+  /// 启动时检查内容资源是否已生成
+  ///
+  /// assets/bundle 是生成的目录（不提交），克隆后没有运行
+  /// `python -m italiano_content build --release` 时应用里没有任何内容数据，
+  /// 这里直接报错说明原因，而不是让各页面静默显示为空。
+  static Future<void> checkBundle() async {
+    try {
+      await rootBundle.loadString(versionAssetPath);
+    } catch (e) {
+      throw FlutterError(
+        '内容资源未生成：找不到 $versionAssetPath。\n'
+        '请先在项目根目录运行 python -m italiano_content build --release，'
+        '再执行 flutter run / flutter build。',
+      );
+    }
+  }
+
+  Future<Database?> _open() async {
+    try {
+      final info = json.decode(await rootBundle.loadString(versionAssetPath)) as Map<String, dynamic>;
+      final dbPath = path.join(await getDatabasesPath(), fileName);
+
+      if (await File(dbPath).exists()) {
+        final db = await openDatabase(dbPath, readOnly: true);
+        if (await _version(db) == info['version']) return db;
+        await db.close();
+      }
+
+      // 写到临时文件再改名，避免复制中断留下损坏的库
+      final data = await rootBundle.load(assetPath);
+      final temp = File('$dbPath.tmp');
+      await temp.parent.create(recursive: true);
+      await temp.writeAsBytes(
+        data.buffer.asUint8List(data.offsetInBytes, data.lengthInBytes),
+        flush: true,
+      );
+      await temp.rename(dbPath);
+      return await openDatabase(dbPath, readOnly: true);
+    } catch (e) {
+      debugPrint('Error opening content database: $e');
+      return null;
+    }
+  }
+
+  Future<String?> _version(Database db) async {
+    try {
+      final rows = await db.query('meta', columns: ['value'], where: 'key = ?', whereArgs: ['version']);
+      return rows.isEmpty ? null : rows.first['value'] as String?;
+    } catch (e) {
+      return null;
+    }
+  }
+
+  static const List<String> levels = ['A1', 'A2', 'B1', 'B2', 'C1', 'C2'];
+
+  /// 按等级、类别查询单词（走等级、类别编码的索引），两者都不传时返回全部，
+  /// 顺序与 sample_words.json 相同
+  Future<List<Word>?> words({String? level, String? category}) async {
+    final db = await database;
+    if (db == null) return null;
+    final conditions = <String>[];
+    final args = <Object>[];
+    if (level != null) {
+      conditions.add('level_code = ?');
+      args.add(levels.indexOf(level));
+    }
+    if (category != null) {
+      conditions.add('category_code = (SELECT code FROM categories WHERE name = ?)');
+      args.add(category);
+    }
+    final where = conditions.isEmpty ? '' : 'WHERE ${conditions.join(' AND ')}';
+    try {
+      final rows = await db.rawQuery('SELECT * FROM words $where ORDER BY position', args);
+      final examples = await db.rawQuery(
+        'SELECT e.word_id, e.italian, e.chinese, e.blank_start, e.blank_end FROM examples e '
+        'JOIN words ON words.id = e.word_id $where ORDER BY e.word_id, e.seq',
+        args,
+      );
+      final byWord = <String, List<ExampleSentence>>{};
+      for (final row in examples) {
+        byWord.putIfAbsent(row['word_id'] as String, () => []).add(ExampleSentence(
+          italian: row['italian'] as String? ?? '',
+          chinese: row['chinese'] as String? ?? '',
+          blankStart: row['blank_start'] as int?,
+          blankEnd: row['blank_end'] as int?,
+        ));
+      }
+      return [for (final row in rows) _word(row, byWord[row['id']] ?? const [])];
+    } catch (e) {
+      debugPrint('Error querying content database: $e');
+      return null;
+    }
+  }
+
+  /// 按资源文件中的顺序读出一张表（phrases、grammar、passages）的全部记录
+  ///
+  /// 库中的 fields 表给出每列对应的 JSON 字段名和类型，还原出的记录与
+  /// 资源文件中的相同（json 列解码，bool 列还原成 true/false，空值省略），
+  /// 直接交给各模型的 fromJson。
+  Future<List<Map<String, dynamic>>?> records(String table) async {
+    final db = await database;
+    if (db == null) return null;
+    try {
+      final fields = await db.query('fields', where: 'table_name = ?', whereArgs: [table]);
+      final rows = await db.rawQuery('SELECT * FROM $table ORDER BY position');
+      return [
+        for (final row in rows)
+          {
+            for (final field in fields)
+              if (row[field['column_name']] != null)
+                field['field'] as String: _value(row[field['column_name']]!, field['kind'] as String),
+          },
+      ];
+    } catch (e) {
+      debugPrint('Error querying content database: $e');
+      return null;
+    }
+  }
+
+  static Object _value(Object value, String kind) {
+    switch (kind) {
+      case 'json':
+        return json.decode(value as String) as Object;
+      case 'bool':
+        return value == 1;
+      default:
+        return value;
+    }
+  }
+
+  /// 全文搜索匹配的单词ID；FTS5 不可用时返回 null
+  ///
+  /// 意大利语/英语按词前缀匹配（不区分大小写和重音），汉字按字匹配，
+  /// 所有词和字需要同时匹配。
+  Future<Set<String>?> searchWordIds(List<String> latinTokens, List<String> hanChars) async {
+    final db = await database;
+    if (db == null) return null;
+    final terms = [
+      for (final token in latinTokens) '"$token"*',
+      for (final char in hanChars) '"$char"',
+    ];
+    if (terms.isEmpty) return {};
+    try {
+      final rows = await db.rawQuery(
+        'SELECT words.id FROM words_fts JOIN words ON words.position = words_fts.rowid '
+        'WHERE words_fts MATCH ? ORDER BY words.position',
+        [terms.join(' ')],
+      );
+      return {for (final row in rows) row['id'] as String};
+    } catch (e) {
+      debugPrint('Error searching content database: $e');
+      return null;
+    }
+  }
+
+  Word _word(Map<String, Object?> row, List<ExampleSentence> examples) {
+    return Word(
+      id: row['id'] as String,
+      italian: row['italian'] as String? ?? '',
+      chinese: row['chinese'] as String? ?? '',
+      english: row['english'] as String?,
+      pronunciation: row['pronunciation'] as String?,
+      audioUrl: row['audio_url'] as String?,
+      category: row['category'] as String? ?? '',
+      level: row['level'] as String? ?? 'A1',
+      examples: examples,
+      imageUrl: row['image_url'] as String?,
+      createdAt: DateTime.tryParse(row['created_at'] as String? ?? '') ?? DateTime.now(),
+    );
+  }
+}
@@ -3,6 +3,32 @@ import '../../shared/models/word.dart';
 import '../../shared/models/grammar.dart';
 import '../../shared/models/quiz.dart';
 
+/// 预先生成的干扰项池（见 italiano_content/distractors.py）
+class DistractorPools {
+  final Map<String, List<String>> pools;
+  final Map<String, Word> wordsById;
+
+  DistractorPools(this.pools, List<Word> words)
+      : wordsById = {for (final w in words) w.id: w};
+
+  /// 从池中最合适的前几个里随机取 [count] 个，让同一个词每次的选项有变化
+  List<Word> pick(
+    Word word,
+    int count,
+    Random random, {
+    bool Function(Word)? where,
+  }) {
+    final candidates = (pools[word.id] ?? const <String>[])
+        .map((id) => wordsById[id])
+        .whereType<Word>()
+        .where((w) => where == null || where(w))
+        .take(count * 2)
+        .toList();
+    candidates.shuffle(random);
+    return candidates.take(count).toList();
+  }
+}
+
 /// 测验题目生成服务
 class QuizGeneratorService {
   final Random _random = Random();
@@ -12,6 +38,7 @@ class QuizGeneratorService {
     List<Word> words, {
     int count = 10,
     QuizDifficulty difficulty = QuizDifficulty.mixed,
+    DistractorPools? distractors,
   }) {
     final filteredWords = _filterByDifficulty(words, difficulty);
     if (filteredWords.isEmpty) return [];
@@ -25,13 +52,13 @@ class QuizGeneratorService {
 
       if (questionType == 0) {
         // 意大利语 -> 中文
-        questions.add(_generateItalianToChineseQuestion(word, filteredWords));
+        questions.add(_generateItalianToChineseQuestion(word, filteredWords, distractors));
       } else if (questionType == 1) {
         // 中文 -> 意大利语
-        questions.add(_generateChineseToItalianQuestion(word, filteredWords));
+        questions.add(_generateChineseToItalianQuestion(word, filteredWords, distractors));
       } else {
         // 例句填空
-        questions.add(_generateFillBlankQuestion(word, filteredWords));
+        questions.add(_generateFillBlankQuestion(word, filteredWords, distractors));
       }
     }
 
@@ -79,12 +106,17 @@ class QuizGeneratorService {
     List<GrammarPoint> grammarPoints, {
     int count = 20,
     QuizDifficulty difficulty = QuizDifficulty.mixed,
+    DistractorPools? distractors,
   }) {
     final vocabCount = (count * 0.6).round(); // 60%词汇
     final grammarCount = count - vocabCount; // 40%语法
 
-    final vocabQuestions =
-        generateVocabularyQuestions(words, count: vocabCount, difficulty: difficulty);
+    final vocabQuestions = generateVocabularyQuestions(
+      words,
+      count: vocabCount,
+      difficulty: difficulty,
+      distractors: distractors,
+    );
     final grammarQuestions = generateGrammarQuestions(
       grammarPoints,
       count: grammarCount,
@@ -101,11 +133,11 @@ class QuizGeneratorService {
   QuizQuestion _generateItalianToChineseQuestion(
     Word word,
     List<Word> allWords,
+    DistractorPools? distractors,
   ) {
-    final wrongOptions = _selectRandom(
-      allWords.where((w) => w.id != word.id).toList(),
-      3,
-    ).map((w) => w.chinese).toList();
+    final wrongOptions = _pickDistractors(word, allWords, 3, distractors)
+        .map((w) => w.chinese)
+        .toList();
 
     final options = [word.chinese, ...wrongOptions];
     options.shuffle();
@@ -117,7 +149,7 @@ class QuizGeneratorService {
       options: options,
       correctAnswer: word.chinese,
       explanation: word.pronunciation != null
-          ? '发音: ${word.pronunciation}\n${word.examples.isNotEmpty ? word.examples.first : ""}' : word.examples.isNotEmpty ? word.examples.first : null,
+          ? '发音: ${word.pronunciation}\n${word.examples.isNotEmpty ? word.examples.first : ""}' : word.examples.isNotEmpty ? word.examples.first.toString() : null,
       level: word.level,
       relatedWordId: word.id,
     );
@@ -127,11 +159,11 @@ class QuizGeneratorService {
   QuizQuestion _generateChineseToItalianQuestion(
     Word word,
     List<Word> allWords,
+    DistractorPools? distractors,
   ) {
-    final wrongOptions = _selectRandom(
-      allWords.where((w) => w.id != word.id).toList(),
-      3,
-    ).map((w) => w.italian).toList();
+    final wrongOptions = _pickDistractors(word, allWords, 3, distractors)
+        .map((w) => w.italian)
+        .toList();
 
     final options = [word.italian, ...wrongOptions];
     options.shuffle();
@@ -143,7 +175,7 @@ class QuizGeneratorService {
       options: options,
       correctAnswer: word.italian,
       explanation: word.pronunciation != null
-          ? '发音: ${word.pronunciation}\n${word.examples.isNotEmpty ? word.examples.first : ""}' : word.examples.isNotEmpty ? word.examples.first : null,
+          ? '发音: ${word.pronunciation}\n${word.examples.isNotEmpty ? word.examples.first : ""}' : word.examples.isNotEmpty ? word.examples.first.toString() : null,
       level: word.level,
       relatedWordId: word.id,
     );
@@ -153,21 +185,29 @@ class QuizGeneratorService {
   QuizQuestion _generateFillBlankQuestion(
     Word word,
     List<Word> allWords,
+    DistractorPools? distractors,
   ) {
-    if (word.examples.isEmpty) {
-      // 如果没有例句,回退到意大利语->中文题
-      return _generateItalianToChineseQuestion(word, allWords);
+    // 挖空位置由 italiano_content 在构建时算好（含变化形式，如 parlare 的 parlo）
+    final examples = word.examples.where((e) => e.hasBlank).toList();
+    if (examples.isEmpty) {
+      // 如果没有可挖空的例句,回退到意大利语->中文题
+      return _generateItalianToChineseQuestion(word, allWords, distractors);
     }
 
-    final example = word.examples[_random.nextInt(word.examples.length)];
-    final questionText = example.replaceAll(word.italian, '______');
+    final example = examples[_random.nextInt(examples.length)];
+    final questionText = example.blanked();
+    // 答案是空白处原文（可能是变化形式，如 parlo），词头放在解析里
+    final blankText = example.blankText!;
 
-    final wrongOptions = _selectRandom(
-      allWords.where((w) => w.id != word.id && w.level == word.level).toList(),
+    final wrongOptions = _pickDistractors(
+      word,
+      allWords,
       3,
+      distractors,
+      where: (w) => w.level == word.level && w.italian.toLowerCase() != blankText.toLowerCase(),
     ).map((w) => w.italian).toList();
 
-    final options = [word.italian, ...wrongOptions];
+    final options = [blankText, ...wrongOptions];
     options.shuffle();
 
     return QuizQuestion(
@@ -175,13 +215,37 @@ class QuizGeneratorService {
       type: QuizType.vocabulary,
       question: '请选择正确的单词填入空白处:\n\n$questionText',
       options: options,
-      correctAnswer: word.italian,
-      explanation: '完整句子: $example',
+      correctAnswer: blankText,
+      explanation: blankText.toLowerCase() == word.italian.toLowerCase()
+          ? '完整句子: $example\n单词: ${word.italian}（${word.chinese}）'
+          : '完整句子: $example\n$blankText 是 ${word.italian}（${word.chinese}）的变化形式',
       level: word.level,
       relatedWordId: word.id,
     );
   }
 
+  /// 选择干扰项：优先取干扰项池（同类别、拼写相近、已排除同义词），
+  /// 没有池或池中不够时从 [allWords] 随机补足
+  List<Word> _pickDistractors(
+    Word word,
+    List<Word> allWords,
+    int count,
+    DistractorPools? distractors, {
+    bool Function(Word)? where,
+  }) {
+    final picked = distractors?.pick(word, count, _random, where: where) ?? <Word>[];
+    if (picked.length < count) {
+      final taken = {word.id, ...picked.map((w) => w.id)};
+      picked.addAll(_selectRandom(
+        allWords
+            .where((w) => !taken.contains(w.id) && (where == null || where(w)))
+            .toList(),
+        count - picked.length,
+      ));
+    }
+    return picked;
+  }
+
   /// 根据难度筛选单词
   List<Word> _filterByDifficulty(List<Word> words, QuizDifficulty difficulty) {
     switch (difficulty) {
@@ -1,14 +1,13 @@
-import 'dart:convert';
-import 'package:flutter/services.dart';
 import '../../shared/models/reading.dart';
+import '../database/content_database.dart';
 
 /// 阅读文章加载服务
 class ReadingService {
   Future<List<ReadingPassage>> loadReadingPassages() async {
     try {
-      final String response = await rootBundle.loadString('assets/data/reading_passages.json');
-      final List<dynamic> data = json.decode(response);
-      return data.map((json) => ReadingPassage.fromJson(json)).toList();
+      final records = await ContentDatabase.instance.records('passages');
+      if (records == null) return [];
+      return records.map((json) => ReadingPassage.fromJson(json)).toList();
     } catch (e) {
       // Error loading reading passages
       return [];
@@ -28,6 +28,12 @@ class _VocabularyListScreenState extends ConsumerState<VocabularyListScreen> {
     final colorScheme = theme.colorScheme;
     final wordsAsync = ref.watch(allWordsProvider);
     final learningProgress = ref.watch(learningProgressProvider);
+    // 搜索索引查出的匹配ID，索引未就绪时为 null，退回逐个匹配
+    final searchHits = _searchQuery.isEmpty
+        ? null
+        : ref.watch(wordSearchProvider(_searchQuery)).valueOrNull;
+    // 分类表中的类别（按编码排列），未就绪时从词汇中收集
+    final taxonomy = ref.watch(wordTaxonomyProvider).valueOrNull;
 
     return Scaffold(
       appBar: AppBar(
@@ -74,7 +80,11 @@ class _VocabularyListScreenState extends ConsumerState<VocabularyListScreen> {
           // 筛选单词
           var filteredWords = allWords.where((word) {
             // 搜索过滤
-            if (_searchQuery.isNotEmpty) {
+            if (searchHits != null) {
+              if (!searchHits.contains(word.id)) {
+                return false;
+              }
+            } else if (_searchQuery.isNotEmpty) {
               final query = _searchQuery.toLowerCase();
               if (!word.italian.toLowerCase().contains(query) &&
                   !word.chinese.toLowerCase().contains(query) &&
@@ -124,7 +134,8 @@ class _VocabularyListScreenState extends ConsumerState<VocabularyListScreen> {
 
           // 获取所有级别和分类
           final levels = allWords.map((w) => w.level).toSet().toList()..sort();
-          final categories = allWords.map((w) => w.category).toSet().toList()..sort();
+          final categories = taxonomy?.categoryNames ??
+              (allWords.map((w) => w.category).toSet().toList()..sort());
 
           return Column(
             children: [
@@ -1,11 +1,15 @@
 import 'package:flutter/material.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
+import 'core/database/content_database.dart';
 import 'core/theme/openai_theme.dart';
 import 'features/home/home_screen.dart';
 import 'features/onboarding/onboarding_screen.dart';
 import 'shared/providers/onboarding_provider.dart';
 
-void main() {
+Future<void> main() async {
+  WidgetsFlutterBinding.ensureInitialized();
+  // 内容数据由 italiano_content 生成，缺失时立即报错
+  await ContentDatabase.checkBundle();
   runApp(
     const ProviderScope(
       child: MyApp(),
@@ -95,13 +95,19 @@ class ConversationMessage {
     this.audioUrl,
   });
 
-  factory ConversationMessage.fromJson(Map<String, dynamic> json) {
+  /// [glosses] 为共享词表（daily_conversations.packed.json），此时 words 是词表下标
+  factory ConversationMessage.fromJson(
+    Map<String, dynamic> json, {
+    List<ConversationWord>? glosses,
+  }) {
     return ConversationMessage(
       id: json['id'] as String,
       speaker: json['speaker'] as String,
       italian: json['italian'] as String,
       words: (json['words'] as List<dynamic>)
-          .map((wordJson) => ConversationWord.fromJson(wordJson))
+          .map((wordJson) => glosses != null
+              ? glosses[wordJson as int]
+              : ConversationWord.fromJson(wordJson))
           .toList(),
       chinese: json['chinese'] as String,
       context: json['context'] as String,
@@ -150,7 +156,10 @@ class DailyConversation {
     required this.emoji,
   });
 
-  factory DailyConversation.fromJson(Map<String, dynamic> json) {
+  factory DailyConversation.fromJson(
+    Map<String, dynamic> json, {
+    List<ConversationWord>? glosses,
+  }) {
     return DailyConversation(
       id: json['id'] as String,
       title: json['title'] as String,
@@ -159,7 +168,7 @@ class DailyConversation {
       level: json['level'] as String,
       scenario: json['scenario'] as String,
       messages: (json['messages'] as List<dynamic>)
-          .map((messageJson) => ConversationMessage.fromJson(messageJson))
+          .map((messageJson) => ConversationMessage.fromJson(messageJson, glosses: glosses))
           .toList(),
       vocabulary: (json['vocabulary'] as List<dynamic>)
           .map((vocab) => vocab as String)
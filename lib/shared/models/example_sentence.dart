@@ -0,0 +1,50 @@
+/// 例句（由 italiano_content 在构建时拆好，运行时不再解析字符串）
+class ExampleSentence {
+  final String italian;
+  final String chinese;
+  // 填空题挖空的位置 [blankStart, blankEnd)，即例句中词汇（或其变化形式）所在的位置
+  final int? blankStart;
+  final int? blankEnd;
+
+  const ExampleSentence({
+    required this.italian,
+    this.chinese = '',
+    this.blankStart,
+    this.blankEnd,
+  });
+
+  bool get hasBlank => blankStart != null && blankEnd != null;
+
+  /// 挖空处的原文（可能是变化形式，如 parlare 的 parlo）
+  String? get blankText => hasBlank ? italian.substring(blankStart!, blankEnd!) : null;
+
+  /// 把挖空处替换为 [placeholder] 后的例句
+  String blanked([String placeholder = '______']) => hasBlank
+      ? italian.replaceRange(blankStart!, blankEnd!, placeholder)
+      : italian;
+
+  factory ExampleSentence.fromJson(dynamic json) {
+    if (json is Map<String, dynamic>) {
+      final blank = json['blank'] as List<dynamic>?;
+      return ExampleSentence(
+        italian: json['italian']?.toString() ?? '',
+        chinese: json['chinese']?.toString() ?? '',
+        blankStart: blank != null && blank.length == 2 ? blank[0] as int : null,
+        blankEnd: blank != null && blank.length == 2 ? blank[1] as int : null,
+      );
+    }
+    // 旧格式的字符串例句只保留原文
+    return ExampleSentence(italian: json?.toString() ?? '');
+  }
+
+  Map<String, dynamic> toJson() {
+    return {
+      'italian': italian,
+      'chinese': chinese,
+      if (hasBlank) 'blank': [blankStart, blankEnd],
+    };
+  }
+
+  @override
+  String toString() => chinese.isEmpty ? italian : '$italian - $chinese';
+}
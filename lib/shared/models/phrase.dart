@@ -1,3 +1,5 @@
+import 'example_sentence.dart';
+
 /// 意大利语口语表达数据模型
 class ItalianPhrase {
   final String id;
@@ -7,7 +9,7 @@ class ItalianPhrase {
   final String category; // compliment, insult, casual, formal等
   final String context; // 使用场景说明
   final String level; // A1, A2, B1等难度级别
-  final List<String> examples; // 例句
+  final List<ExampleSentence> examples; // 例句
   final String? emoji; // 表情符号增加趣味性
   final bool isPopular; // 是否为常用表达
 
@@ -34,7 +36,7 @@ class ItalianPhrase {
       context: json['context'] as String,
       level: json['level'] as String,
       examples: (json['examples'] as List<dynamic>)
-          .map((e) => e as String)
+          .map(ExampleSentence.fromJson)
           .toList(),
       emoji: json['emoji'] as String?,
       isPopular: json['isPopular'] as bool? ?? false,
@@ -50,7 +52,7 @@ class ItalianPhrase {
       'category': category,
       'context': context,
       'level': level,
-      'examples': examples,
+      'examples': examples.map((e) => e.toJson()).toList(),
       'emoji': emoji,
       'isPopular': isPopular,
     };
@@ -1,3 +1,5 @@
+import 'example_sentence.dart';
+
 class Word {
   final String id;
   final String italian;
@@ -7,7 +9,7 @@ class Word {
   final String? audioUrl;
   final String category;
   final String level; // A1, A2, B1, B2, C1, C2
-  final List<String> examples; // 例句
+  final List<ExampleSentence> examples; // 例句
   final String? imageUrl;
   final DateTime createdAt;
 
@@ -35,7 +37,7 @@ class Word {
       'audioUrl': audioUrl,
       'category': category,
       'level': level,
-      'examples': examples,
+      'examples': examples.map((e) => e.toJson()).toList(),
       'imageUrl': imageUrl,
       'createdAt': createdAt.toIso8601String(),
     };
@@ -43,10 +45,9 @@ class Word {
 
   factory Word.fromJson(Map<String, dynamic> json) {
     // 安全解析examples字段
-    List<String> parseExamples(dynamic examplesData) {
-      if (examplesData == null) return [];
+    List<ExampleSentence> parseExamples(dynamic examplesData) {
       if (examplesData is List) {
-        return examplesData.map((e) => e.toString()).toList();
+        return examplesData.map(ExampleSentence.fromJson).toList();
       }
       return [];
     }
@@ -77,7 +78,7 @@ class Word {
     String? audioUrl,
     String? category,
     String? level,
-    List<String>? examples,
+    List<ExampleSentence>? examples,
     String? imageUrl,
     DateTime? createdAt,
   }) {
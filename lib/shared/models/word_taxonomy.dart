@@ -0,0 +1,62 @@
+/// 词汇分类表与成员索引（assets/bundle/words/taxonomy.json，由 italiano_content 生成）
+///
+/// 等级、类别编成小整数编码，每个等级、类别给出成员列表（词汇在
+/// sample_words.json 中的下标），按类别筛选直接取成员，不必逐个比较字符串。
+class TaxonomyEntry {
+  final int code;
+  final String id;
+  final String name;
+  final List<int> members;
+
+  const TaxonomyEntry({
+    required this.code,
+    required this.id,
+    required this.name,
+    required this.members,
+  });
+
+  int get count => members.length;
+
+  factory TaxonomyEntry.fromJson(Map<String, dynamic> json) {
+    return TaxonomyEntry(
+      code: json['code'] as int,
+      id: json['id'] as String? ?? json['name'] as String,
+      name: json['name'] as String,
+      members: (json['members'] as List<dynamic>).cast<int>(),
+    );
+  }
+}
+
+class WordTaxonomy {
+  final List<TaxonomyEntry> levels;
+  final List<TaxonomyEntry> categories;
+  // 与 sample_words.json 同序的单词ID
+  final List<String> ids;
+
+  final Map<String, TaxonomyEntry> _levelsByName;
+  final Map<String, TaxonomyEntry> _categoriesByName;
+
+  WordTaxonomy({required this.levels, required this.categories, required this.ids})
+      : _levelsByName = {for (final entry in levels) entry.name: entry},
+        _categoriesByName = {for (final entry in categories) entry.name: entry};
+
+  factory WordTaxonomy.fromJson(Map<String, dynamic> json) {
+    return WordTaxonomy(
+      levels: (json['levels'] as List<dynamic>)
+          .map((entry) => TaxonomyEntry.fromJson(entry as Map<String, dynamic>))
+          .toList(),
+      categories: (json['categories'] as List<dynamic>)
+          .map((entry) => TaxonomyEntry.fromJson(entry as Map<String, dynamic>))
+          .toList(),
+      ids: ((json['words'] as Map<String, dynamic>)['ids'] as List<dynamic>).cast<String>(),
+    );
+  }
+
+  /// 有词汇的类别名，按编码排列
+  List<String> get categoryNames =>
+      [for (final entry in categories) if (entry.count > 0) entry.name];
+
+  TaxonomyEntry? level(String name) => _levelsByName[name];
+
+  TaxonomyEntry? category(String name) => _categoriesByName[name];
+}
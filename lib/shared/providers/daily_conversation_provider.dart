@@ -53,33 +53,17 @@ class DailyConversationService {
       return _conversations;
     }
 
+    // 共享词表格式（由 italiano_content 生成），相同的逐词标注只解析一次
     try {
-      debugPrint('Loading daily conversations from assets...');
-      final String jsonString = await rootBundle.loadString('assets/data/daily_conversations.json');
-      debugPrint('JSON file loaded successfully, parsing...');
-
-      final Map<String, dynamic> data = json.decode(jsonString);
-      debugPrint('JSON decoded successfully, extracting conversations...');
-
-      if (!data.containsKey('conversations')) {
-        throw Exception('JSON file missing "conversations" key');
-      }
-
-      final conversationsList = data['conversations'] as List<dynamic>;
-      debugPrint('Found ${conversationsList.length} conversations');
-
-      _conversations = conversationsList
-          .map((json) {
-            try {
-              return DailyConversation.fromJson(json);
-            } catch (e) {
-              debugPrint('Error parsing conversation: $e');
-              debugPrint('Conversation data: $json');
-              rethrow;
-            }
-          })
+      final data = json.decode(
+        await rootBundle.loadString('assets/bundle/daily_conversations.packed.json'),
+      ) as Map<String, dynamic>;
+      final glosses = (data['glosses'] as List<dynamic>)
+          .map((gloss) => ConversationWord.fromJson(gloss as Map<String, dynamic>))
+          .toList(growable: false);
+      _conversations = (data['conversations'] as List<dynamic>)
+          .map((json) => DailyConversation.fromJson(json as Map<String, dynamic>, glosses: glosses))
           .toList();
-
       debugPrint('Successfully parsed ${_conversations.length} daily conversations');
       return _conversations;
     } catch (e) {
@@ -1,7 +1,6 @@
-import 'dart:convert';
 import 'package:flutter/foundation.dart';
-import 'package:flutter/services.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
+import '../../core/database/content_database.dart';
 import '../../core/database/grammar_progress_repository.dart';
 import '../../core/database/learning_statistics_repository.dart';
 import '../models/grammar.dart';
@@ -11,13 +10,13 @@ class GrammarService {
   List<GrammarPoint>? _cachedGrammar;
 
   Future<List<GrammarPoint>> loadGrammarPoints() async {
-    // 优化：使用缓存避免重复解析 JSON
+    // 优化：使用缓存避免重复查询内容库
     if (_cachedGrammar != null) return _cachedGrammar!;
 
     try {
-      final String jsonString = await rootBundle.loadString('assets/data/sample_grammar.json');
-      final List<dynamic> jsonData = json.decode(jsonString);
-      _cachedGrammar = jsonData.map((json) => GrammarPoint.fromJson(json)).toList();
+      final records = await ContentDatabase.instance.records('grammar');
+      if (records == null) throw Exception('Content database unavailable');
+      _cachedGrammar = records.map((json) => GrammarPoint.fromJson(json)).toList();
       return _cachedGrammar!;
     } catch (e) {
       debugPrint('Error loading grammar points: $e');
@@ -1,7 +1,6 @@
-import 'dart:convert';
-import 'package:flutter/services.dart';
 import 'package:riverpod_annotation/riverpod_annotation.dart';
 import '../models/phrase.dart';
+import '../../core/database/content_database.dart';
 
 part 'phrase_provider.g.dart';
 
@@ -17,12 +16,10 @@ class PhraseNotifier extends _$PhraseNotifier {
 
   Future<void> _loadPhrases() async {
     try {
-      final String jsonString = await rootBundle.loadString('assets/data/italian_phrases.json');
-      final Map<String, dynamic> data = json.decode(jsonString);
+      final records = await ContentDatabase.instance.records('phrases');
+      if (records == null) throw Exception('Content database unavailable');
 
-      _allPhrases = (data['phrases'] as List<dynamic>)
-          .map((json) => ItalianPhrase.fromJson(json as Map<String, dynamic>))
-          .toList();
+      _allPhrases = records.map((json) => ItalianPhrase.fromJson(json)).toList();
 
       state = AsyncValue.data(_allPhrases);
     } catch (e) {
@@ -10,6 +10,15 @@ import 'grammar_provider.dart';
 final quizRepositoryProvider = Provider((ref) => QuizRepository());
 final quizGeneratorProvider = Provider((ref) => QuizGeneratorService());
 
+// 测验干扰项池provider（不可用时为 null，出题退回随机挑选）
+final distractorPoolsProvider = FutureProvider<DistractorPools?>((ref) async {
+  final service = ref.watch(vocabularyServiceProvider);
+  final pools = await service.loadDistractorPools();
+  if (pools == null) return null;
+  final words = await ref.watch(allWordsProvider.future);
+  return DistractorPools(pools, words);
+});
+
 // 当前测验会话provider
 final currentQuizSessionProvider =
     StateNotifierProvider<QuizSessionNotifier, QuizSession?>((ref) {
@@ -108,12 +117,14 @@ final comprehensiveQuizProvider =
     final generator = ref.watch(quizGeneratorProvider);
     final wordsAsync = await ref.watch(allWordsProvider.future);
     final grammarAsync = await ref.watch(allGrammarProvider.future);
+    final distractors = await ref.watch(distractorPoolsProvider.future);
 
     return generator.generateComprehensiveQuiz(
       wordsAsync,
       grammarAsync,
       count: 20,
       difficulty: difficulty,
+      distractors: distractors,
     );
   },
 );
@@ -124,6 +135,7 @@ final dailyChallengeQuestionsProvider =
   final generator = ref.watch(quizGeneratorProvider);
   final wordsAsync = await ref.watch(allWordsProvider.future);
   final grammarAsync = await ref.watch(allGrammarProvider.future);
+  final distractors = await ref.watch(distractorPoolsProvider.future);
 
   // 每日挑战固定10题,混合难度
   return generator.generateComprehensiveQuiz(
@@ -131,6 +143,7 @@ final dailyChallengeQuestionsProvider =
     grammarAsync,
     count: 10,
     difficulty: QuizDifficulty.mixed,
+    distractors: distractors,
   );
 });
 
@@ -162,6 +175,7 @@ final wrongQuestionsQuizProvider =
   final generator = ref.watch(quizGeneratorProvider);
   final wordsAsync = await ref.watch(allWordsProvider.future);
   final grammarAsync = await ref.watch(allGrammarProvider.future);
+  final distractors = await ref.watch(distractorPoolsProvider.future);
 
   // 从错题中提取相关的单词和语法ID
   final wrongWordIds = wrongRecords
@@ -190,10 +204,11 @@ final wrongQuestionsQuizProvider =
       .where((g) => wrongGrammarIds.contains(g.id))
       .toList();
 
-  // 生成题目
+  // 生成题目（干扰项从全部单词的干扰项池中取，不局限于错题单词）
   final vocabQuestions = generator.generateVocabularyQuestions(
     wrongWords,
     count: wrongWords.length.clamp(0, 10),
+    distractors: distractors,
   );
   final grammarQuestions = generator.generateGrammarQuestions(
     wrongGrammar,
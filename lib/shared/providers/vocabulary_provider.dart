@@ -3,30 +3,135 @@ import 'package:flutter/foundation.dart';
 import 'package:flutter/services.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import '../models/word.dart';
+import '../models/word_taxonomy.dart';
+import '../../core/database/content_database.dart';
 import '../../core/database/learning_record_repository.dart';
 import '../../core/database/learning_statistics_repository.dart';
 import 'statistics_provider.dart';
 
 // 词汇服务（单次加载，缓存结果）
+//
+// 词汇只从预建的内容库读取（assets/bundle/content.db），按等级、类别查询
+// 走库中的索引，搜索走全文索引；库不可用时视为加载失败。
 class VocabularyService {
   List<Word>? _cachedWords;
 
   Future<List<Word>> loadWords() async {
-    // 优化：使用缓存避免重复解析 JSON
     if (_cachedWords != null) return _cachedWords!;
 
+    final fromDatabase = await ContentDatabase.instance.words();
+    if (fromDatabase == null) {
+      debugPrint('Error loading words: content database unavailable');
+      return [];
+    }
+    return _cachedWords = fromDatabase;
+  }
+
+  // 已查询过的等级、类别
+  final Map<String, List<Word>> _cachedSelections = {};
+
+  // 分类表（等级、类别的编码和成员列表）
+  WordTaxonomy? _taxonomy;
+
+  Future<WordTaxonomy?> loadTaxonomy() async {
+    if (_taxonomy != null) return _taxonomy;
     try {
-      final String jsonString = await rootBundle.loadString('assets/data/sample_words.json');
-      final List<dynamic> jsonData = json.decode(jsonString);
-      _cachedWords = jsonData.map((json) => Word.fromJson(json)).toList();
-      return _cachedWords!;
+      return _taxonomy = WordTaxonomy.fromJson(json.decode(
+        await rootBundle.loadString('assets/bundle/words/taxonomy.json'),
+      ) as Map<String, dynamic>);
     } catch (e) {
-      debugPrint('Error loading words: $e');
+      debugPrint('Error loading word taxonomy: $e');
+      return null;
+    }
+  }
+
+  Future<List<Word>> loadWordsByLevel(String level) {
+    return _select('levels', level, (word) => word.level == level,
+        (taxonomy) => taxonomy.level(level),
+        () => ContentDatabase.instance.words(level: level));
+  }
+
+  Future<List<Word>> loadWordsByCategory(String category) {
+    return _select('categories', category, (word) => word.category == category,
+        (taxonomy) => taxonomy.category(category),
+        () => ContentDatabase.instance.words(category: category));
+  }
+
+  Future<List<Word>> _select(
+    String kind,
+    String key,
+    bool Function(Word) test,
+    TaxonomyEntry? Function(WordTaxonomy) entry,
+    Future<List<Word>?> Function() query,
+  ) async {
+    final cacheKey = '$kind/$key';
+    final cached = _cachedSelections[cacheKey];
+    if (cached != null) return cached;
+
+    // 完整词库已加载时按分类表的成员列表直接取词（与词库同序时），无需再查库
+    if (_cachedWords != null) {
+      final words = _cachedWords!;
+      final taxonomy = await loadTaxonomy();
+      if (taxonomy != null && taxonomy.ids.length == words.length) {
+        final members = entry(taxonomy)?.members ?? const <int>[];
+        return _cachedSelections[cacheKey] = [for (final i in members) words[i]];
+      }
+      return _cachedSelections[cacheKey] = words.where(test).toList();
+    }
+
+    final fromDatabase = await query();
+    if (fromDatabase == null) {
+      debugPrint('Error loading words $cacheKey: content database unavailable');
       return [];
     }
+    return _cachedSelections[cacheKey] = fromDatabase;
+  }
+
+  /// 用内容库的全文索引查出匹配的单词ID；库不可用时返回 null，由调用方逐个匹配
+  ///
+  /// 意大利语/英语按词前缀匹配（不区分大小写和重音），汉字按字匹配，
+  /// 查询中的多个词、多个字需要同时匹配。
+  Future<Set<String>?> searchWordIds(String query) {
+    return ContentDatabase.instance.searchWordIds(_latinTokens(query), _hanChars(query));
+  }
+
+  /// 测验干扰项池（assets/bundle/words/distractors.json，由 italiano_content 生成）
+  ///
+  /// 单词ID → 干扰项单词ID列表，按合适程度从高到低排列；不可用时返回 null，
+  /// 出题时退回随机挑选。
+  Future<Map<String, List<String>>?> loadDistractorPools() async {
+    try {
+      final data = json.decode(
+        await rootBundle.loadString('assets/bundle/words/distractors.json'),
+      ) as Map<String, dynamic>;
+      return data.map((id, pool) => MapEntry(id, (pool as List<dynamic>).cast<String>()));
+    } catch (e) {
+      debugPrint('Error loading distractor pools: $e');
+      return null;
+    }
   }
 }
 
+// 与 italiano_content/tokens.py、内容库全文索引相同的分词规则
+const _accents = {
+  'à': 'a', 'á': 'a', 'â': 'a', 'ä': 'a', 'è': 'e', 'é': 'e', 'ê': 'e', 'ë': 'e',
+  'ì': 'i', 'í': 'i', 'î': 'i', 'ï': 'i', 'ò': 'o', 'ó': 'o', 'ô': 'o', 'ö': 'o',
+  'ù': 'u', 'ú': 'u', 'û': 'u', 'ü': 'u', 'ç': 'c', 'ñ': 'n',
+};
+final _latinToken = RegExp(r'[0-9a-z]+');
+final _letterOrDigit = RegExp(r'[\p{L}\p{N}]', unicode: true);
+
+String _fold(String text) =>
+    text.toLowerCase().split('').map((c) => _accents[c] ?? c).join();
+
+List<String> _latinTokens(String text) =>
+    _latinToken.allMatches(_fold(text)).map((m) => m.group(0)!).toList();
+
+List<String> _hanChars(String text) => text.runes
+    .map(String.fromCharCode)
+    .where((c) => c.codeUnitAt(0) > 0x7F && _letterOrDigit.hasMatch(c) && _fold(c).codeUnitAt(0) > 0x7F)
+    .toList();
+
 // Provider for vocabulary service
 final vocabularyServiceProvider = Provider<VocabularyService>((ref) {
   return VocabularyService();
@@ -38,16 +143,28 @@ final allWordsProvider = FutureProvider<List<Word>>((ref) async {
   return service.loadWords();
 });
 
-// Provider for words by level（优化：从缓存的 allWords 过滤）
+// Provider for words by level（优化：按等级编码的索引查询）
 final wordsByLevelProvider = FutureProvider.family<List<Word>, String>((ref, level) async {
-  final allWords = await ref.watch(allWordsProvider.future);
-  return allWords.where((word) => word.level == level).toList();
+  final service = ref.watch(vocabularyServiceProvider);
+  return service.loadWordsByLevel(level);
 });
 
-// Provider for words by category（优化：从缓存的 allWords 过滤）
+// Provider for the word taxonomy（类别按编码排列，含各类别的成员列表）
+final wordTaxonomyProvider = FutureProvider<WordTaxonomy?>((ref) async {
+  final service = ref.watch(vocabularyServiceProvider);
+  return service.loadTaxonomy();
+});
+
+// Provider for words by category（优化：按类别编码的索引查询）
 final wordsByCategoryProvider = FutureProvider.family<List<Word>, String>((ref, category) async {
-  final allWords = await ref.watch(allWordsProvider.future);
-  return allWords.where((word) => word.category == category).toList();
+  final service = ref.watch(vocabularyServiceProvider);
+  return service.loadWordsByCategory(category);
+});
+
+// 搜索匹配的单词ID（优化：查全文索引，不逐个扫描单词）
+final wordSearchProvider = FutureProvider.family<Set<String>?, String>((ref, query) async {
+  final service = ref.watch(vocabularyServiceProvider);
+  return service.searchWordIds(query);
 });
 
 // Repository provider
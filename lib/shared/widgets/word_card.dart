@@ -268,24 +268,23 @@ class _WordCardState extends State<WordCard> with SingleTickerProviderStateMixin
               ),
               const SizedBox(height: 16),
               ...widget.word.examples.map((example) {
-                final parts = example.split(' - ');
                 return Padding(
                   padding: const EdgeInsets.only(bottom: 12),
                   child: Column(
                     crossAxisAlignment: CrossAxisAlignment.start,
                     children: [
                       Text(
-                        parts[0],
+                        example.italian,
                         style: TextStyle(
                           color: colorScheme.onSurface,
                           fontSize: 16,
                           fontStyle: FontStyle.italic,
                         ),
                       ),
-                      if (parts.length > 1) ...[
+                      if (example.chinese.isNotEmpty) ...[
                         const SizedBox(height: 4),
                         Text(
-                          parts[1],
+                          example.chinese,
                           style: TextStyle(
                             color: colorScheme.onSurface.withValues(alpha: 0.6),
                             fontSize: 14,
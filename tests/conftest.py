@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+测试共用的夹具：资源文件复制到临时目录后再构建、改写，不动仓库中的文件
+"""
+
+import shutil
+
+import pytest
+
+from italiano_content.assets import ASSETS, DATA_DIR
+from italiano_content.ids import LEDGER_PATH
+
+
+def copy_assets(target):
+    target.mkdir(parents=True, exist_ok=True)
+    for asset in ASSETS.values():
+        shutil.copyfile(asset.path(DATA_DIR), asset.path(target))
+    return target
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """五个资源文件的副本"""
+    return copy_assets(tmp_path / "data")
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def derived_dir(tmp_path):
+    """只给工具用的派生输出目录"""
+    return tmp_path / "derived"
+
+
+@pytest.fixture
+def ledger_path(tmp_path):
+    """ID 台账的副本"""
+    path = tmp_path / "id_ledger.json"
+    shutil.copyfile(LEDGER_PATH, path)
+    return path
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import importlib
+import shutil
+
+from italiano_content.assets import ASSETS
+from italiano_content.build import build
+from italiano_content import inflection
+from italiano_content.inflection import CACHE_FILE
+from italiano_content.links import CONTEXTS_FILE
+from italiano_content.manifest import Manifest
+from italiano_content.reproducible import check_reproducible, digest_tree
+from italiano_content.sources import load_batches
+
+from .conftest import copy_assets
+
+# italiano_content.build 同时是包中导出的函数名，按模块名取模块
+build_module = importlib.import_module('italiano_content.build')
+
+# a1_basic 批次中的一条词汇
+EDITED_ID = "1220"
+
+
+def edited_batches(only=None):
+    """把 EDITED_ID 的中文释义改掉的批次，模拟修改了批次源文件"""
+    batches = load_batches(only)
+    for batch in batches:
+        original = batch.records
+
+        def records(exclude=(), original=original):
+            for record in original(exclude):
+                if record['id'] == EDITED_ID:
+                    record = dict(record, chinese="测试释义")
+                yield record
+
+        batch.records = records
+    return batches
+
+
+def test_build_is_idempotent(data_dir, cache_dir, derived_dir):
+    before = digest_tree(data_dir)
+    report, _ = build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    assert all(not stats['added'] and not stats['updated'] for stats in report.values())
+    assets = {asset.filename for asset in ASSETS.values()}
+    after = digest_tree(data_dir)
+    assert {path: digest for path, digest in after.items() if path in assets} == before
+    # 只给工具用的输出不写进资源目录
+    assert (derived_dir / CONTEXTS_FILE).exists() and CONTEXTS_FILE not in after
+    # 词形变化缓存跟随 cache_dir，不写进仓库的 .content_cache
+    assert (cache_dir / CACHE_FILE).exists()
+
+    report, stage_report = build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    assert all(stats['mode'] == 'skip' for stats in report.values())
+    assert all(stats['skipped'] for stats in stage_report)
+    assert digest_tree(data_dir) == after
+
+
+def test_incremental_build_matches_full_build(tmp_path, data_dir, cache_dir, derived_dir, monkeypatch):
+    build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    monkeypatch.setattr(build_module, 'load_batches', edited_batches)
+
+    report, _ = build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    assert report['words']['mode'] == 'incremental'
+    assert report['words']['updated'] == 1
+    assert report['words']['emitted'] == 1
+
+    full_dir = copy_assets(tmp_path / "full")
+    build(full_dir, full=True, cache_dir=tmp_path / "full_cache", deterministic=True,
+          derived_dir=tmp_path / "full_derived")
+    words = ASSETS['words']
+    assert words.read_text(data_dir) == words.read_text(full_dir)
+    assert any(word['chinese'] == "测试释义" for word in words.load(data_dir) if word['id'] == EDITED_ID)
+
+
+def test_repro(data_dir):
+    _, differing = check_reproducible(data_dir, 1700000000)
+    assert differing == []
+
+
+def test_removed_stage_outputs_are_deleted(data_dir, cache_dir, derived_dir):
+    build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    manifest = Manifest.load(cache_dir)
+    stale = derived_dir / "words" / "old" / "A1.json"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("[]", encoding='utf-8')
+    manifest.stages['old'] = {'inputs': '', 'outputs': ["words/old/A1.json"]}
+    manifest.save()
+
+    _, stage_report = build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    assert {'name': 'old', 'removed': ["words/old/A1.json"]}.items() <= stage_report[0].items()
+    assert not stale.parent.exists()
+    assert 'old' not in Manifest.load(cache_dir).stages
+
+
+def test_code_change_rebuilds_outputs(tmp_path, data_dir, cache_dir, derived_dir, monkeypatch):
+    build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    # 改动词形变化规则：用到它的计算字段和阶段重新生成，其余跳过
+    source = tmp_path / "inflection.py"
+    shutil.copyfile(inflection.__file__, source)
+    with open(source, 'a', encoding='utf-8') as f:
+        f.write("\n# 规则改动\n")
+    monkeypatch.setattr(inflection, '__file__', str(source))
+
+    report, stage_report = build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    assert {name for name, stats in report.items() if stats['mode'] != 'skip'} == {'words', 'passages'}
+    rendered = {stats['name'] for stats in stage_report if not stats['skipped']}
+    assert rendered == {'contexts', 'content_db'}
+    assert all(not stats['updated'] for stats in report.values())
+
+
+def test_merged_words_keep_batch_updates(data_dir, cache_dir, derived_dir, monkeypatch):
+    monkeypatch.setattr(build_module, 'load_batches', edited_batches)
+    # EDITED_ID 是去重保留的记录：批次的修改照常应用
+    monkeypatch.setattr(build_module, 'load_aliases', lambda: {"9999": EDITED_ID})
+    report, _ = build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    assert report['words']['updated'] == 1
+
+    # 被合并掉的ID不再由批次加回或更新
+    monkeypatch.setattr(build_module, 'load_aliases', lambda: {EDITED_ID: "9999"})
+    words = [word for word in ASSETS['words'].load(data_dir) if word['id'] != EDITED_ID]
+    ASSETS['words'].write_text(build_module.render_document(ASSETS['words'], words)[0], data_dir)
+    build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    assert all(word['id'] != EDITED_ID for word in ASSETS['words'].load(data_dir))
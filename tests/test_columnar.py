@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from italiano_content.assets import ASSETS
+from italiano_content.columnar import compress, decode, encode
+
+
+def test_roundtrip_keeps_records_and_key_order(data_dir):
+    words = ASSETS['words'].load(data_dir)
+    decoded = decode(encode(words))
+    assert decoded == words
+    assert [list(word) for word in decoded] == [list(word) for word in words]
+
+
+def test_roundtrip_irregular_records():
+    records = [
+        {"id": "1", "italian": "casa", "examples": ["Casa mia. - 我的家。", {"italian": "a", "chinese": "b"}]},
+        {"italian": "ciao", "id": "2", "english": None, "examples": []},
+        {"id": "3", "category": "日常用语", "level": "A1", "extra": {"k": [1, 2]}},
+    ]
+    assert decode(encode(records)) == records
+
+
+def test_gzip_roundtrip(data_dir):
+    words = ASSETS['words'].load(data_dir)
+    blob = encode(words)
+    packed = compress(blob, 'gzip')
+    assert len(packed) < len(blob)
+    assert decode(packed) == words
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        decode(b"not a columnar file")
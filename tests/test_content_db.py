@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import json
+import sqlite3
+
+from italiano_content.assets import ASSETS
+from italiano_content.content_db import DB_FILE, PHRASES, GRAMMAR, PASSAGES, render_content_db
+from italiano_content.validate import SCHEMAS
+
+
+def table_records(connection, table):
+    """与应用 ContentDatabase.records 相同：按 fields 表把行还原成记录"""
+    fields = connection.execute(
+        "SELECT column_name, field, kind FROM fields WHERE table_name = ?", (table,)).fetchall()
+    cursor = connection.execute(f"SELECT * FROM {table} ORDER BY position")
+    columns = [description[0] for description in cursor.description]
+    records = []
+    for row in cursor:
+        values = dict(zip(columns, row))
+        record = {}
+        for column, field, kind in fields:
+            value = values[column]
+            if value is None:
+                continue
+            record[field] = json.loads(value) if kind == 'json' else value == 1 if kind == 'bool' else value
+        records.append(record)
+    return records
+
+
+def test_records_roundtrip(tmp_path, data_dir):
+    docs = {name: ASSETS[name].records(ASSETS[name].load(data_dir)) for name in ASSETS}
+    # 现有数据没有设置这些可选字段，改几条记录覆盖它们
+    docs['passages'][0] = dict(docs['passages'][0], audioUrl="assets/audio/reading/test.mp3")
+    docs['grammar'][0] = dict(docs['grammar'][0], imageUrl="assets/images/grammar/test.png")
+    path = tmp_path / DB_FILE
+    path.write_bytes(render_content_db(docs)[DB_FILE])
+    connection = sqlite3.connect(path)
+    try:
+        for table in (PHRASES, GRAMMAR, PASSAGES):
+            expected = [{key: value for key, value in record.items() if value is not None}
+                        for record in docs[table.asset]]
+            assert table_records(connection, table.name) == expected
+    finally:
+        connection.close()
+
+
+def test_tables_cover_schemas():
+    """应用只从内容库读这几个资源：校验中声明的字段都要有对应的列"""
+    for table in (PHRASES, GRAMMAR, PASSAGES):
+        fields = {field for _, field, _ in table.columns}
+        assert set(SCHEMAS[table.asset]) - {'__checks__'} <= fields, table.name
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import json
+
+from italiano_content.assets import ASSETS
+from italiano_content.dedup import find_duplicates, headword_key, lemma_key
+from italiano_content.dictionary import ingest
+
+WORDS = [
+    {"id": "1", "italian": "il sole", "chinese": "太阳", "english": "sun", "level": "A1"},
+    {"id": "2", "italian": "l'acqua", "chinese": "水", "english": "water", "level": "A1"},
+    {"id": "3", "italian": "una volta", "chinese": "一次", "english": "once", "level": "A2"},
+]
+
+ENTRIES = [
+    {"word": "sole", "pos": "noun", "rank": 300, "senses": [{"glosses": ["sun"]}]},
+    {"word": "acqua", "pos": "noun", "rank": 200, "senses": [{"glosses": ["water"]}]},
+    {"word": "luna", "pos": "noun", "rank": 900, "senses": [{"glosses": ["moon"]}]},
+    {"word": "lune", "pos": "noun", "rank": 950, "senses": [{"glosses": ["plural of luna"], "tags": ["form-of"]}]},
+    {"word": "sole", "pos": "adj", "rank": 300, "senses": [{"glosses": ["alone"]}], "lang_code": "it"},
+]
+
+
+def test_headword_key_strips_leading_article():
+    assert headword_key("il sole") == headword_key("Sole") == "sole"
+    assert headword_key("L’acqua") == headword_key("acqua") == "acqua"
+    assert headword_key("un'amica") == "amica"
+    # 单独的冠词不是冠词 + 词头
+    assert headword_key("la") == "la"
+    assert lemma_key({"italian": "Lo zaino"}) == "zaino"
+
+
+def test_dedup_matches_across_articles():
+    words = [{"id": "1", "italian": "il sole", "chinese": "太阳", "english": "sun"},
+             {"id": "2", "italian": "sole", "chinese": "太阳", "english": "sun"}]
+    assert find_duplicates(words) == [("sole", [[0, 1]])]
+
+
+def test_ingest_skips_headwords_with_articles(tmp_path, data_dir):
+    ASSETS['words'].path(data_dir).write_text(json.dumps(WORDS, ensure_ascii=False), encoding='utf-8')
+    dump = tmp_path / "dump.jsonl"
+    dump.write_text("".join(json.dumps(entry) + "\n" for entry in ENTRIES), encoding='utf-8')
+
+    report = ingest(dump, data_dir=data_dir, out_dir=tmp_path / "out")
+    assert report.entries == 4
+    assert report.repeated == 1
+    assert report.levels['A1'] == [2, 1]
+    (path, count), = report.batches
+    assert count == 1
+    rows = path.read_text(encoding='utf-8').splitlines()
+    assert rows[1].split('\t')[0] == "luna"
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from italiano_content.batch import Batch
+from italiano_content.ids import Ledger, find_collisions, locked, reserve
+
+
+def test_reserve_hands_out_consecutive_ranges(ledger_path):
+    sequence = Ledger.load(ledger_path).sequences['words']
+    first, last, start = reserve('words', 'test_batch', 3, ledger_path)
+    assert start == sequence.next
+    assert (first, last) == (sequence.format(start), sequence.format(start + 2))
+    ledger = Ledger.load(ledger_path)
+    assert ledger.sequences['words'].next == start + 3
+    assert ledger.sequences['words'].owner(start + 1) == 'test_batch'
+
+    _, _, second = reserve('words', 'test_batch_2', 2, ledger_path)
+    assert second == start + 3
+
+
+def test_reserve_rejects_bad_requests(ledger_path):
+    ledger = Ledger.load(ledger_path)
+    with pytest.raises(ValueError):
+        ledger.reserve('nope', 'x', 1)
+    with pytest.raises(ValueError):
+        ledger.reserve('words', 'x', 0)
+    other = next(name for name in ledger.sequences if name != 'words')
+    ledger.reserve('words', 'x', 1)
+    with pytest.raises(ValueError):
+        ledger.reserve(other, 'x', 1)
+
+
+def test_batches_number_from_their_range(ledger_path):
+    ledger = Ledger.load(ledger_path)
+    start, _ = ledger.reserve('words', 'test_batch', 2)
+    batch = Batch('test_batch', 'words', [('g', {}, [{'italian': 'a'}, {'italian': 'b'}])])
+    ledger.bind(batch)
+    ids = [record['id'] for record in batch.records()]
+    assert ids == [ledger.sequences['words'].format(start + k) for k in range(2)]
+    ledger.check(batch, ids)
+    with pytest.raises(ValueError):
+        ledger.check(batch, ids + [ledger.sequences['words'].format(start + 2)])
+
+
+def test_find_collisions(ledger_path):
+    ledger = Ledger.load(ledger_path)
+    problems = find_collisions({'words': ['1', '1'], 'phrases': ['1']}, ledger)
+    assert any("重复" in problem for problem in problems)
+    assert any("同时出现" in problem for problem in problems)
+
+
+def test_lock_times_out_while_held(ledger_path):
+    with locked(ledger_path):
+        with pytest.raises(ValueError):
+            with locked(ledger_path, timeout=0.1):
+                pass
+    with locked(ledger_path) as ledger:
+        assert 'words' in ledger.sequences
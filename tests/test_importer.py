@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from italiano_content.assets import ASSETS
+from italiano_content.ids import Ledger
+from italiano_content.importer import import_words, map_columns
+from italiano_content.validate import validate_all
+
+TABLE = """italiano,中文,english,类别,等级,例句,备注
+lampone,覆盆子,raspberry,食物餐饮,a2,Mangio un lampone. - 我吃一个覆盆子。|Il lampone è rosso. - 覆盆子是红色的。,x
+ciao,你好,hello,日常用语,A1,,
+mirtillo,,blueberry,食物餐饮,A2,,
+ribes,醋栗,currant,水果,A2,,
+
+castagna,栗子,chestnut,,,,
+"""
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = tmp_path / "frutti.csv"
+    path.write_text(TABLE, encoding='utf-8')
+    return path
+
+
+def test_map_columns():
+    mapping, ignored = map_columns(["Italiano", "释义", "IPA", "foo"])
+    assert mapping == {0: 'italian', 1: 'chinese', 2: 'pronunciation'}
+    assert ignored == ["foo"]
+    with pytest.raises(ValueError):
+        map_columns(["english"])
+    with pytest.raises(ValueError):
+        map_columns(["italian", "word", "chinese"])
+
+
+def test_dry_run_reports_without_writing(data_dir, ledger_path, table):
+    before = ASSETS['words'].read_text(data_dir)
+    report = import_words(table, data_dir, category="食物餐饮", level="A2", ledger_path=ledger_path)
+    assert (report.rows, report.imported) == (5, 2)
+    assert len(report.duplicates) == 1 and "ciao" in report.duplicates[0]
+    assert len(report.invalid) == 2
+    assert report.ignored == ["备注"]
+    assert not report.written
+    assert ASSETS['words'].read_text(data_dir) == before
+
+
+def test_write_appends_records_and_reserves_ids(data_dir, ledger_path, table):
+    count = len(ASSETS['words'].load(data_dir))
+    start = Ledger.load(ledger_path).sequences['words'].next
+    report = import_words(table, data_dir, write=True, category="食物餐饮", level="A2", ledger_path=ledger_path)
+    assert report.written and report.total == count + 2
+
+    words = ASSETS['words'].load(data_dir)
+    lampone, castagna = words[-2:]
+    assert (lampone['id'], castagna['id']) == (str(start), str(start + 1))
+    assert lampone['level'] == "A2" and castagna['category'] == "食物餐饮"
+    assert lampone['pronunciation'] and lampone['examples'][0]['chinese'] == "我吃一个覆盆子。"
+    assert lampone['audioUrl'] == f"assets/audio/words/{start}.mp3"
+    assert Ledger.load(ledger_path).sequences['words'].ranges["import_frutti"] == [[start, start + 1]]
+    assert all(not errors for _, _, errors in validate_all(data_dir, ['words']))
+
+    with pytest.raises(ValueError):
+        import_words(table, data_dir, write=True, ledger_path=ledger_path)
+
+
+def test_yaml_rows(tmp_path, data_dir, ledger_path):
+    path = tmp_path / "words.yaml"
+    path.write_text("- italian: lampone\n  chinese: 覆盆子\n  level: A2\n  category: 食物餐饮\n"
+                    "  examples: ['Mangio un lampone. - 我吃一个覆盆子。']\n", encoding='utf-8')
+    pytest.importorskip("yaml")
+    report = import_words(path, data_dir, ledger_path=ledger_path)
+    assert report.imported == 1 and not report.invalid
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from italiano_content.inflection import adjective_forms, conjugate, inflect, inflection_forms, plural
+
+
+def test_regular_conjugation():
+    assert conjugate("parlare") == ["parlo", "parli", "parla", "parliamo", "parlate", "parlano"]
+    assert "capisco" in conjugate("capire")
+    assert {"cerchi", "cerchiamo"} <= set(conjugate("cercare"))
+    assert {"mangi", "mangiamo"} <= set(conjugate("mangiare"))
+
+
+def test_irregular_and_compound_verbs():
+    assert "sono" in conjugate("essere")
+    assert "compongo" in conjugate("comporre")
+    assert "produco" in conjugate("produrre")
+
+
+def test_plurals():
+    assert "amici" in plural("amico")
+    assert plural("amica") == ["amiche"]
+    assert "case" in plural("casa")
+    assert plural("libro") == ["libri"]
+
+
+def test_adjective_forms():
+    assert adjective_forms("rosso") == ["rossa", "rossi", "rosse", "rossi"]
+    assert adjective_forms("verde") == ["verdi"]
+
+
+def test_inflect_word_records():
+    assert inflect({'italian': "il libro", 'english': "book", 'category': "工作学习"}) == ["libri"]
+    assert "mangiamo" in inflect({'italian': "mangiare", 'english': "to eat"})
+    assert "rossa" in inflect({'italian': "rosso", 'english': "red", 'category': "颜色"})
+    # 重音结尾、辅音结尾和多词短语不变化
+    assert inflect({'italian': "città", 'english': "city"}) == []
+    assert inflect({'italian': "autobus", 'english': "bus"}) == []
+    assert inflect({'italian': "fare colazione", 'english': "to have breakfast"}) == []
+
+
+def test_inflection_cache(tmp_path):
+    words = [{'id': "1", 'italian': "libro", 'english': "book"}]
+    assert inflection_forms(words, tmp_path) == {"1": ["libri"]}
+    assert (tmp_path / "inflections.json").exists()
+    words[0]['italian'] = "gatto"
+    assert inflection_forms(words, tmp_path) == {"1": ["gatti"]}
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from italiano_content.phonetics import canonical, compare, pronunciation_fields, stress_lexicon, transcribe
+
+
+@pytest.mark.parametrize("word, ipa", [
+    ("nero", "ˈneːro"),
+    ("bianco", "ˈbjaŋko"),
+    ("città", "tʃitˈta"),
+    ("azione", "atˈtsjoːne"),
+    ("famiglia", "faˈmiʎʎa"),
+    ("scena", "ˈʃeːna"),
+    ("gli", "ʎi"),
+    ("euro", "ˈeuro"),
+    ("baita", "ˈbaita"),
+    ("aereo", "aˈeːreo"),
+])
+def test_transcribe_rules(word, ipa):
+    assert transcribe(word) == ipa
+
+
+def test_output_styles():
+    assert transcribe("nero", style="bracket") == "[ˈneːro]"
+    assert transcribe("bianco", style="respelling") == "BYAN-ko"
+    assert transcribe("l'acqua") == "ˈlakkwa"
+
+
+def test_stress_hint_from_existing_value():
+    # 重音不在倒数第二个音节的词要靠已有注音中的重音符号
+    assert transcribe("camera", "ˈkamera") == "ˈkaːmera"
+    assert transcribe("farmacia", "farmaˈtʃia") == "farmaˈtʃiːa"
+
+
+def test_diphthong_hints():
+    # 二合元音是一个音节，提示的重音可以落在词尾的二合元音上
+    assert transcribe("euro", "ˈɛuro") == "ˈɛuro"
+    assert transcribe("vorrei", "vorˈrɛi") == "vorˈrɛi"
+    assert transcribe("vorrei", "[vorˈrɛi]", style="bracket") == "[vorˈrɛi]"
+    # 提示中分开读的元音按两个音节
+    assert transcribe("paura", "paˈura") == "paˈuːra"
+    # 重音符号放错位置的提示不把重音移到词尾的单元音上
+    assert transcribe("famiglia", "fa.miˈʎa") == "faˈmiʎʎa"
+
+
+def test_open_vowel_does_not_imply_stress():
+    # 没有标重音时不按开口音的位置推断重音
+    assert transcribe("poltrona", "pɔltrona") == "polˈtroːna"
+
+
+def test_compare():
+    assert compare(None, "ˈneːro") == "missing"
+    assert compare("ˈneːro", "ˈneːro") == "same"
+    assert compare("ˈnero", "ˈneːro") == "format"
+    assert compare("ˈɡatto", "ˈgatto") == "format"
+    assert compare("ˈkaːza", "ˈkaːsa") == "different"
+    # 没有标重音的注音无法核对重音
+    assert compare("sabato", "saˈbaːto") == "different"
+    assert compare("blu", "blu") == "same"
+
+
+def test_canonical_only_fills_missing_values():
+    assert canonical("nero", None) == ("ˈneːro", "missing")
+    assert canonical("nero", "ˈnero") == ("ˈnero", "format")
+    assert canonical("sabato", "sabato") == ("sabato", "different")
+    assert pronunciation_fields({'italian': "camera", 'pronunciation': "kamɛra"}) == {'pronunciation': "kamɛra"}
+    assert pronunciation_fields({'italian': "nero"}) == {'pronunciation': "ˈneːro"}
+
+
+def test_stress_lexicon_supplies_tokens():
+    lexicon = stress_lexicon([{'italian': "il tavolo", 'pronunciation': "il ˈtavolo"}])
+    assert transcribe("tavolo", style="bracket", lexicon=lexicon) == "[ˈtaːvolo]"
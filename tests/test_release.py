@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import re
+from pathlib import PurePosixPath
+
+from italiano_content.assets import ASSETS, BUNDLE_PREFIX, ROOT
+from italiano_content.build import build
+from italiano_content.content_db import DB_FILE
+from italiano_content.glosses import PACKED_FILE
+from italiano_content.links import CONTEXTS_FILE
+from italiano_content.manifest import Manifest
+from italiano_content.release import SUPERSEDED, emit_release, size_report
+from italiano_content.stages import STAGES
+
+
+def bundled_dirs():
+    """pubspec.yaml 登记的资源目录（Flutter 只打包目录下一层的文件）"""
+    text = (ROOT / "pubspec.yaml").read_text(encoding='utf-8')
+    return set(re.findall(r'^\s*- (assets/\S+/)$', text, re.M))
+
+
+def test_release_is_bundled(data_dir, cache_dir, derived_dir, tmp_path):
+    build(data_dir, cache_dir=cache_dir, deterministic=True, derived_dir=derived_dir)
+    out_dir = tmp_path / "bundle"
+    report = emit_release(Manifest.load(cache_dir), out_dir, derived_dir=derived_dir)
+    dirs = bundled_dirs()
+    paths = [path for _, path, _, _ in report]
+    assert CONTEXTS_FILE not in paths and PACKED_FILE in paths and DB_FILE in paths
+    for _, path, _, written in report:
+        assert written
+        assert str(PurePosixPath(BUNDLE_PREFIX + path).parent) + '/' in dirs, path
+        assert (out_dir / path).read_bytes() == (derived_dir / path).read_bytes()
+
+    # 每个资源在应用中只有一个来源：打包的是代替它的派生文件，不是资源文件本身
+    bundled = {stage.name for stage in STAGES if stage.bundled}
+    for asset in ASSETS.values():
+        assert SUPERSEDED[asset.name] in bundled
+        assert not (out_dir / asset.filename).exists()
+
+    # 体积报告与代替的开发格式资源对比
+    rows = {stage: (replaced, dev_size) for stage, _, replaced, dev_size in size_report(report, data_dir)}
+    conversations = ASSETS['conversations']
+    assert rows['glosses'] == ([conversations.filename], conversations.path(data_dir).stat().st_size)
+
+    # 再输出一次没有变化
+    again = emit_release(Manifest.load(cache_dir), out_dir, derived_dir=derived_dir)
+    assert not any(written for *_, written in again)
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+import json
+
+from italiano_content.assets import ASSETS
+from italiano_content.render import render_document, render_value
+
+
+def test_number_arrays_are_inline():
+    value = {"italian": "Ciao [a]", "blank": [0, 4], "nested": [[1, 2], ["x", 3]], "empty": []}
+    text = render_value(value)
+    assert '"blank": [0, 4]' in text
+    assert '    [1, 2],' in text
+    assert '"x",\n' in text
+    assert json.loads(text) == value
+
+
+def test_documents_roundtrip(data_dir):
+    for asset in ASSETS.values():
+        doc = asset.load(data_dir)
+        text, spans = render_document(asset, doc)
+        assert json.loads(text) == doc
+        assert [json.loads(text[start:end]) for start, end in spans] == asset.records(doc)
+        # 资源文件本身就是这样渲染的
+        assert text == asset.read_text(data_dir)
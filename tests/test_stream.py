@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from italiano_content.assets import ASSETS
+from italiano_content.stream import RecordReader, RecordWriter, iter_records
+
+
+@pytest.mark.parametrize("name", list(ASSETS))
+def test_reader_matches_json_load(data_dir, name):
+    asset = ASSETS[name]
+    doc = asset.load(data_dir)
+    reader = RecordReader(asset.path(data_dir), asset.records_key, chunk_size=257)
+    assert list(reader) == asset.records(doc)
+    if asset.records_key is not None:
+        rest = {key: value for key, value in doc.items() if key != asset.records_key}
+        assert {**reader.head, **reader.tail} == rest
+
+
+@pytest.mark.parametrize("name", list(ASSETS))
+def test_writer_is_byte_identical(tmp_path, data_dir, name):
+    asset = ASSETS[name]
+    reader = RecordReader(asset.path(data_dir), asset.records_key)
+    records = list(reader)
+    path = tmp_path / asset.filename
+    with RecordWriter(path, asset.records_key, reader.head, reader.tail) as writer:
+        for record in records:
+            writer.write(record)
+    assert writer.count == len(records)
+    assert path.read_text(encoding='utf-8') == asset.read_text(data_dir)
+
+
+def test_reader_handles_escapes_and_nesting(tmp_path):
+    records = [{"text": 'a "quoted" \\ [x] {y}', "nested": [[1, 2], {"k": None}]}, {"text": "é\n"}]
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps({"before": 1, "items": records, "after": [True]}), encoding='utf-8')
+    reader = RecordReader(path, "items", chunk_size=3)
+    assert list(reader) == records
+    assert reader.head == {"before": 1}
+    assert reader.tail == {"after": [True]}
+
+
+def test_reader_rejects_truncated_file(tmp_path):
+    path = tmp_path / "doc.json"
+    path.write_text('[{"id": "1"}, {"id": ', encoding='utf-8')
+    with pytest.raises(ValueError):
+        list(RecordReader(path))
+
+
+def test_writer_keeps_target_on_error(tmp_path, data_dir):
+    asset = ASSETS['words']
+    before = asset.read_text(data_dir)
+    with pytest.raises(RuntimeError):
+        with RecordWriter(asset.path(data_dir), asset.records_key) as writer:
+            for record in iter_records(asset, data_dir):
+                writer.write(record)
+                raise RuntimeError("中断")
+    assert asset.read_text(data_dir) == before
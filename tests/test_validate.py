@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from italiano_content.assets import ASSETS
+from italiano_content.build import build
+from italiano_content.validate import validate_all, validate_document, validate_records
+
+
+def write_words(data_dir, words):
+    ASSETS['words'].path(data_dir).write_text(json.dumps(words, ensure_ascii=False), encoding='utf-8')
+
+
+def test_assets_are_valid(data_dir):
+    for name, count, errors in validate_all(data_dir):
+        assert errors == [], name
+        assert count > 0
+
+
+def test_reports_malformed_records(data_dir):
+    words = ASSETS['words'].load(data_dir)
+    del words[0]['chinese']
+    words[1]['level'] = "Z9"
+    words[2]['examples'] = "不是数组"
+    words[3]['id'] = words[4]['id']
+    write_words(data_dir, words)
+    (_, count, errors), = validate_all(data_dir, ['words'])
+    assert count == len(words)
+    text = "\n".join(errors)
+    assert "sample_words.json[0]" in text and "chinese" in text
+    assert "sample_words.json[1]" in text and "Z9" in text
+    assert "sample_words.json[2]" in text
+    assert "重复" in text
+
+
+def test_reports_duplicate_message_ids(data_dir):
+    doc = ASSETS['conversations'].load(data_dir)
+    conversations = doc['conversations']
+    conversations[1]['messages'][0]['id'] = conversations[0]['messages'][0]['id']
+    errors = validate_document(ASSETS['conversations'], doc)
+    assert len(errors) == 1
+    assert "messages[0]" in errors[0] and "重复" in errors[0]
+
+
+@pytest.mark.parametrize("blank", [[0], [3, 2], [0, 99], [-1, 2], [0, 1, 2], [0.0, 1]])
+def test_reports_invalid_blank(blank):
+    word = {'id': "1", 'italian': "ciao", 'chinese': "你好", 'english': "hi", 'pronunciation': "ˈtʃaːo",
+            'category': "日常用语", 'level': "A1",
+            'examples': [{'italian': "Ciao!", 'chinese': "你好！", 'blank': blank}]}
+    errors = validate_records(ASSETS['words'], [word])
+    assert any("blank" in error for error in errors)
+    word['examples'][0]['blank'] = [0, 4]
+    assert validate_records(ASSETS['words'], [word]) == []
+
+
+def test_reports_records_that_are_not_objects():
+    errors = validate_records(ASSETS['words'], ["ciao", None])
+    assert len(errors) == 2
+    assert all("记录应为对象" in error for error in errors)
+
+
+def test_reports_invalid_json(data_dir):
+    ASSETS['phrases'].path(data_dir).write_text('{"phrases": [{"id": "1",, }]}', encoding='utf-8')
+    (_, count, errors), = validate_all(data_dir, ['phrases'])
+    assert count == 0
+    assert "JSON 解析失败" in errors[0]
+
+
+def test_reports_truncated_file(data_dir):
+    ASSETS['phrases'].path(data_dir).write_text('{"phrases": [', encoding='utf-8')
+    (_, count, errors), = validate_all(data_dir, ['phrases'])
+    assert count == 0
+    assert len(errors) == 1
+
+
+def test_reports_wrong_document_shape(data_dir):
+    # 顶层结构不对时报告错误，而不是在取记录时抛出 TypeError/KeyError
+    ASSETS['conversations'].path(data_dir).write_text('[]', encoding='utf-8')
+    phrases = ASSETS['phrases'].load(data_dir)
+    del phrases['phrases']
+    ASSETS['phrases'].path(data_dir).write_text(json.dumps(phrases, ensure_ascii=False), encoding='utf-8')
+    ASSETS['words'].path(data_dir).write_text('{"words": []}', encoding='utf-8')
+    results = {name: (count, errors) for name, count, errors in validate_all(data_dir)}
+    for name in ('conversations', 'phrases', 'words'):
+        count, errors = results[name]
+        assert count == 0 and len(errors) == 1, name
+        assert "顶层应为" in errors[0]
+    assert results['grammar'][1] == []
+
+
+def test_validate_document_checks_shape_first():
+    assert validate_document(ASSETS['conversations'], []) == [
+        "daily_conversations.json: 顶层应为对象，记录数组在 conversations 键下"]
+    assert validate_document(ASSETS['phrases'], {"total_count": 0})
+    assert validate_document(ASSETS['words'], {"words": []}) == ["sample_words.json: 顶层应为记录数组"]
+
+
+def test_summary_fields_are_checked(data_dir):
+    phrases = ASSETS['phrases'].load(data_dir)
+    phrases['total_count'] += 1
+    ASSETS['phrases'].path(data_dir).write_text(json.dumps(phrases, ensure_ascii=False), encoding='utf-8')
+    (_, count, errors), = validate_all(data_dir, ['phrases'])
+    assert count == len(phrases['phrases'])
+    assert any("total_count" in error for error in errors)
+
+
+def test_build_rejects_wrong_document_shape(data_dir, cache_dir, derived_dir):
+    ASSETS['words'].path(data_dir).write_text('{"words": []}', encoding='utf-8')
+    with pytest.raises(ValueError, match="顶层应为"):
+        build(data_dir, only={'a1_basic'}, full=True, cache_dir=cache_dir, derived_dir=derived_dir)